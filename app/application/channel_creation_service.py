@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 if TYPE_CHECKING:  # typing only
     from app.domain.channel_name import ChannelName
@@ -9,19 +9,50 @@ except Exception:  # pragma: no cover - type hint only
     ChannelName = object  # type: ignore
 
 
+# conversations.invite accepts at most 1000 users per call
+INVITE_BATCH_SIZE = 1000
+
+
 class ChannelCreationService:
     """Create a private channel and invite users via SlackClient facade.
 
+    Invites are sent in batches of `INVITE_BATCH_SIZE`, so member lists
+    expanded from user groups or channels can exceed one call's limit.
+    With an `outbound` scheduler both writes run in its invite class (behind
+    pending view updates); without one they are called directly.
     Exceptions are not caught here; UI layer is responsible for user-facing messages.
     """
 
-    def __init__(self, slack_api):
+    def __init__(self, slack_api, outbound=None):
         self._api = slack_api
+        self._outbound = outbound
+
+    def _write(self, fn, **kwargs):
+        if self._outbound is None:
+            return fn(**kwargs)
+        from app.infrastructure.outbound_scheduler import INVITES
+
+        return self._outbound.call(INVITES, fn, **kwargs)
 
     def create_private_channel(self, name: Union[str, "ChannelName"], user_ids: List[str]) -> str:
-        channel_name = name.value if hasattr(name, "value") else name
-        resp = self._api.create_channel(name=channel_name, is_private=True)
-        channel_id = resp["channel"]["id"]
-        if user_ids:
-            self._api.invite_users(channel_id=channel_id, user_ids=user_ids)
+        channel_id = self.create_channel(name)
+        self.invite(channel_id, user_ids)
         return channel_id
+
+    def create_channel(self, name: Union[str, "ChannelName"]) -> str:
+        """Create the private channel only; returns its ID."""
+        channel_name = name.value if hasattr(name, "value") else name
+        resp = self._write(self._api.create_channel, name=channel_name, is_private=True)
+        return resp["channel"]["id"]
+
+    def invite(
+        self, channel_id: str, user_ids: List[str], invited: Optional[List[str]] = None
+    ) -> List[str]:
+        """Invite in batches; each accepted batch is appended to `invited` as it succeeds,
+        so a caller still knows who was invited when a later batch raises."""
+        invited = [] if invited is None else invited
+        for start in range(0, len(user_ids), INVITE_BATCH_SIZE):
+            batch = user_ids[start : start + INVITE_BATCH_SIZE]
+            self._write(self._api.invite_users, channel_id=channel_id, user_ids=batch)
+            invited.extend(batch)
+        return invited
@@ -0,0 +1,123 @@
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+from app.infrastructure.slack_client import is_transient_error
+
+logger = logging.getLogger(__name__)
+
+
+class MemberSourceAPIProtocol(Protocol):
+    def list_usergroups(self) -> Dict[str, Any]: ...
+
+    def list_usergroup_users(self, usergroup: str) -> Dict[str, Any]: ...
+
+    def list_conversation_members(
+        self, channel: str, cursor: Optional[str] = None, limit: int = 200
+    ) -> Dict[str, Any]: ...
+
+
+def split_usergroup_handles(entries: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """Separate `@handle` entries from email addresses: (emails, handles without '@')."""
+    emails: List[str] = []
+    handles: List[str] = []
+    for entry in entries:
+        if entry.startswith("@") and len(entry) > 1:
+            handles.append(entry[1:])
+        else:
+            emails.append(entry)
+    return emails, handles
+
+
+class MemberExpansion:
+    """Result of expanding member sources."""
+
+    def __init__(self, user_ids: List[str], unresolved: List[str], truncated: bool):
+        self.user_ids = user_ids
+        self.unresolved = unresolved
+        self.truncated = truncated
+
+
+class MemberSourceExpander:
+    """Expand @usergroup handles and existing channels into user IDs.
+
+    Channel members are fetched page by page (`conversations.members`) and
+    streamed into one insertion-ordered set, so duplicates across sources
+    collapse as they arrive and fetching stops at the first new ID beyond
+    `max_members` (only then is the result `truncated`). `is_member` (e.g.
+    the team directory) filters out bots and deactivated accounts when
+    available. Sources Slack cannot expand (unknown handle, channel the bot
+    cannot read) are reported in `unresolved` as `@handle` / `<#C…>`;
+    transient errors are raised.
+    """
+
+    def __init__(
+        self,
+        slack_api: MemberSourceAPIProtocol,
+        max_members: int = 1000,
+        page_size: int = 200,
+        is_member: Optional[Callable[[str], bool]] = None,
+    ):
+        self._api = slack_api
+        self.max_members = max_members
+        self.page_size = page_size
+        self._is_member = is_member
+
+    def expand(self, handles: Sequence[str], channel_ids: Sequence[str]) -> MemberExpansion:
+        collected: Dict[str, None] = {}
+        unresolved: List[str] = []
+        sources: List[Tuple[str, Callable[[], Iterator[List[str]]]]] = []
+        if handles:
+            groups = self._usergroup_ids()
+            for handle in handles:
+                group_id = groups.get(handle.lower())
+                if group_id is None:
+                    unresolved.append(f"@{handle}")
+                else:
+                    sources.append((f"@{handle}", lambda g=group_id: self._usergroup_pages(g)))
+        for channel_id in channel_ids:
+            sources.append((f"<#{channel_id}>", lambda c=channel_id: self._channel_pages(c)))
+
+        truncated = False
+        for label, pages in sources:
+            try:
+                truncated = self._collect(pages(), collected)
+            except Exception as e:
+                if is_transient_error(e):
+                    raise
+                logger.info("member source not expanded: %s (%s)", label, e)
+                unresolved.append(label)
+            if truncated:
+                break
+        return MemberExpansion(list(collected), unresolved, truncated)
+
+    def _collect(self, pages: Iterator[List[str]], collected: Dict[str, None]) -> bool:
+        """Add page IDs to `collected`; True when a new ID is left out by the cap
+        (remaining pages unread)."""
+        for page in pages:
+            for user_id in page:
+                if user_id in collected:
+                    continue
+                if self._is_member is not None and not self._is_member(user_id):
+                    continue
+                if len(collected) >= self.max_members:
+                    return True
+                collected[user_id] = None
+        return False
+
+    def _usergroup_ids(self) -> Dict[str, str]:
+        resp = self._api.list_usergroups()
+        return {g["handle"].lower(): g["id"] for g in resp.get("usergroups") or []}
+
+    def _usergroup_pages(self, group_id: str) -> Iterator[List[str]]:
+        yield list(self._api.list_usergroup_users(usergroup=group_id).get("users") or [])
+
+    def _channel_pages(self, channel_id: str) -> Iterator[List[str]]:
+        cursor: Optional[str] = None
+        while True:
+            resp = self._api.list_conversation_members(
+                channel=channel_id, cursor=cursor, limit=self.page_size
+            )
+            yield list(resp.get("members") or [])
+            cursor = (resp.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return
@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from app.domain.resolved_user import ResolvedUser
+
+# Sentinel result for addresses Slack reported as unknown / deactivated
+NOT_FOUND: ResolvedUser = ResolvedUser("", "")
+
+
+class UserLookupCache:
+    """Bounded LRU of email -> resolved user, one instance per team.
+
+    Hits are kept for `ttl` seconds, definitive misses (unknown or
+    deactivated user) for the shorter `negative_ttl` so new members show
+    up quickly. Being per team, a busy workspace only evicts its own entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 5000,
+        ttl: float = 600.0,
+        negative_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, Tuple[float, ResolvedUser]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, email: str) -> Optional[ResolvedUser]:
+        """Cached user, NOT_FOUND, or None when not cached / expired."""
+        with self._lock:
+            item = self._items.get(email)
+            if item is None or item[0] < self._clock():
+                if item is not None:
+                    del self._items[email]
+                self.misses += 1
+                return None
+            self._items.move_to_end(email)
+            self.hits += 1
+            return item[1]
+
+    def put(self, email: str, user: Optional[ResolvedUser]) -> None:
+        ttl = self.ttl if user is not None else self.negative_ttl
+        with self._lock:
+            self._items[email] = (self._clock() + ttl, NOT_FOUND if user is None else user)
+            self._items.move_to_end(email)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
@@ -1,4 +1,20 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Protocol, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from app.application.user_lookup_cache import NOT_FOUND, UserLookupCache
+from app.domain.email_address_validator import EmailAddressValidator
+from app.domain.resolved_user import ResolvedUser
+from app.infrastructure.slack_client import is_transient_error
 
 if TYPE_CHECKING:  # for typing only
     from app.domain.email_address_list import EmailAddressList
@@ -8,43 +24,102 @@ class SlackAPIProtocol(Protocol):
     def lookup_user_by_email(self, email: str) -> Dict[str, Any]: ...
 
 
+class UserSourceProtocol(Protocol):
+    def lookup(self, email: str) -> Optional[ResolvedUser]: ...
+
+
 class UserResolverService:
     """Resolve Slack users by emails using a SlackClient-like facade.
 
     The facade must expose `lookup_user_by_email(email)`.
     This service returns (user_info_list, not_found_emails) and leaves
     policy (e.g., raising exceptions) to the wrapper for compatibility.
+
+    Entries rejected by the validator (bad syntax / disallowed domain) are
+    reported as not found without calling the Slack API. Transient Slack
+    failures (after the facade's retries) are raised, not reported as not found.
+    With a `cache`, found users and definitive misses are reused across calls.
+    Users are returned as immutable `ResolvedUser` records (dict-compatible).
+    A `memo` (email -> user, or None when not found) carries results of a
+    previous submission: listed addresses are reused without a lookup and
+    new results are written back, so a resubmit only resolves what changed.
+    A `directory` (the team's member list, possibly a startup snapshot) is
+    consulted after the cache; only its misses reach the Slack API, since a
+    new member may not be in it yet.
     """
 
-    def __init__(self, slack_api: SlackAPIProtocol):
+    def __init__(
+        self,
+        slack_api: SlackAPIProtocol,
+        validator: Optional[EmailAddressValidator] = None,
+        cache: Optional[UserLookupCache] = None,
+    ):
         self._api = slack_api
+        self._validator = validator or EmailAddressValidator()
+        self._cache = cache
 
-    @staticmethod
-    def _extract_display_name(user_data):
-        return user_data.get("profile", {}).get("display_name", "") or user_data["id"]
+    def _process_email(
+        self, email: str, directory: Optional[UserSourceProtocol] = None
+    ) -> Tuple[ResolvedUser | None, str | None]:
+        if self._cache is not None:
+            cached = self._cache.get(email)
+            if cached is not None:
+                return (None, email) if cached is NOT_FOUND else (cached, None)
+        if directory is not None:
+            known = directory.lookup(email)
+            if known is not None:
+                return known, None
+        return self._lookup_remote(email)
 
-    def _process_email(self, email: str) -> Tuple[Dict[str, str] | None, str | None]:
+    def _lookup_remote(self, email: str) -> Tuple[ResolvedUser | None, str | None]:
         try:
             response = self._api.lookup_user_by_email(email=email)
             if response.get("ok") and not response["user"].get("deleted", False):
-                user = response["user"]
-                display_name = self._extract_display_name(user)
-                return {"id": user["id"], "display_name": display_name}, None
+                # keep only the two fields; the full API payload is not retained
+                info = ResolvedUser.from_api(response["user"])
+                if self._cache is not None:
+                    self._cache.put(email, info)
+                return info, None
+            if self._cache is not None:
+                self._cache.put(email, None)
             return None, email
-        except Exception:
+        except Exception as e:
+            if is_transient_error(e):
+                raise
+            response = getattr(e, "response", None)
+            error = response.get("error") if hasattr(response, "get") else None
+            if self._cache is not None and error == "users_not_found":
+                self._cache.put(email, None)
             return None, email
 
     def resolve(
-        self, email_list: Union["EmailAddressList", Sequence[str]]
-    ) -> Tuple[List[dict], List[str]]:
+        self,
+        email_list: Union["EmailAddressList", Sequence[str]],
+        memo: Optional[MutableMapping[str, Optional[ResolvedUser]]] = None,
+        directory: Optional[UserSourceProtocol] = None,
+    ) -> Tuple[List[ResolvedUser], List[str]]:
         # Accept EmailAddressList or plain sequence[str]
         emails: Sequence[str] = getattr(email_list, "values", email_list)
 
-        users: List[dict] = []
+        users: List[ResolvedUser] = []
         not_found: List[str] = []
+        seen: set[str] = set()
 
-        for email in emails:
-            info, nf = self._process_email(email)
+        for entry in emails:
+            email = self._validator.check(entry)
+            if email is None:
+                not_found.append(entry)
+                continue
+            if email in seen:
+                continue
+            seen.add(email)
+            if memo is not None and email in memo:
+                info = memo[email]
+                nf = None if info is not None else email
+            else:
+                info, nf = self._process_email(email, directory)
+                if memo is not None:
+                    memo[email] = info
             if info:
                 users.append(info)
             if nf:
@@ -0,0 +1,140 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Protocol, Tuple
+
+from app.domain.email_suggester import EmailSuggester
+from app.domain.resolved_user import ResolvedUser
+from app.domain.user_directory import UserDirectory
+from app.domain.user_search_index import UserSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class UserListAPIProtocol(Protocol):
+    def list_users(self, cursor: Optional[str] = None, limit: int = 200) -> Dict[str, Any]: ...
+
+
+def _spawn(target: Callable[[], None]) -> None:
+    threading.Thread(target=target, name="directory-refresh", daemon=True).start()
+
+
+def iter_members(slack_api: UserListAPIProtocol, page_size: int = 200) -> Iterator[Dict[str, Any]]:
+    """Active human members from `users.list`, page by page."""
+    cursor: Optional[str] = None
+    while True:
+        resp = slack_api.list_users(cursor=cursor, limit=page_size)
+        for member in resp.get("members") or []:
+            if member.get("deleted") or member.get("is_bot") or member.get("id") == "USLACKBOT":
+                continue
+            yield member
+        cursor = (resp.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            return
+
+
+def member_entry(member: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """(user_id, display_name, real_name, email) of a `users.list` member."""
+    profile = member.get("profile") or {}
+    return (
+        member["id"],
+        profile.get("display_name") or "",
+        profile.get("real_name") or member.get("real_name") or member.get("name") or "",
+        (profile.get("email") or "").lower(),
+    )
+
+
+class WorkspaceDirectory:
+    """Local copy of one team's member list: type-ahead search, email suggestions
+    and email -> user lookups.
+
+    The first `ensure_fresh()` loads it from `users.list` in the background;
+    afterwards it is reloaded once older than `refresh_interval`. Readers
+    always get the last complete index (swapped in one assignment), never
+    a partially loaded one, and never wait for a refresh.
+
+    `users` may start from a snapshot (e.g. memory-mapped at startup), so
+    `lookup()` answers before the first refresh; each refresh replaces it
+    with the current member list and hands it to `on_refresh` to persist.
+    """
+
+    def __init__(
+        self,
+        slack_api: UserListAPIProtocol,
+        refresh_interval: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+        spawn: Callable[[Callable[[], None]], None] = _spawn,
+        domain_aliases: Optional[Mapping[str, str]] = None,
+        users: Optional[UserDirectory] = None,
+        on_refresh: Optional[Callable[[UserDirectory], None]] = None,
+    ):
+        self._api = slack_api
+        self.domain_aliases = dict(domain_aliases or {})
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._spawn = spawn
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.loaded_at: Optional[float] = None
+        self.index = UserSearchIndex([])
+        self.suggester = EmailSuggester([], self.domain_aliases)
+        self.users = users if users is not None else UserDirectory.build([])
+        self._on_refresh = on_refresh
+
+    @property
+    def ready(self) -> bool:
+        return self.loaded_at is not None
+
+    def lookup(self, email: str) -> Optional[ResolvedUser]:
+        """The member with this email in the last loaded list (or snapshot), else None."""
+        return self.users.get(email)
+
+    def ensure_fresh(self) -> None:
+        """Start a background refresh when never loaded or stale (no-op if one is running)."""
+        now = self._clock()
+        if self.loaded_at is not None and now - self.loaded_at < self.refresh_interval:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        self._spawn(self._refresh_in_background)
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("workspace directory refresh failed")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh(self) -> None:
+        started = self._clock()
+        entries = [member_entry(m) for m in iter_members(self._api)]
+        index = UserSearchIndex(entries)
+        suggester = EmailSuggester(
+            (
+                (email, uid, display_name or real_name)
+                for uid, display_name, real_name, email in entries
+            ),
+            self.domain_aliases,
+        )
+        users = UserDirectory.build(
+            (email, uid, display_name or real_name)
+            for uid, display_name, real_name, email in entries
+            if email
+        )
+        self.index, self.suggester, self.users = index, suggester, users
+        self.loaded_at = self._clock()
+        logger.info(
+            "workspace directory loaded: %d members (%.1fs)",
+            len(index),
+            self.loaded_at - started,
+            extra={"event": "directory_loaded", "members": len(index)},
+        )
+        if self._on_refresh is not None:
+            try:
+                self._on_refresh(users)
+            except Exception:
+                logger.exception("workspace directory snapshot not saved")
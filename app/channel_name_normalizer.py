@@ -1,6 +1,13 @@
+from typing import Iterable, List
+
 from app.domain.channel_name import ChannelName
 
 
 def normalize_channel_name(name: str) -> str:
     """既存互換シグネチャを維持しつつ、VOで正規化を委譲"""
     return ChannelName.from_raw_string(name).value
+
+
+def normalize_channel_names(names: Iterable[str]) -> List[str]:
+    """一括正規化（補完・一括作成向け）。規則は normalize_channel_name と同一"""
+    return [cn.value for cn in ChannelName.from_raw_strings(names)]
@@ -1,5 +1,24 @@
 import re
 import unicodedata
+from functools import lru_cache
+from typing import Iterable, List
+
+_WHITESPACE = re.compile(r"\s+")
+_DISALLOWED = re.compile(r"[^a-z0-9_-]")
+_VALID = re.compile(r"[a-z0-9_-]*")
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize(name: str) -> str:
+    # Fast path: already a valid name (typical for re-submits / typeahead)
+    if _VALID.fullmatch(name):
+        return name
+    # NFKC never changes pure ASCII, so skip it there
+    s = name if name.isascii() else unicodedata.normalize("NFKC", name)
+    s = s.lower()
+    s = _WHITESPACE.sub("-", s)
+    return _DISALLOWED.sub("", s)
 
 
 class ChannelName:
@@ -11,6 +30,8 @@ class ChannelName:
     - collapse whitespace to single '-'
     - remove characters except [a-z0-9_-]
     - enforce max length 80
+
+    Normalization results are memoized (LRU) for repeated inputs.
     """
 
     def __init__(self, value: str):
@@ -20,16 +41,13 @@ class ChannelName:
 
     @classmethod
     def from_raw_string(cls, name: str) -> "ChannelName":
-        # Normalize wide chars
-        s = unicodedata.normalize("NFKC", name)
-        # Lowercase
-        s = s.lower()
-        # Collapse whitespace to '-'
-        s = re.sub(r"\s+", "-", s)
-        # Keep only allowed characters
-        s = re.sub(r"[^a-z0-9_-]", "", s)
         # Length check happens in ctor
-        return cls(s)
+        return cls(_normalize(name))
+
+    @classmethod
+    def from_raw_strings(cls, names: Iterable[str]) -> List["ChannelName"]:
+        """Batch variant of `from_raw_string` (raises on the first invalid name)."""
+        return [cls(_normalize(n)) for n in names]
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.value
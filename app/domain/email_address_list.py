@@ -17,12 +17,10 @@ class EmailAddressList:
     @classmethod
     def from_raw_string(cls, text: str) -> "EmailAddressList":
         parts = re.split(r"[,\n]", text)
-        parts = [p.strip().lower() for p in parts]
-        unique: List[str] = []
-        for p in parts:
-            if p and p not in unique:
-                unique.append(p)
-        return cls(unique)
+        # dict preserves insertion order: O(n) dedupe instead of list membership scans
+        unique = dict.fromkeys(p.strip().lower() for p in parts)
+        unique.pop("", None)
+        return cls(list(unique))
 
     def to_list(self) -> List[str]:  # pragma: no cover - alias
         return list(self.values)
@@ -0,0 +1,61 @@
+import re
+from typing import Iterable, Optional, Tuple
+
+# Addresses pasted from mail clients: `Name <a@b>`, `"Name" <a@b>`, `<a@b>`, `mailto:a@b`
+_ANGLE_ADDR = re.compile(r"<([^<>]*)>")
+_MAILTO = re.compile(r"^mailto:", re.IGNORECASE)
+# Pragmatic subset of RFC 5322 (no quoted local parts / IP literals), same as Slack accepts
+_EMAIL = re.compile(
+    r"^[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}$"
+)
+_STRIP_CHARS = " \t\"'<>;:,()[]"
+
+
+class EmailAddressValidator:
+    """Pre-validate email entries before any Slack lookup.
+
+    - extracts the address from common mail-client formats
+      (`Name <a@b>`, `<a@b>`, `mailto:a@b`, stray quotes / brackets)
+    - rejects entries that are not syntactically valid addresses
+    - optionally rejects domains outside `allowed_domains`
+      (subdomains of an allowed domain are accepted)
+
+    `check` returns the normalized address or None; callers report rejected
+    entries as given so the UI can show exactly what the user typed.
+    """
+
+    def __init__(self, allowed_domains: Optional[Iterable[str]] = None):
+        domains = [d.strip().lower().lstrip("@") for d in (allowed_domains or [])]
+        self.allowed_domains: Tuple[str, ...] = tuple(d for d in domains if d)
+
+    @classmethod
+    def from_csv(cls, text: Optional[str]) -> "EmailAddressValidator":
+        """Build from a comma separated domain list (e.g. env var value)."""
+        return cls((text or "").split(","))
+
+    @staticmethod
+    def extract(entry: str) -> str:
+        s = entry.strip()
+        m = _ANGLE_ADDR.search(s)
+        if m:
+            s = m.group(1)
+        s = _MAILTO.sub("", s.strip())
+        return s.strip(_STRIP_CHARS).lower()
+
+    @staticmethod
+    def is_valid_syntax(address: str) -> bool:
+        return len(address) <= 254 and _EMAIL.match(address) is not None
+
+    def is_allowed_domain(self, address: str) -> bool:
+        if not self.allowed_domains:
+            return True
+        domain = address.rsplit("@", 1)[-1]
+        return any(domain == d or domain.endswith("." + d) for d in self.allowed_domains)
+
+    def check(self, entry: str) -> Optional[str]:
+        """Return the normalized address, or None when the entry must be rejected."""
+        address = self.extract(entry)
+        if self.is_valid_syntax(address) and self.is_allowed_domain(address):
+            return address
+        return None
@@ -0,0 +1,120 @@
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from app.domain.resolved_user import ResolvedUser
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or `limit + 1` as soon as it must exceed `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _bigrams(word: str) -> List[str]:
+    padded = f"^{word}$"
+    return [padded[i : i + 2] for i in range(len(padded) - 1)]
+
+
+def parse_domain_aliases(spec: Optional[str]) -> Dict[str, str]:
+    """`old.example.com=example.com,ex.jp=example.jp` -> {alias: canonical}."""
+    aliases: Dict[str, str] = {}
+    for item in (spec or "").split(","):
+        alias, sep, canonical = item.partition("=")
+        if sep and alias.strip() and canonical.strip():
+            aliases[alias.strip().lower()] = canonical.strip().lower()
+    return aliases
+
+
+class EmailSuggester:
+    """ "Did you mean" candidates for addresses Slack did not find.
+
+    A miss is compared with the directory by edit distance on the local
+    part, restricted to its domain, the domain's configured alias, or a
+    known domain within two edits (a typo in the domain). Candidates come
+    from a bigram index over local parts: an address within k edits shares
+    all but at most 2k of the miss's bigrams, so only a handful of local
+    parts are compared with the full edit distance, even at 20k members.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, str, str]],
+        domain_aliases: Optional[Mapping[str, str]] = None,
+        max_distance: int = 2,
+    ):
+        """`entries` are (email, user_id, display_name)."""
+        self.max_distance = max_distance
+        self._aliases = dict(domain_aliases or {})
+        self._locals: List[str] = []
+        self._domains: List[str] = []
+        self._users: List[ResolvedUser] = []
+        self._by_address: Dict[str, int] = {}
+        self._grams: Dict[str, array] = {}
+        for email, user_id, display_name in entries:
+            address = email.strip().lower()
+            local, sep, domain = address.rpartition("@")
+            if not sep or not local or address in self._by_address:
+                continue
+            row = len(self._locals)
+            self._by_address[address] = row
+            self._locals.append(local)
+            self._domains.append(domain)
+            self._users.append(ResolvedUser(user_id, display_name or user_id))
+            for gram in set(_bigrams(local)):
+                self._grams.setdefault(gram, array("I")).append(row)
+        self._known_domains = set(self._domains)
+
+    def __len__(self) -> int:
+        return len(self._locals)
+
+    def _candidate_domains(self, domain: str) -> Dict[str, int]:
+        """Domain -> cost (0 for the domain itself or its alias, else its edit distance)."""
+        domains: Dict[str, int] = {}
+        if domain in self._aliases:
+            domains[self._aliases[domain]] = 0
+        for known in self._known_domains:
+            cost = 0 if known == domain else edit_distance(domain, known, 2)
+            if cost <= 2:
+                domains.setdefault(known, cost)
+        return domains
+
+    def _candidate_rows(self, local: str, k: int) -> Set[int]:
+        grams = set(_bigrams(local))
+        needed = max(1, len(grams) - 2 * k)
+        counts: Dict[int, int] = {}
+        for gram in grams:
+            for row in self._grams.get(gram, ()):
+                counts[row] = counts.get(row, 0) + 1
+        return {row for row, count in counts.items() if count >= needed}
+
+    def suggest(self, email: str, limit: int = 3) -> List[Tuple[str, ResolvedUser]]:
+        """Up to `limit` (address, user) pairs, closest first."""
+        address = email.strip().lower()
+        local, sep, domain = address.rpartition("@")
+        if not sep or not local:
+            return []
+        domains = self._candidate_domains(domain)
+        if not domains:
+            return []
+        k = self.max_distance if len(local) > 4 else min(1, self.max_distance)
+        scored: List[Tuple[int, str, int]] = []
+        for row in self._candidate_rows(local, k):
+            domain_cost = domains.get(self._domains[row])
+            if domain_cost is None:
+                continue
+            distance = edit_distance(local, self._locals[row], k)
+            candidate = f"{self._locals[row]}@{self._domains[row]}"
+            score = distance + domain_cost
+            if distance <= k and score <= self.max_distance + 1 and candidate != address:
+                scored.append((score, candidate, row))
+        scored.sort()
+        return [(candidate, self._users[row]) for _, candidate, row in scored[:limit]]
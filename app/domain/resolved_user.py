@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Iterator, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ResolvedUser:
+    """Compact, immutable Slack user resolved from an email (id + display name).
+
+    Read-only mapping compatible with the former `{"id", "display_name"}`
+    dicts: `user["id"]`, `user.get(...)`, `dict(user)` and equality against
+    such dicts all work.
+    """
+
+    id: str
+    display_name: str
+
+    _KEYS: ClassVar[Tuple[str, ...]] = ("id", "display_name")
+
+    @classmethod
+    def from_api(cls, user: Mapping[str, Any]) -> "ResolvedUser":
+        """From a `users.lookupByEmail` / `users.list` member object."""
+        display_name = (user.get("profile") or {}).get("display_name", "") or user["id"]
+        return cls(user["id"], display_name)
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, key) if key in self._KEYS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"id": self.id, "display_name": self.display_name}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResolvedUser):
+            return self.id == other.id and self.display_name == other.display_name
+        if isinstance(other, Mapping):
+            return dict(other) == self.to_dict()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.display_name))
@@ -0,0 +1,111 @@
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from app.domain.resolved_user import ResolvedUser
+
+Buffer = Union[bytes, memoryview]
+
+
+def _pack(values: Sequence[bytes]) -> Tuple[bytes, array]:
+    offsets = array("I", [0])
+    for v in values:
+        offsets.append(offsets[-1] + len(v))
+    return b"".join(values), offsets
+
+
+class UserDirectory:
+    """Read-only, columnar email -> user index for large workspaces.
+
+    Emails (lowercased, sorted by UTF-8 bytes), user ids and display names
+    are each stored as one UTF-8 blob plus a uint32 offset array, so a
+    row costs its string bytes plus 12 bytes of offsets instead of several
+    Python objects. Lookups are a binary search; `ResolvedUser` objects
+    are only created for hits. Columns may be any buffer (bytes, mmap /
+    memoryview), which lets a snapshot be mapped without copying.
+    """
+
+    __slots__ = ("_emails", "_email_offsets", "_ids", "_id_offsets", "_names", "_name_offsets")
+
+    def __init__(
+        self,
+        emails: Buffer,
+        email_offsets: Sequence[int],
+        ids: Buffer,
+        id_offsets: Sequence[int],
+        names: Buffer,
+        name_offsets: Sequence[int],
+    ):
+        self._emails = emails
+        self._email_offsets = email_offsets
+        self._ids = ids
+        self._id_offsets = id_offsets
+        self._names = names
+        self._name_offsets = name_offsets
+
+    @classmethod
+    def build(cls, records: Iterable[Tuple[str, str, str]]) -> "UserDirectory":
+        """From (email, user_id, display_name); the last record wins for a duplicate email."""
+        rows = {}
+        for email, user_id, display_name in records:
+            rows[email.strip().lower().encode("utf-8")] = (user_id, display_name)
+        keys = sorted(rows)
+        emails, email_offsets = _pack(keys)
+        ids, id_offsets = _pack([rows[k][0].encode("utf-8") for k in keys])
+        names, name_offsets = _pack([rows[k][1].encode("utf-8") for k in keys])
+        return cls(emails, email_offsets, ids, id_offsets, names, name_offsets)
+
+    def __len__(self) -> int:
+        return len(self._email_offsets) - 1
+
+    @staticmethod
+    def _cell(blob: Buffer, offsets: Sequence[int], row: int) -> bytes:
+        return bytes(blob[offsets[row] : offsets[row + 1]])
+
+    def _find(self, email: str) -> Optional[int]:
+        key = email.strip().lower().encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._cell(self._emails, self._email_offsets, mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self._cell(self._emails, self._email_offsets, lo) == key:
+            return lo
+        return None
+
+    def _user(self, row: int) -> ResolvedUser:
+        return ResolvedUser(
+            self._cell(self._ids, self._id_offsets, row).decode("utf-8"),
+            self._cell(self._names, self._name_offsets, row).decode("utf-8"),
+        )
+
+    def get(self, email: str) -> Optional[ResolvedUser]:
+        row = self._find(email)
+        return self._user(row) if row is not None else None
+
+    def __contains__(self, email: object) -> bool:
+        return isinstance(email, str) and self._find(email) is not None
+
+    def __iter__(self) -> Iterator[Tuple[str, ResolvedUser]]:
+        for row in range(len(self)):
+            email = self._cell(self._emails, self._email_offsets, row).decode("utf-8")
+            yield email, self._user(row)
+
+    def columns(self) -> Tuple[Buffer, Sequence[int], Buffer, Sequence[int], Buffer, Sequence[int]]:
+        """Raw columns (emails, offsets, ids, offsets, names, offsets) for serialization."""
+        return (
+            self._emails,
+            self._email_offsets,
+            self._ids,
+            self._id_offsets,
+            self._names,
+            self._name_offsets,
+        )
+
+    def nbytes(self) -> int:
+        """Approximate payload size: column bytes plus offset arrays."""
+        blobs = len(self._emails) + len(self._ids) + len(self._names)
+        return blobs + 4 * (
+            len(self._email_offsets) + len(self._id_offsets) + len(self._name_offsets)
+        )
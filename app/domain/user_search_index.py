@@ -0,0 +1,91 @@
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.domain.resolved_user import ResolvedUser
+
+_WORD_SPLIT = re.compile(r"[\s._\-@]+")
+
+
+def _trigrams(text: str) -> set:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class UserSearchIndex:
+    """Immutable type-ahead index over a workspace's members.
+
+    Matches a query against display names, real names and emails:
+    first as a prefix of any word (sorted term list + bisect), then, for
+    queries of 3+ characters, as a substring via a trigram posting index.
+    Built once per directory refresh; searching does no I/O.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str, str]]):
+        """`entries` are (user_id, display_name, real_name, email)."""
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._emails: List[str] = []
+        self._haystacks: List[str] = []
+        self._rows: Dict[str, int] = {}
+        pairs: List[Tuple[str, int]] = []
+        postings: Dict[str, array] = {}
+        for user_id, display_name, real_name, email in entries:
+            if user_id in self._rows:
+                continue
+            row = len(self._ids)
+            self._rows[user_id] = row
+            self._ids.append(user_id)
+            self._names.append(display_name or real_name or user_id)
+            self._emails.append(email or "")
+            haystack = " ".join(filter(None, (display_name, real_name, email))).lower()
+            self._haystacks.append(haystack)
+            terms = {t for t in _WORD_SPLIT.split(haystack) if t}
+            terms.update(s.lower() for s in (display_name, real_name, email) if s)
+            pairs.extend((term, row) for term in terms)
+            for gram in _trigrams(haystack):
+                postings.setdefault(gram, array("I")).append(row)
+        pairs.sort()
+        self._terms = [term for term, _ in pairs]
+        self._term_rows = array("I", (row for _, row in pairs))
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get(self, user_id: str) -> Optional[ResolvedUser]:
+        row = self._rows.get(user_id)
+        return None if row is None else ResolvedUser(user_id, self._names[row])
+
+    def label(self, row: int) -> str:
+        email = self._emails[row]
+        return f"{self._names[row]} ({email})" if email else self._names[row]
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, str]]:
+        """Up to `limit` (user_id, label) pairs; word-prefix matches come first."""
+        q = query.strip().lower()
+        if not q or limit <= 0:
+            return []
+        found: Dict[int, None] = {}
+        i = bisect_left(self._terms, q)
+        while i < len(self._terms) and self._terms[i].startswith(q) and len(found) < limit:
+            found.setdefault(self._term_rows[i])
+            i += 1
+        if len(found) < limit and len(q) >= 3:
+            for row in self._substring_rows(q):
+                found.setdefault(row)
+                if len(found) >= limit:
+                    break
+        return [(self._ids[row], self.label(row)) for row in found]
+
+    def _substring_rows(self, q: str) -> Iterable[int]:
+        # Scan the rarest trigram's postings (already in row order) and verify;
+        # the caller stops after `limit` hits, so common queries end early.
+        smallest: Sequence[int] = ()
+        for gram in _trigrams(q):
+            rows = self._postings.get(gram)
+            if rows is None:
+                return ()
+            if not smallest or len(rows) < len(smallest):
+                smallest = rows
+        return (row for row in smallest if q in self._haystacks[row])
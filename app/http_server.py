@@ -0,0 +1,152 @@
+"""HTTP (Request URL) モード: Bolt の WSGI アダプター＋ pre-fork マルチワーカー
+
+    python -m app.http_server --port 3000 --workers 4
+
+親プロセスがポートを bind してから fork し、各ワーカーが同じ listen ソケットで
+accept する（振り分けはカーネル）。ワーカーごとにスレッドプールで処理する。
+gunicorn 等を使う場合は `app.http_server:create_wsgi_app()` を WSGI アプリとして渡す。
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socketserver
+import tempfile
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from slack_bolt.adapter.wsgi import SlackRequestHandler
+
+from app.infrastructure import audit_log
+from app.infrastructure.startup import StartupReport
+from app.presentation.instrumentation import HandlerMetrics
+from app.presentation.lifecycle import Lifecycle
+from app.slack_app import create_app, run_until_signalled, setup_runtime
+
+logger = logging.getLogger(__name__)
+
+SLACK_PATH = "/slack/events"
+HEALTH_PATH = "/healthz"
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128  # listen backlog（親で bind した時点で確定）
+
+
+class _RequestHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        # アクセスログは stderr ではなく logging へ（DEBUG）
+        logger.debug(format, *args, extra={"event": "http_access"})
+
+
+def create_wsgi_app(
+    app=None, lifecycle: Lifecycle | None = None, metrics: HandlerMetrics | None = None
+):
+    """Slack イベント（POST /slack/events）＋ロードバランサー用ヘルスチェック
+
+    停止処理中（lifecycle.accepting が False）はヘルスチェックが 503 を返す。
+    """
+    if app is None:
+        if not os.environ.get("SLACK_SIGNING_SECRET"):
+            raise ValueError("SLACK_SIGNING_SECRET environment variable is required")
+        # 署名検証は Bolt の RequestVerification ミドルウェアが SLACK_SIGNING_SECRET で行う
+        app = create_app(metrics=metrics, lifecycle=lifecycle)
+    slack_handler = SlackRequestHandler(app, path=SLACK_PATH)
+
+    def wsgi_app(environ, start_response):
+        if environ.get("PATH_INFO") == HEALTH_PATH:
+            if lifecycle is not None and not lifecycle.accepting:
+                start_response("503 Service Unavailable", [("Content-Type", "text/plain")])
+                return [b"draining"]
+            start_response("200 OK", [("Content-Type", "text/plain; charset=utf-8")])
+            return [b"ok"]
+        return slack_handler(environ, start_response)
+
+    return wsgi_app
+
+
+def _serve_worker(server: WSGIServer, index: int) -> None:
+    """ワーカー: スレッド（ログ・メトリクス）は fork 後に起動する必要がある"""
+    log_listener = setup_runtime(metrics_port_offset=index)
+    startup = StartupReport()  # fork 後のワーカーはプロセス開始 = fork 時点
+    try:
+        lifecycle = Lifecycle()
+        metrics = HandlerMetrics()
+        metrics.on_first_ack = startup.first_ack
+        server.set_app(create_wsgi_app(lifecycle=lifecycle, metrics=metrics))
+        startup.mark("app_created")
+        # SIGTERM: accept を止め、実行中の処理をドレインしてから終了
+        run_until_signalled(
+            lambda: threading.Thread(target=server.serve_forever, daemon=True).start(),
+            server.shutdown,
+            lifecycle,
+            startup,
+        )
+    finally:
+        audit_log.close()
+        log_listener.stop()
+
+
+def run(host: str, port: int, workers: int) -> None:
+    server = make_server(
+        host, port, None, server_class=ThreadingWSGIServer, handler_class=_RequestHandler
+    )
+    print(f"⚡️ Slack app is running in HTTP mode on http://{host}:{port}{SLACK_PATH}")
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        _serve_worker(server, 0)
+        return
+
+    # プロセス内メモリは共有されないため、未設定なら SQLite で private_metadata を共有
+    if not os.environ.get("METADATA_STORE"):
+        path = os.path.join(tempfile.gettempdir(), f"channel-gen-metadata-{os.getpid()}.sqlite3")
+        os.environ["METADATA_STORE"] = f"sqlite:{path}"
+
+    # ワーカー数（プロセス内だけで効く操作、例: プロファイル切り替えコマンドの判定用）
+    os.environ["HTTP_WORKERS"] = str(workers)
+
+    children = []
+    for index in range(workers):
+        pid = os.fork()
+        if pid == 0:  # child
+            try:
+                _serve_worker(server, index)
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    def stop_children(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop_children)
+    signal.signal(signal.SIGINT, stop_children)
+    for pid in children:
+        os.waitpid(pid, 0)
+    server.server_close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Slack channel generator (HTTP mode)")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "3000")))
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
+    args = parser.parse_args(argv)
+
+    if not os.environ.get("SLACK_SIGNING_SECRET"):
+        raise ValueError("SLACK_SIGNING_SECRET environment variable is required")
+    # 複数ワークスペース（SLACK_CLIENT_ID）は /slack/install で導入、トークンはストアから取得
+    if not os.environ.get("SLACK_BOT_TOKEN") and not os.environ.get("SLACK_CLIENT_ID"):
+        raise ValueError("SLACK_BOT_TOKEN (or SLACK_CLIENT_ID) environment variable is required")
+    run(args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from app.infrastructure.metrics import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def parse_fsync_policy(spec: Optional[str]) -> Optional[float]:
+    """`always` -> 0.0 (every batch), `off` -> None, `<seconds>` -> at most once per interval."""
+    spec = (spec or "always").strip().lower()
+    if spec == "always":
+        return 0.0
+    if spec in ("off", "never", "none"):
+        return None
+    return float(spec)
+
+
+class AuditLog:
+    """Append-only JSONL audit trail written by one background thread.
+
+    `record()` only enqueues the dict (no serialization or I/O on the
+    caller's thread); when the bounded queue is full the record is dropped
+    and counted rather than blocking a Bolt handler. The writer drains
+    whatever is queued into one `write()` per batch, then fsyncs according
+    to `fsync_interval` (0 = every batch, None = never). The file is
+    rotated to `<path>.1` … `<path>.<backups>` before a batch would grow it
+    past `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+        fsync_interval: Optional[float] = 0.0,
+        max_queue: int = 10_000,
+        max_batch: int = 500,
+        registry: MetricsRegistry = REGISTRY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = max(1, backups)
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        self._clock = clock
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._size = 0
+        self._synced_at = 0.0
+        self._dirty = False
+        self._written = registry.counter("audit_records_total", "Audit records written")
+        self._dropped = registry.counter(
+            "audit_records_dropped_total", "Audit records lost (queue full or write error)"
+        )
+
+    @classmethod
+    def from_env(
+        cls, env: Optional[Mapping[str, str]] = None, worker: int = 0
+    ) -> Optional["AuditLog"]:
+        """`AUDIT_LOG=<path>` enables it; `{worker}` in the path separates HTTP workers."""
+        env = os.environ if env is None else env
+        path = env.get("AUDIT_LOG")
+        if not path:
+            return None
+        return cls(
+            path.replace("{worker}", str(worker)),
+            max_bytes=int(env.get("AUDIT_LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+            backups=int(env.get("AUDIT_LOG_BACKUPS", "5")),
+            fsync_interval=parse_fsync_policy(env.get("AUDIT_FSYNC")),
+        )
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """Queue one record; never blocks. `ts` (UTC, ISO 8601) is added here."""
+        entry = {"ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), **entry}
+        self._start()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._dropped.inc()
+            logger.warning("audit queue full; record dropped", extra={"event": "audit_dropped"})
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out everything queued, fsync and close the file."""
+        with self._lock:
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("audit log not drained in time", extra={"event": "audit_close_timeout"})
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="audit-log", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            item = self._wait_for_record()
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+        self._sync(force=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        with self._lock:
+            self._thread = None
+
+    def _wait_for_record(self) -> Any:
+        # With an fsync interval, wake up once it has passed so the tail is synced too
+        while True:
+            if not self._dirty or not self.fsync_interval:
+                return self._queue.get()
+            try:
+                return self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                self._sync()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        data = "".join(
+            json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in batch
+        ).encode("utf-8")
+        try:
+            self._open(len(data))
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+            self._dirty = True
+            self._sync()
+            self._written.inc(amount=len(batch))
+        except OSError:
+            self._dropped.inc(amount=len(batch))
+            logger.exception("audit records could not be written", extra={"event": "audit_error"})
+
+    def _open(self, incoming: int) -> None:
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "ab")
+            self._size = self._file.tell()
+        if self._size and self._size + incoming > self.max_bytes:
+            self._sync(force=True)
+            self._file.close()
+            self._file = None
+            self._rotate()
+            self._file = open(self.path, "ab")
+            self._size = 0
+
+    def _rotate(self) -> None:
+        for i in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _sync(self, force: bool = False) -> None:
+        if not self._dirty or self._file is None or self.fsync_interval is None and not force:
+            return
+        now = self._clock()
+        if force or now - self._synced_at >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._synced_at = now
+            self._dirty = False
+
+
+_log: Optional[AuditLog] = None
+
+
+def configure(log: Optional[AuditLog]) -> Optional[AuditLog]:
+    """Swap the process-wide audit log (None disables it); returns the previous one."""
+    global _log
+    previous, _log = _log, log
+    return previous
+
+
+def configure_from_env(worker: int = 0) -> Optional[AuditLog]:
+    log = AuditLog.from_env(worker=worker)
+    configure(log)
+    return log
+
+
+def record(entry: Dict[str, Any]) -> None:
+    """Queue an audit record if auditing is configured (no-op otherwise)."""
+    log = _log
+    if log is not None:
+        log.record(entry)
+
+
+def close(timeout: float = 5.0) -> None:
+    log = _log
+    if log is not None:
+        log.close(timeout)
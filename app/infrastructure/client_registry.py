@@ -0,0 +1,122 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from app.infrastructure.slack_client import SlackClient
+
+
+class WorkspaceClients:
+    """Long-lived objects shared by every interaction of one team."""
+
+    def __init__(
+        self,
+        web_client: Any,
+        slack_client: SlackClient,
+        user_resolver: Any,
+        directory: Any = None,
+        outbound: Any = None,
+    ):
+        self.web_client = web_client
+        self.slack_client = slack_client
+        self.user_resolver = user_resolver
+        self.directory = directory
+        self.outbound = outbound
+
+
+def _default_web_client_factory(token: Optional[str], template: Any) -> Any:
+    from slack_sdk import WebClient
+
+    # Bolt の per-request client と同じ接続設定を引き継いで 1 チーム 1 インスタンス
+    kwargs: Dict[str, Any] = {"token": token}
+    for attr in ("base_url", "timeout", "ssl", "proxy", "headers", "logger", "retry_handlers"):
+        if template is not None and hasattr(template, attr):
+            kwargs[attr] = getattr(template, attr)
+    if kwargs.get("retry_handlers") is not None:
+        kwargs["retry_handlers"] = list(kwargs["retry_handlers"])
+    return WebClient(**kwargs)
+
+
+def _default_user_resolver_factory(slack_client: SlackClient) -> Any:
+    from app.user_resolver import build_user_lookup_cache, build_user_resolver_service
+
+    # キャッシュもチームごと（他チームの利用で追い出されない）
+    return build_user_resolver_service(slack_client, cache=build_user_lookup_cache())
+
+
+def _default_directory_factory(slack_client: SlackClient, team: Optional[str] = None) -> Any:
+    from app.application.workspace_directory import WorkspaceDirectory
+    from app.domain.email_suggester import parse_domain_aliases
+    from app.infrastructure import directory_snapshot
+
+    # メンバー検索・候補提示用の名簿（users.list）。初回利用時にバックグラウンドで読み込む
+    # スナップショットがあれば起動直後からメール→ユーザーの解決に使い、更新のたびに保存し直す
+    snapshots = directory_snapshot.current()
+    return WorkspaceDirectory(
+        slack_client,
+        refresh_interval=float(os.environ.get("DIRECTORY_REFRESH_SECONDS", "3600")),
+        domain_aliases=parse_domain_aliases(os.environ.get("EMAIL_DOMAIN_ALIASES")),
+        users=snapshots.load(team) if snapshots and team else None,
+        on_refresh=(lambda users: snapshots.save(team, users)) if snapshots and team else None,
+    )
+
+
+def _default_outbound_factory(slack_client: SlackClient, team: str) -> Any:
+    from app.infrastructure.outbound_scheduler import OutboundScheduler
+
+    # 書き込み（モーダル更新 > 招待 > DM）の優先度付きキュー。ワーカーは初回利用時に起動
+    return OutboundScheduler.from_env(name=f"outbound-{team}", team=team)
+
+
+class SlackClientRegistry:
+    """Per-team registry of WebClient / SlackClient / UserResolverService / directory
+    / outbound write scheduler.
+
+    Bolt creates a fresh WebClient for every request; handlers get the
+    team's shared instances from here instead (via Bolt context injection),
+    so transport settings, caches and limiter state survive across requests.
+    The WebClient token is refreshed when the installation token rotates.
+    Entries are per team (or enterprise for org-wide installs), so each
+    workspace has its own retry / circuit-breaker state and user cache.
+    """
+
+    def __init__(
+        self,
+        web_client_factory: Callable[[Optional[str], Any], Any] = _default_web_client_factory,
+        slack_client_factory: Callable[[Any], SlackClient] = SlackClient,
+        user_resolver_factory: Callable[[SlackClient], Any] = _default_user_resolver_factory,
+        directory_factory: Callable[[SlackClient, str], Any] = _default_directory_factory,
+        outbound_factory: Callable[[SlackClient, str], Any] = _default_outbound_factory,
+    ):
+        self._web_client_factory = web_client_factory
+        self._slack_client_factory = slack_client_factory
+        self._user_resolver_factory = user_resolver_factory
+        self._directory_factory = directory_factory
+        self._outbound_factory = outbound_factory
+        self._entries: Dict[str, WorkspaceClients] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, team_id: Optional[str], token: Optional[str], template: Any = None
+    ) -> WorkspaceClients:
+        key = team_id or "_default"
+        entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    web = self._web_client_factory(token, template)
+                    sc = self._slack_client_factory(web)
+                    entry = WorkspaceClients(
+                        web,
+                        sc,
+                        self._user_resolver_factory(sc),
+                        self._directory_factory(sc, key),
+                        self._outbound_factory(sc, key),
+                    )
+                    self._entries[key] = entry
+        if token and getattr(entry.web_client, "token", token) != token:
+            entry.web_client.token = token
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,193 @@
+import logging
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from app.domain.user_directory import UserDirectory
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CGUDIR01"
+# magic, row count, then (offset, length) of the six column sections
+_HEADER = struct.Struct("<8sI4x" + "QQ" * 6)
+_ALIGN = 8
+_LITTLE = sys.byteorder == "little" and array("I").itemsize == 4
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _offsets_bytes(offsets: Sequence[int]) -> bytes:
+    packed = array("I", offsets)
+    if not _LITTLE:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _offsets_view(section: memoryview) -> Sequence[int]:
+    if _LITTLE:
+        return section.cast("I")
+    packed = array("I", bytes(section))
+    packed.byteswap()
+    return packed
+
+
+def write_snapshot(directory: UserDirectory, path: str) -> int:
+    """Write the directory's columns to `path` atomically; returns the file size.
+
+    Layout: header, then uint32 little-endian offset arrays and UTF-8 blobs
+    (email offsets, emails, id offsets, ids, name offsets, names), each
+    8-byte aligned so they can be used in place from a memory map.
+    """
+    emails, email_offsets, ids, id_offsets, names, name_offsets = directory.columns()
+    sections = [
+        _offsets_bytes(email_offsets),
+        bytes(emails),
+        _offsets_bytes(id_offsets),
+        bytes(ids),
+        _offsets_bytes(name_offsets),
+        bytes(names),
+    ]
+    positions = []
+    position = _align(_HEADER.size)
+    for section in sections:
+        positions.extend((position, len(section)))
+        position = _align(position + len(section))
+    header = _HEADER.pack(MAGIC, len(directory), *positions)
+
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        for start, section in zip(positions[::2], sections):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(section)
+        size = f.tell()
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return size
+
+
+def read_snapshot(path: str) -> UserDirectory:
+    """Memory-map a snapshot; columns are used in place (no copy, pages load on demand)."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if len(view) < _HEADER.size:
+        raise ValueError(f"truncated snapshot: {path}")
+    magic, rows, *positions = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"not a directory snapshot: {path}")
+    columns = []
+    for i, (start, length) in enumerate(zip(positions[::2], positions[1::2])):
+        if start + length > len(view):
+            raise ValueError(f"truncated snapshot: {path}")
+        section = view[start : start + length]
+        columns.append(_offsets_view(section) if i % 2 == 0 else section)
+    for offsets, blob in zip(columns[::2], columns[1::2]):
+        if len(offsets) != rows + 1 or offsets[-1] != len(blob):
+            raise ValueError(f"inconsistent snapshot: {path}")
+    email_offsets, emails, id_offsets, ids, name_offsets, names = columns
+    return UserDirectory(emails, email_offsets, ids, id_offsets, names, name_offsets)
+
+
+class SnapshotStore:
+    """One snapshot file per team under `root` (`<root>/<team>.udir`)."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._loaded: Dict[str, UserDirectory] = {}
+        self._lock = threading.Lock()
+
+    def path(self, team: str) -> str:
+        return os.path.join(self.root, re.sub(r"[^A-Za-z0-9_-]", "_", team) + ".udir")
+
+    def teams(self) -> List[str]:
+        """Teams with a snapshot file under `root`."""
+        if not os.path.isdir(self.root):
+            return []
+        return [
+            name[: -len(".udir")]
+            for name in sorted(os.listdir(self.root))
+            if name.endswith(".udir")
+        ]
+
+    def preload(self) -> int:
+        """Map every snapshot in `root` (at startup); returns the number of teams."""
+        if not os.path.isdir(self.root):
+            return 0
+        started = time.perf_counter()
+        rows = 0
+        for team in self.teams():
+            directory = self.load(team)
+            rows += len(directory) if directory is not None else 0
+        logger.info(
+            "directory snapshots mapped: %d teams, %d users (%.1f ms)",
+            len(self._loaded),
+            rows,
+            (time.perf_counter() - started) * 1000,
+            extra={"event": "directory_snapshot_loaded", "teams": len(self._loaded)},
+        )
+        return len(self._loaded)
+
+    def load(self, team: str) -> Optional[UserDirectory]:
+        """The team's snapshot, or None when missing or unreadable."""
+        with self._lock:
+            directory = self._loaded.get(team)
+        if directory is not None:
+            return directory
+        path = self.path(team)
+        if not os.path.exists(path):
+            return None
+        try:
+            directory = read_snapshot(path)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "directory snapshot ignored: %s", e, extra={"event": "directory_snapshot_invalid"}
+            )
+            return None
+        with self._lock:
+            return self._loaded.setdefault(team, directory)
+
+    def save(self, team: str, directory: UserDirectory) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        size = write_snapshot(directory, self.path(team))
+        with self._lock:
+            self._loaded.pop(team, None)
+        logger.info(
+            "directory snapshot saved: %d users, %d bytes",
+            len(directory),
+            size,
+            extra={"event": "directory_snapshot_saved", "members": len(directory)},
+        )
+
+
+_store: Optional[SnapshotStore] = None
+
+
+def configure(store: Optional[SnapshotStore]) -> Optional[SnapshotStore]:
+    """Swap the process-wide snapshot store (None disables snapshots); returns the previous one."""
+    global _store
+    previous, _store = _store, store
+    return previous
+
+
+def configure_from_env() -> Optional[SnapshotStore]:
+    """`DIRECTORY_SNAPSHOT_DIR=<dir>` enables snapshots and maps the existing ones."""
+    root = os.environ.get("DIRECTORY_SNAPSHOT_DIR")
+    store = SnapshotStore(root) if root else None
+    if store is not None:
+        store.preload()
+    configure(store)
+    return store
+
+
+def current() -> Optional[SnapshotStore]:
+    return _store
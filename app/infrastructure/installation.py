@@ -0,0 +1,92 @@
+import os
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Bot scopes used by the app (see README "OAuth & Permissions")
+DEFAULT_SCOPES = (
+    "commands,groups:write,chat:write,users:read,users:read.email,"
+    "usergroups:read,channels:read,groups:read"
+)
+
+_STATE_EXPIRATION_SECONDS = 600
+
+
+def build_stores(spec: str, client_id: str) -> Tuple[Any, Any]:
+    """(installation_store, state_store) from `file:<dir>` or `sqlite:<path>`."""
+    kind, _, location = spec.partition(":")
+    if kind == "sqlite":
+        from slack_sdk.oauth.installation_store.sqlite3 import SQLite3InstallationStore
+        from slack_sdk.oauth.state_store.sqlite3 import SQLite3OAuthStateStore
+
+        installation_store = SQLite3InstallationStore(database=location, client_id=client_id)
+        installation_store.init()
+        state_store = SQLite3OAuthStateStore(
+            database=location, expiration_seconds=_STATE_EXPIRATION_SECONDS
+        )
+        state_store.init()
+        return installation_store, state_store
+    if kind == "file":
+        from slack_sdk.oauth.installation_store import FileInstallationStore
+        from slack_sdk.oauth.state_store import FileOAuthStateStore
+
+        base = location or "data"
+        return (
+            FileInstallationStore(
+                base_dir=os.path.join(base, "installations"), client_id=client_id
+            ),
+            FileOAuthStateStore(
+                base_dir=os.path.join(base, "oauth_state"),
+                client_id=client_id,
+                expiration_seconds=_STATE_EXPIRATION_SECONDS,
+            ),
+        )
+    raise ValueError(f"unsupported INSTALLATION_STORE: {spec!r} (use file:<dir> or sqlite:<path>)")
+
+
+def app_settings(env: Mapping[str, str] = os.environ) -> Dict[str, Any]:
+    """Keyword arguments for `slack_bolt.App`.
+
+    Empty (single workspace, SLACK_BOT_TOKEN) unless SLACK_CLIENT_ID is set;
+    then OAuth is enabled and bot tokens are looked up per team from the
+    installation store (INSTALLATION_STORE, default `file:data`).
+    """
+    client_id = env.get("SLACK_CLIENT_ID")
+    if not client_id:
+        return {}
+    from slack_bolt.oauth.oauth_settings import OAuthSettings
+
+    installation_store, state_store = build_stores(
+        env.get("INSTALLATION_STORE", "file:data"), client_id
+    )
+    return {
+        "oauth_settings": OAuthSettings(
+            client_id=client_id,
+            client_secret=env.get("SLACK_CLIENT_SECRET"),
+            scopes=env.get("SLACK_SCOPES", DEFAULT_SCOPES),
+            installation_store=installation_store,
+            installation_store_bot_only=True,
+            state_store=state_store,
+        )
+    }
+
+
+def bot_token_for(team: str, env: Mapping[str, str] = os.environ) -> Optional[str]:
+    """Bot token for work started outside a request (e.g. at startup).
+
+    SLACK_BOT_TOKEN in single-workspace mode; otherwise the installation of
+    `team`, looked up as a workspace first and then as an org-wide install.
+    """
+    client_id = env.get("SLACK_CLIENT_ID")
+    if not client_id:
+        return env.get("SLACK_BOT_TOKEN")
+    installation_store, _ = build_stores(env.get("INSTALLATION_STORE", "file:data"), client_id)
+    bot = installation_store.find_bot(enterprise_id=None, team_id=team)
+    if bot is None:
+        bot = installation_store.find_bot(
+            enterprise_id=team, team_id=None, is_enterprise_install=True
+        )
+    return bot.bot_token if bot is not None else None
+
+
+def team_key(team_id: Optional[str], enterprise_id: Optional[str]) -> Optional[str]:
+    """Isolation key for per-team state (org-wide installs have no team_id)."""
+    return team_id or enterprise_id
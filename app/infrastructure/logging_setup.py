@@ -0,0 +1,132 @@
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from typing import Any, Dict, Optional
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_STANDARD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+MAX_STRING = 500
+MAX_ITEMS = 20
+
+
+def truncate(value: Any, max_string: int = MAX_STRING, max_items: int = MAX_ITEMS) -> Any:
+    """Shrink large fields (long strings / lists / dicts) for log output."""
+    if isinstance(value, str):
+        if len(value) > max_string:
+            return f"{value[:max_string]}...(+{len(value) - max_string} chars)"
+        return value
+    if isinstance(value, (list, tuple, set)):
+        items = list(value)
+        head = [truncate(v, max_string, max_items) for v in items[:max_items]]
+        if len(items) > max_items:
+            head.append(f"...(+{len(items) - max_items} items)")
+        return head
+    if isinstance(value, dict):
+        keys = list(value)[:max_items]
+        out = {str(k): truncate(value[k], max_string, max_items) for k in keys}
+        if len(value) > max_items:
+            out["..."] = f"+{len(value) - max_items} keys"
+        return out
+    if value is None or isinstance(value, (int, float, bool)):
+        return value
+    return truncate(str(value), max_string, max_items)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, message, event + `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": truncate(record.getMessage()),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                data[key] = truncate(value)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of high-volume events (`extra={"event": ...}`).
+
+    WARNING and above are never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, float], rng: Optional[random.Random] = None):
+        super().__init__()
+        self.rates = rates
+        self._rng = rng or random.Random()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(getattr(record, "event", ""), 1.0)
+        return rate >= 1.0 or self._rng.random() < rate
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves `%`-formatting to the listener thread.
+
+    The stock `prepare()` formats the message on the calling (Bolt listener)
+    thread; here only tracebacks are rendered eagerly since they can't be
+    queued safely.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def parse_sample_rates(spec: Optional[str]) -> Dict[str, float]:
+    """`event=rate,event2=rate` -> dict"""
+    rates: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        name, _, rate = item.strip().partition("=")
+        if name and rate:
+            rates[name] = float(rate)
+    return rates
+
+
+def setup_logging(
+    level: int = logging.INFO,
+    fmt: str = "json",
+    sample_rates: Optional[Dict[str, float]] = None,
+    handler: Optional[logging.Handler] = None,
+) -> logging.handlers.QueueListener:
+    """Route all logging through a queue; formatting and I/O run on one listener thread.
+
+    Returns the started QueueListener; call `.stop()` at shutdown to flush.
+    """
+    target = handler or logging.StreamHandler()
+    if fmt == "json":
+        target.setFormatter(JsonFormatter())
+    else:
+        target.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        )
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+
+    root = logging.getLogger()
+    for h in list(root.handlers):
+        root.removeHandler(h)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, target, respect_handler_level=True)
+    listener.start()
+    return listener
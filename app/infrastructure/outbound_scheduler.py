@@ -0,0 +1,313 @@
+import atexit
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+
+from app.infrastructure.metrics import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Priority classes, most urgent first
+VIEWS = 0
+INVITES = 1
+NOTIFICATIONS = 2
+PRIORITY_NAMES = ("views", "invites", "notifications")
+
+Send = Callable[..., Any]
+
+
+class _Write:
+    __slots__ = (
+        "priority",
+        "fn",
+        "args",
+        "kwargs",
+        "context",
+        "enqueued",
+        "done",
+        "result",
+        "error",
+    )
+
+    def __init__(self, priority: int, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        self.priority = priority
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        # the caller's contextvars (current span, correlation id) for the worker thread
+        self.context = contextvars.copy_context()
+        self.enqueued = 0.0
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Notice:
+    __slots__ = ("channel", "text", "send", "context", "enqueued", "due")
+
+    def __init__(self, channel: str, text: str, send: Send, enqueued: float, due: float):
+        self.channel = channel
+        self.text = text
+        self.send = send
+        self.context = contextvars.copy_context()
+        self.enqueued = enqueued
+        self.due = due
+
+
+class InlineOutbound:
+    """Runs every write immediately on the caller's thread (no scheduler configured)."""
+
+    def call(self, priority: int, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return fn(*args, **kwargs)
+
+    def notify(self, channel: str, text: str, send: Send) -> None:
+        send(channel=channel, text=text)
+
+
+INLINE = InlineOutbound()
+
+
+class OutboundScheduler:
+    """Per-team Slack writes ordered by priority: views, then invites, then DMs.
+
+    A worker pool always takes the most urgent pending write, so a
+    `views.update` never queues behind notification traffic for the same
+    team's rate budget. Writes run in a copy of the caller's contextvars,
+    so their Slack API spans stay children of the handler's trace. `call()`
+    blocks until its write has run and returns (or raises) its result.
+    `notify()` returns at once: DMs are deferred by `notify_delay`, and the
+    due ones for the same channel are coalesced into a single
+    `chat.postMessage` (up to `max_batch` per pass); failures are logged,
+    not raised. Each class has a queue bounded by `max_queue`; when
+    it is full the write runs on the caller's thread instead (backpressure),
+    which is counted in `slack_outbound_backpressure_total`. Metrics are
+    labelled by `team`, since every workspace has its own scheduler.
+
+    `call()` blocks a Bolt handler thread, so `workers` should match the
+    number of handlers a team may run at once (the admission per-team
+    limit, see `from_env`). Workers are started on demand, only while every
+    running one is busy; pending DMs are flushed by `close()`, which also
+    runs at interpreter exit.
+
+    Ordering guarantees (per team; teams have separate schedulers): every
+    view write of the handlers goes through `call(VIEWS, ...)`. With the
+    default pool a view or invite write normally finds an idle worker and
+    runs at once, so priority orders only what is waiting: DMs, which are
+    sent only when no view or invite write is queued, and writes queued
+    while every worker is busy (`OUTBOUND_WORKERS` below the admission
+    limit), which run views first, then invites, FIFO within a class. A
+    write run on the caller's thread (backpressure) bypasses the order.
+    """
+
+    def __init__(
+        self,
+        workers: int = 8,
+        max_queue: int = 100,
+        notify_delay: float = 0.5,
+        max_batch: int = 20,
+        registry: MetricsRegistry = REGISTRY,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "outbound",
+        team: str = "",
+    ):
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.notify_delay = notify_delay
+        self.max_batch = max(1, max_batch)
+        self.name = name
+        self.team = team
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._writes: Tuple[Deque[_Write], Deque[_Write]] = (deque(), deque())
+        self._notices: Deque[_Notice] = deque()
+        self._threads: List[threading.Thread] = []
+        self._busy = 0
+        self._closing = False
+        self._depth = registry.gauge(
+            "slack_outbound_queue_depth", "Pending outbound Slack writes", ("team", "priority")
+        )
+        self._wait = registry.histogram(
+            "slack_outbound_wait_seconds",
+            "Queueing delay of outbound Slack writes",
+            ("team", "priority"),
+        )
+        self._backpressure = registry.counter(
+            "slack_outbound_backpressure_total",
+            "Outbound writes run on the caller's thread because the queue was full",
+            ("team", "priority"),
+        )
+        self._coalesced = registry.counter(
+            "slack_outbound_coalesced_total",
+            "DMs merged into another message to the same channel",
+            ("team",),
+        )
+
+    @classmethod
+    def from_env(
+        cls, env: Optional[Mapping[str, str]] = None, **kwargs: Any
+    ) -> "OutboundScheduler":
+        """`OUTBOUND_WORKERS` defaults to the admission per-team limit (handlers per team)."""
+        env = os.environ if env is None else env
+        per_team = env.get("ADMISSION_MAX_PER_TEAM") or env.get("ADMISSION_MAX_CONCURRENT", "8")
+        return cls(
+            workers=int(env.get("OUTBOUND_WORKERS") or per_team),
+            max_queue=int(env.get("OUTBOUND_MAX_QUEUE", "100")),
+            notify_delay=float(env.get("NOTIFY_DELAY_SECONDS", "0.5")),
+            **kwargs,
+        )
+
+    def pending(self) -> Dict[str, int]:
+        with self._cond:
+            sizes = [len(q) for q in self._writes] + [len(self._notices)]
+        return dict(zip(PRIORITY_NAMES, sizes))
+
+    def call(self, priority: int, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a view / invite write by priority and wait for its result."""
+        if priority >= NOTIFICATIONS:
+            raise ValueError("use notify() for notifications")
+        write = _Write(priority, fn, args, kwargs)
+        with self._cond:
+            queue = self._writes[priority]
+            accepted = not self._closing and len(queue) < self.max_queue
+            if accepted:
+                write.enqueued = self._clock()
+                queue.append(write)
+                self._queued(priority)
+        if not accepted:
+            self._backpressure.inc(self.team, PRIORITY_NAMES[priority])
+            return fn(*args, **kwargs)
+        self._ensure_workers()
+        write.done.wait()
+        if write.error is not None:
+            raise write.error
+        return write.result
+
+    def notify(self, channel: str, text: str, send: Send) -> None:
+        """Queue a DM (`send(channel=..., text=...)`) to go out after more urgent writes."""
+        with self._cond:
+            accepted = not self._closing and len(self._notices) < self.max_queue
+            if accepted:
+                now = self._clock()
+                self._notices.append(_Notice(channel, text, send, now, now + self.notify_delay))
+                self._queued(NOTIFICATIONS)
+        if not accepted:
+            self._backpressure.inc(self.team, PRIORITY_NAMES[NOTIFICATIONS])
+            self._send_batch([_Notice(channel, text, send, 0.0, 0.0)])
+            return
+        self._ensure_workers()
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """Send everything still queued (DMs without delay); True if drained in time."""
+        deadline = self._clock() + timeout
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            while any(self._writes) or self._notices or self._busy:
+                remaining = deadline - self._clock()
+                if remaining <= 0 or not self._threads:
+                    break
+                self._cond.wait(remaining)
+            drained = not (any(self._writes) or self._notices or self._busy)
+        if not drained:
+            logger.warning(
+                "outbound writes left unsent at shutdown: %s",
+                self.pending(),
+                extra={"event": "outbound_close_timeout"},
+            )
+        return drained
+
+    def _queued(self, priority: int) -> None:
+        queue = self._notices if priority == NOTIFICATIONS else self._writes[priority]
+        self._depth.set(self.team, PRIORITY_NAMES[priority], value=len(queue))
+        self._cond.notify()
+
+    def _ensure_workers(self) -> None:
+        """Start another worker when the queued work outnumbers the idle ones."""
+        if len(self._threads) >= self.workers:
+            return
+        with self._cond:
+            if not self._threads:
+                atexit.register(self.close)
+            queued = sum(len(q) for q in self._writes) + (1 if self._notices else 0)
+            idle = len(self._threads) - self._busy
+            while len(self._threads) < self.workers and queued > idle:
+                thread = threading.Thread(
+                    target=self._run, name=f"{self.name}-{len(self._threads)}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+                idle += 1
+
+    def _take(self) -> Optional[Any]:
+        """Most urgent runnable work (a write, or a batch of due DMs); call with the lock held."""
+        for priority, queue in enumerate(self._writes):
+            if queue:
+                write = queue.popleft()
+                self._depth.set(self.team, PRIORITY_NAMES[priority], value=len(queue))
+                return write
+        now = self._clock()
+        batch: List[_Notice] = []
+        while self._notices and len(batch) < self.max_batch:
+            if self._notices[0].due > now and not self._closing:
+                break
+            batch.append(self._notices.popleft())
+        if batch:
+            self._depth.set(self.team, PRIORITY_NAMES[NOTIFICATIONS], value=len(self._notices))
+        return batch or None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                work = self._take()
+                while work is None:
+                    timeout = None
+                    if self._notices:
+                        timeout = max(0.0, self._notices[0].due - self._clock())
+                    self._cond.wait(timeout)
+                    work = self._take()
+                self._busy += 1
+            try:
+                if isinstance(work, _Write):
+                    self._execute(work)
+                else:
+                    self._send_batch(work)
+            finally:
+                with self._cond:
+                    self._busy -= 1
+                    self._cond.notify_all()
+
+    def _execute(self, write: _Write) -> None:
+        self._wait.observe(
+            self._clock() - write.enqueued, self.team, PRIORITY_NAMES[write.priority]
+        )
+        try:
+            write.result = write.context.run(write.fn, *write.args, **write.kwargs)
+        except BaseException as e:  # re-raised on the caller's thread
+            write.error = e
+        finally:
+            write.done.set()
+
+    def _send_batch(self, notices: List[_Notice]) -> None:
+        now = self._clock()
+        grouped: Dict[Tuple[str, Send], List[_Notice]] = {}
+        for notice in notices:
+            if notice.enqueued:
+                self._wait.observe(now - notice.enqueued, self.team, PRIORITY_NAMES[NOTIFICATIONS])
+            grouped.setdefault((notice.channel, notice.send), []).append(notice)
+        for (channel, send), group in grouped.items():
+            if len(group) > 1:
+                self._coalesced.inc(self.team, amount=len(group) - 1)
+            text = "\n".join(notice.text for notice in group)
+            try:
+                # a coalesced message is attributed to the first request's trace
+                group[0].context.run(send, channel=channel, text=text)
+            except Exception as e:
+                logger.warning(
+                    "DM could not be sent: %s",
+                    e,
+                    extra={"event": "outbound_notify_failed", "channel": channel},
+                )
@@ -0,0 +1,131 @@
+import functools
+import io
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+if TYPE_CHECKING:  # profilers are imported on first sampled request only
+    import cProfile
+    import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler:
+    """Opt-in sampling profiler for Bolt handlers (cProfile + tracemalloc).
+
+    A sampled request writes `<dir>/<time>-<listener>-<correlation id>.prof`
+    (load with `python -m pstats` / snakeviz) plus a `.txt` summary with the
+    top functions by cumulative time and, when `memory` is on, the top
+    allocation sites. Only one request is profiled at a time; tracemalloc is
+    process-wide, so its diff may include concurrent threads.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "profiles",
+        sample_rate: float = 0.0,
+        memory: bool = False,
+        top: int = 40,
+        rng: Optional[random.Random] = None,
+    ):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.memory = memory
+        self.top = top
+        self._rng = rng or random.Random()
+        self._busy = threading.Lock()
+        self.reports: List[str] = []
+
+    @classmethod
+    def from_env(cls) -> "Profiler":
+        return cls(
+            output_dir=os.environ.get("PROFILE_DIR", "profiles"),
+            sample_rate=float(os.environ.get("PROFILE_SAMPLE_RATE") or 0),
+            memory=os.environ.get("PROFILE_MEMORY", "") in ("1", "true", "yes"),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def configure(self, sample_rate: float, memory: Optional[bool] = None) -> None:
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        if memory is not None:
+            self.memory = memory
+
+    def wrap(self, name: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(handler)
+        def wrapper(**kwargs: Any) -> Any:
+            if not self.enabled or self._rng.random() >= self.sample_rate:
+                return handler(**kwargs)
+            if not self._busy.acquire(blocking=False):
+                return handler(**kwargs)
+            try:
+                return self._profile(name, handler, kwargs)
+            finally:
+                self._busy.release()
+
+        return wrapper
+
+    def _profile(self, name: str, handler: Callable[..., Any], kwargs: Any) -> Any:
+        import cProfile
+        import tracemalloc
+
+        correlation_id = uuid.uuid4().hex[:12]
+        memory = self.memory
+        started_tracemalloc = False
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            started_tracemalloc = True
+        before = tracemalloc.take_snapshot() if memory else None
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            return profile.runcall(handler, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            after = tracemalloc.take_snapshot() if memory else None
+            if started_tracemalloc:
+                tracemalloc.stop()
+            try:
+                self._dump(name, correlation_id, elapsed, profile, before, after)
+            except OSError:
+                logger.exception("failed to write profile report")
+
+    def _dump(
+        self,
+        name: str,
+        correlation_id: str,
+        elapsed: float,
+        profile: "cProfile.Profile",
+        before: "Optional[tracemalloc.Snapshot]",
+        after: "Optional[tracemalloc.Snapshot]",
+    ) -> None:
+        import pstats
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        base = os.path.join(self.output_dir, f"{stamp}-{name}-{correlation_id}")
+        profile.dump_stats(base + ".prof")
+
+        out = io.StringIO()
+        out.write(f"listener={name} correlation_id={correlation_id} elapsed={elapsed:.4f}s\n\n")
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(self.top)
+        if before is not None and after is not None:
+            out.write("\n# allocations (top by size delta)\n")
+            for stat in after.compare_to(before, "lineno")[: self.top]:
+                out.write(f"{stat}\n")
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(out.getvalue())
+        self.reports.append(base)
+        logger.info(
+            "profile written: %s (%.1fms)",
+            base,
+            elapsed * 1000,
+            extra={"event": "profile_written", "correlation_id": correlation_id},
+        )
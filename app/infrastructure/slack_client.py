@@ -1,42 +1,336 @@
-from typing import Any, Dict, List
+import random
+import socket
+import threading
+import time
+import urllib.error
+from typing import Any, Callable, Dict, List, Optional
+
+from app.infrastructure.tracing import TRACER, Span, Tracer
+
+# Slack error codes that indicate a temporary server-side condition
+_RATE_LIMIT_ERRORS = {"ratelimited", "rate_limited"}
+_TRANSIENT_ERRORS = _RATE_LIMIT_ERRORS | {
+    "internal_error",
+    "fatal_error",
+    "service_unavailable",
+    "request_timeout",
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling Slack while the circuit breaker is open."""
+
+
+class RateLimitedError(Exception):
+    """Raised without calling Slack while the method is inside its Retry-After window."""
+
+
+def _response_status(exc: Exception) -> Optional[int]:
+    resp = getattr(exc, "response", None)
+    status = getattr(resp, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _response_error(exc: Exception) -> Optional[str]:
+    resp = getattr(exc, "response", None)
+    try:
+        return resp.get("error") if resp is not None else None
+    except Exception:
+        return None
+
+
+def is_transient_error(exc: Exception) -> bool:
+    """Timeouts, connection errors, 429 / 5xx and `ratelimited`-style errors."""
+    transient = (CircuitOpenError, RateLimitedError, socket.timeout, TimeoutError, ConnectionError)
+    if isinstance(exc, transient):
+        return True
+    if isinstance(exc, urllib.error.URLError) and not isinstance(exc, urllib.error.HTTPError):
+        return True
+    status = _response_status(exc)
+    if status is not None and (status == 429 or status >= 500):
+        return True
+    return _response_error(exc) in _TRANSIENT_ERRORS
+
+
+def is_rate_limited(exc: Exception) -> bool:
+    """HTTP 429 / `ratelimited`: a per-method limit, not a sign that Slack is down."""
+    return _response_status(exc) == 429 or _response_error(exc) in _RATE_LIMIT_ERRORS
+
+
+def _response_size(resp: Any) -> Optional[int]:
+    headers = getattr(resp, "headers", None) or {}
+    try:
+        value = headers.get("Content-Length") or headers.get("content-length")
+        return int(value) if value is not None else None
+    except Exception:
+        return None
+
+
+def _rate_limit_headers(resp: Any) -> Dict[str, str]:
+    headers = getattr(resp, "headers", None) or {}
+    try:
+        return {
+            k.lower(): str(v)
+            for k, v in headers.items()
+            if k.lower() == "retry-after" or k.lower().startswith("x-ratelimit")
+        }
+    except Exception:
+        return {}
+
+
+def retry_after_seconds(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        return float(value) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by attempts and an overall deadline."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.3,
+        max_delay: float = 5.0,
+        deadline: float = 10.0,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def backoff(self, retry: int, rng: random.Random) -> float:
+        return rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** (retry - 1))))
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+# Only idempotent reads are retried by default; writes fail fast (no duplicate channels / DMs)
+DEFAULT_RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "users_lookupByEmail": RetryPolicy(),
+    "users_list": RetryPolicy(deadline=30.0),
+    "usergroups_list": RetryPolicy(),
+    "usergroups_users_list": RetryPolicy(),
+    "conversations_members": RetryPolicy(),
+}
+
+
+class CircuitBreaker:
+    """closed -> open after `failure_threshold` consecutive transient failures;
+    open -> half_open after `reset_timeout`; one success in half_open closes it.
+
+    Rate limits are not failures here: Slack applies them per method, so they
+    are tracked per method by `SlackClient` instead of tripping every call.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self.open_count = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.open_count += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
 
 
 class SlackClient:
     """
     Thin facade over Slack WebClient.
     Accepts an object exposing methods compatible with slack_sdk.WebClient.
+
+    Every call goes through `_call`, which applies the per-method retry policy
+    (transient errors only), the method's Retry-After window after a rate
+    limit, and the shared circuit breaker (other transient errors), and records a
+    `slack_api` span (wall time, response size, error code, rate-limit
+    headers, retries) under the current interaction's trace.
     """
 
-    def __init__(self, web_client: Any):
+    def __init__(
+        self,
+        web_client: Any,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+        tracer: Tracer = TRACER,
+    ):
         self._client = web_client
+        self._tracer = tracer
+        self._policies = DEFAULT_RETRY_POLICIES if retry_policies is None else retry_policies
+        self._breaker = breaker or CircuitBreaker(clock=clock)
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._counter_lock = threading.Lock()
+        self._counters = {
+            "calls": 0,
+            "retries": 0,
+            "transient_failures": 0,
+            "short_circuited": 0,
+            "rate_limited": 0,
+        }
+        # method -> clock time until which Slack asked us not to call it again
+        self._limited_until: Dict[str, float] = {}
+
+    def counters(self) -> Dict[str, Any]:
+        """Retry / breaker counters (for metrics and diagnostics)."""
+        with self._counter_lock:
+            data: Dict[str, Any] = dict(self._counters)
+        data["breaker_state"] = self._breaker.state
+        data["breaker_open_count"] = self._breaker.open_count
+        return data
+
+    def _count(self, key: str) -> None:
+        with self._counter_lock:
+            self._counters[key] += 1
+
+    def _call(self, method: str, **kwargs: Any) -> Any:
+        if not self._tracer.sinks:  # tracing disabled: no span bookkeeping
+            return self._call_with_retry(None, method, **kwargs)
+        with self._tracer.span(f"slack.{method}", kind="slack_api", method=method) as span:
+            try:
+                resp = self._call_with_retry(span, method, **kwargs)
+            except Exception as e:
+                span.set(
+                    error=_response_error(e) or type(e).__name__,
+                    status=_response_status(e),
+                    **_rate_limit_headers(getattr(e, "response", None)),
+                )
+                raise
+            span.set(response_bytes=_response_size(resp), **_rate_limit_headers(resp))
+            return resp
+
+    def _call_with_retry(self, span: Optional[Span], method: str, **kwargs: Any) -> Any:
+        policy = self._policies.get(method, NO_RETRY)
+        started = self._clock()
+        attempt = 0
+        while True:
+            if not self._breaker.allow():
+                self._count("short_circuited")
+                raise CircuitOpenError(f"Slack API circuit is open: {method}")
+            self._wait_for_rate_limit(method, policy, started)
+            attempt += 1
+            self._count("calls")
+            try:
+                resp = getattr(self._client, method)(**kwargs)
+            except Exception as e:
+                if not is_transient_error(e):
+                    self._breaker.record_success()
+                    raise
+                self._count("transient_failures")
+                delay = retry_after_seconds(e) or policy.backoff(attempt, self._rng)
+                if is_rate_limited(e):
+                    self._count("rate_limited")
+                    with self._counter_lock:
+                        self._limited_until[method] = self._clock() + delay
+                else:
+                    self._breaker.record_failure()
+                elapsed = self._clock() - started
+                if attempt >= policy.max_attempts or elapsed + delay > policy.deadline:
+                    raise
+                self._count("retries")
+                if span is not None:
+                    span.set(retries=attempt)
+                self._sleep(delay)
+                continue
+            self._breaker.record_success()
+            return resp
+
+    def _wait_for_rate_limit(self, method: str, policy: RetryPolicy, started: float) -> None:
+        """Sleep out the method's Retry-After window, or fail fast if it outlasts the deadline."""
+        with self._counter_lock:
+            remaining = self._limited_until.get(method, 0.0) - self._clock()
+        if remaining <= 0:
+            return
+        if self._clock() - started + remaining > policy.deadline:
+            self._count("short_circuited")
+            raise RateLimitedError(f"Slack API rate limited for {remaining:.1f}s: {method}")
+        self._sleep(remaining)
 
     # --- Views ---
     def open_view(
         self, trigger_id: str, view: Dict[str, Any]
     ) -> Dict[str, Any]:  # pragma: no cover - behavior tested separately
-        return self._client.views_open(trigger_id=trigger_id, view=view)
+        return self._call("views_open", trigger_id=trigger_id, view=view)
 
     def update_view(
-        self, view_id: str, view: Dict[str, Any]
+        self, view_id: str, view: Dict[str, Any], hash: Optional[str] = None
     ) -> Dict[str, Any]:  # pragma: no cover - behavior tested separately
-        return self._client.views_update(view_id=view_id, view=view)
+        if hash is not None:  # optimistic update: fails with hash_conflict if the view changed
+            return self._call("views_update", view_id=view_id, view=view, hash=hash)
+        return self._call("views_update", view_id=view_id, view=view)
 
     # --- Conversations / Channels ---
     def create_channel(
         self, name: str, is_private: bool = True
     ) -> Dict[str, Any]:  # pragma: no cover
-        return self._client.conversations_create(name=name, is_private=is_private)
+        return self._call("conversations_create", name=name, is_private=is_private)
 
     def invite_users(
         self, channel_id: str, user_ids: List[str] | str
     ) -> Dict[str, Any]:  # pragma: no cover
         users_param = ",".join(user_ids) if isinstance(user_ids, (list, tuple)) else str(user_ids)
-        return self._client.conversations_invite(channel=channel_id, users=users_param)
+        return self._call("conversations_invite", channel=channel_id, users=users_param)
+
+    def list_conversation_members(
+        self, channel: str, cursor: Optional[str] = None, limit: int = 200
+    ) -> Dict[str, Any]:  # pragma: no cover
+        return self._call("conversations_members", channel=channel, cursor=cursor, limit=limit)
 
     # --- Chat ---
     def post_message(self, channel: str, text: str) -> Dict[str, Any]:  # pragma: no cover
-        return self._client.chat_postMessage(channel=channel, text=text)
+        return self._call("chat_postMessage", channel=channel, text=text)
 
     # --- Users ---
     def lookup_user_by_email(self, email: str) -> Dict[str, Any]:  # pragma: no cover
-        return self._client.users_lookupByEmail(email=email)
+        return self._call("users_lookupByEmail", email=email)
+
+    def list_users(
+        self, cursor: Optional[str] = None, limit: int = 200
+    ) -> Dict[str, Any]:  # pragma: no cover
+        return self._call("users_list", cursor=cursor, limit=limit)
+
+    # --- User groups ---
+    def list_usergroups(self) -> Dict[str, Any]:  # pragma: no cover
+        return self._call("usergroups_list")
+
+    def list_usergroup_users(self, usergroup: str) -> Dict[str, Any]:  # pragma: no cover
+        return self._call("usergroups_users_list", usergroup=usergroup)
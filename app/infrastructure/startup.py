@@ -0,0 +1,133 @@
+"""Cold-start timing: phase marks, time-to-first-ack and an `-X importtime` breakdown.
+
+    python -m app.infrastructure.startup [module] [--top N]
+
+prints which packages dominate the import time of `module` (default
+`app.slack_app`), measured in a fresh interpreter.
+"""
+
+import argparse
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from app.infrastructure.metrics import REGISTRY, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+def process_start_time() -> float:
+    """Wall-clock process start (Linux /proc); falls back to now."""
+    try:
+        with open("/proc/self/stat") as f:
+            # fields after the parenthesised command name; starttime (ticks since boot) is #22
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        since_start = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf(
+            "SC_CLK_TCK"
+        )
+        return time.time() - since_start
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.time()
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> List[ImportTime]:
+    entries = []
+    for line in text.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if m:
+            self_us, cumulative_us, indent, module = m.groups()
+            entries.append(ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+
+def package_breakdown(entries: List[ImportTime]) -> Dict[str, int]:
+    """Self time (us) summed per top-level package, largest first."""
+    totals: Dict[str, int] = defaultdict(int)
+    for e in entries:
+        totals[e.module.split(".")[0]] += e.self_us
+    return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def measure_imports(module: str, python: str = sys.executable) -> List[ImportTime]:
+    """Import `module` in a fresh interpreter with `-X importtime`."""
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def format_breakdown(entries: List[ImportTime], top: int = 15) -> str:
+    total = sum(e.self_us for e in entries)
+    lines = [f"total import time: {total / 1000:.1f} ms ({len(entries)} modules)", ""]
+    lines.append("by package (self time):")
+    for name, us in list(package_breakdown(entries).items())[:top]:
+        lines.append(f"  {us / 1000:8.1f} ms  {us * 100 / max(total, 1):5.1f}%  {name}")
+    lines.append("")
+    lines.append("slowest modules (cumulative):")
+    for e in sorted(entries, key=lambda e: e.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {e.cumulative_us / 1000:8.1f} ms  {e.module}")
+    return "\n".join(lines)
+
+
+class StartupReport:
+    """Seconds from process start to each startup phase (`runtime_ready`,
+    `app_created`, `connected`, `first_ack`), logged and exported as the
+    `app_startup_seconds{phase}` gauge."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = REGISTRY,
+        started_at: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.started_at = process_start_time() if started_at is None else started_at
+        self._clock = clock
+        self.phases: Dict[str, float] = {}
+        self._gauge = registry.gauge(
+            "app_startup_seconds", "Seconds from process start to startup phase", ["phase"]
+        )
+
+    def mark(self, phase: str, at: Optional[float] = None) -> float:
+        elapsed = (self._clock() if at is None else at) - self.started_at
+        self.phases[phase] = elapsed
+        self._gauge.set(phase, value=elapsed)
+        logger.info(
+            "startup: %s at %.3fs",
+            phase,
+            elapsed,
+            extra={"event": "startup_phase", "phase": phase, "seconds": round(elapsed, 4)},
+        )
+        return elapsed
+
+    def first_ack(self, at: float) -> None:
+        """HandlerMetrics.on_first_ack callback (wall-clock timestamp)."""
+        self.mark("first_ack", at)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Import-time breakdown (-X importtime)")
+    parser.add_argument("module", nargs="?", default="app.slack_app")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+    print(format_breakdown(measure_imports(args.module), args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import contextvars
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+
+from app.infrastructure.metrics import REGISTRY, MetricsRegistry
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    __slots__ = ("name", "kind", "attributes", "children", "parent", "start", "end")
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.children: List["Span"] = []
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "duration_ms": round(self.duration * 1000, 3),
+            "offset_ms": round((self.start - self.root.start) * 1000, 3),
+            "attributes": dict(self.attributes),
+            "children": [c.to_dict() for c in self.children],
+        }
+
+    @property
+    def root(self) -> "Span":
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span
+
+
+class SpanSink(Protocol):
+    def emit(self, span: Span) -> None: ...
+
+
+class LoggingSink:
+    """Logs each finished trace (root span) with its slowest child."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self._logger = logger or logging.getLogger("app.trace")
+        self._level = level
+
+    def emit(self, span: Span) -> None:
+        if span.parent is not None or not self._logger.isEnabledFor(self._level):
+            return
+        slowest = max(span.children, key=lambda c: c.duration, default=None)
+        self._logger.log(
+            self._level,
+            "trace %s %.1fms calls=%d slowest=%s(%.1fms)",
+            span.name,
+            span.duration * 1000,
+            len(span.children),
+            slowest.name if slowest else "-",
+            slowest.duration * 1000 if slowest else 0.0,
+            extra={"trace": span.to_dict()},
+        )
+
+
+class RingBufferSink:
+    """Keeps the last `capacity` traces in memory (diagnostics / tests)."""
+
+    def __init__(self, capacity: int = 200):
+        self._traces: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        if span.parent is None:
+            with self._lock:
+                self._traces.append(span.to_dict())
+
+    def traces(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._traces)
+
+
+class MetricsSink:
+    """Slack API call duration / count per method and error code."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self._duration = registry.histogram(
+            "slack_api_call_duration_seconds", "Slack Web API call wall time", ["method", "error"]
+        )
+        self._retries = registry.counter(
+            "slack_api_retries_total", "Slack Web API retries", ["method"]
+        )
+
+    def emit(self, span: Span) -> None:
+        if span.kind != "slack_api":
+            return
+        method = span.attributes.get("method", span.name)
+        self._duration.observe(span.duration, method, span.attributes.get("error") or "")
+        retries = span.attributes.get("retries", 0)
+        if retries:
+            self._retries.inc(method, amount=retries)
+
+
+class Tracer:
+    """Per-interaction span trees; the current span is tracked in a ContextVar."""
+
+    def __init__(self, sinks: Optional[List[SpanSink]] = None):
+        self.sinks: List[SpanSink] = list(sinks or [])
+
+    def add_sink(self, sink: SpanSink) -> None:
+        self.sinks.append(sink)
+
+    def set_sinks(self, sinks: List[SpanSink]) -> None:
+        """Replace all sinks at once (spans already closing keep the old list)."""
+        self.sinks = list(sinks)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+        parent = _current.get()
+        span = Span(name, kind, parent, attributes)
+        if parent is not None:
+            parent.children.append(span)
+        token = _current.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.attributes.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current.reset(token)
+            for sink in self.sinks:
+                try:
+                    sink.emit(span)
+                except Exception:  # pragma: no cover - sinks must never break requests
+                    logging.getLogger(__name__).exception("span sink failed")
+
+
+TRACER = Tracer()
+
+
+def configure_tracing(spec: Optional[str], tracer: Tracer = TRACER) -> Tracer:
+    """Set the sinks from a comma separated spec: `log`, `ring[:N]`, `metrics`.
+
+    Replaces any sinks configured before, so calling it again does not duplicate spans.
+    """
+    sinks: List[SpanSink] = []
+    for item in (spec or "").split(","):
+        name, _, arg = item.strip().partition(":")
+        if name == "log":
+            sinks.append(LoggingSink())
+        elif name == "ring":
+            sinks.append(RingBufferSink(int(arg or 200)))
+        elif name == "metrics":
+            sinks.append(MetricsSink())
+    tracer.set_sinks(sinks)
+    return tracer
@@ -0,0 +1,64 @@
+import math
+from typing import Any, Callable, Collection
+
+from app.infrastructure.profiling import Profiler
+
+MULTI_WORKER_MESSAGE = (
+    "複数ワーカー（{workers} プロセス）で動作中のため、コマンドでは切り替えられません"
+    "（受け付けたワーカーにしか反映されないため）。"
+    "`PROFILE_SAMPLE_RATE` / `PROFILE_MEMORY` を設定して再起動してください。"
+)
+
+
+def _usage(profiler: Profiler) -> str:
+    state = f"on (rate={profiler.sample_rate:g}, memory={profiler.memory})"
+    return (
+        f"プロファイル: {state if profiler.enabled else 'off'}\n"
+        "使い方: `on [率 0-1] [memory]` / `off` / `status`"
+    )
+
+
+def _parse_rate(args: Collection[str]) -> float:
+    """`on` の後の率（省略時 1.0）。数値でなければ、その語を引数に ValueError"""
+    values = [a for a in list(args)[1:] if a != "memory"]
+    if not values:
+        return 1.0
+    try:
+        rate = float(values[0])
+    except ValueError:
+        rate = math.nan
+    if not math.isfinite(rate):
+        raise ValueError(values[0])
+    return rate
+
+
+def build_profile_command_handler(
+    profiler: Profiler, admin_user_ids: Collection[str], workers: int = 1
+) -> Callable[..., Any]:
+    """管理者用スラッシュコマンド: 再デプロイなしでプロファイリングを切り替える。
+
+    設定はプロセス内のみ。複数ワーカーの HTTP モードでは on / off を受け付けない。
+    """
+
+    def handle_profile_command(ack, command):
+        if command.get("user_id") not in admin_user_ids:
+            ack("このコマンドは管理者のみ実行できます。")
+            return
+
+        args = (command.get("text") or "").split()
+        if args and args[0] in ("on", "off") and workers > 1:
+            ack(MULTI_WORKER_MESSAGE.format(workers=workers) + "\n" + _usage(profiler))
+            return
+        if args and args[0] == "on":
+            try:
+                rate = _parse_rate(args)
+            except ValueError as e:
+                ack(f"率は 0〜1 の数値で指定してください: `{e}`\n" + _usage(profiler))
+                return
+            profiler.configure(rate, memory="memory" in args)
+        elif args and args[0] == "off":
+            profiler.configure(0.0)
+        # 応答はコマンド実行者のみに表示（ephemeral）
+        ack(_usage(profiler))
+
+    return handle_profile_command
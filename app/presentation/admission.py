@@ -0,0 +1,194 @@
+import functools
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.email_address_parser import parse_email_addresses
+from app.infrastructure.installation import team_key
+from app.infrastructure.metrics import REGISTRY, MetricsRegistry
+from app.presentation.error_messages import BUSY_MESSAGE
+from app.presentation.lifecycle import slack_client_for
+from app.presentation.modal_builder import build_error_modal
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Per-user, per-team and global concurrency limits in front of expensive handlers.
+
+    A request that cannot start immediately waits in a bounded queue for at
+    most `queue_timeout` seconds (the wait happens before the handler acks,
+    so keep it well under Slack's 3s deadline). When the queue is full or
+    the wait times out the request is rejected with an error modal.
+    A team may hold at most `max_per_team` running slots and as many queue
+    places, so one busy workspace cannot starve the others. View submissions
+    listing more than `max_members` addresses are refused with an inline
+    error before any user lookup.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_per_user: int = 2,
+        max_per_team: Optional[int] = None,
+        max_queue: int = 8,
+        queue_timeout: float = 1.0,
+        max_members: int = 1000,
+        registry: MetricsRegistry = REGISTRY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_per_user = max_per_user
+        self.max_per_team = max_concurrent if max_per_team is None else max_per_team
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_members = max_members
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._running = 0
+        self._per_user: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._per_team: Dict[str, int] = defaultdict(int)
+        self._waiting_per_team: Dict[str, int] = defaultdict(int)
+        self._waiting = 0
+        self.rejected = registry.counter(
+            "slack_admission_rejected_total", "Requests refused by admission control", ["reason"]
+        )
+        self.queue_wait = registry.histogram(
+            "slack_admission_queue_wait_seconds", "Time spent waiting for an admission slot"
+        )
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        env = os.environ
+        max_concurrent = int(env.get("ADMISSION_MAX_CONCURRENT", "8"))
+        return cls(
+            max_concurrent=max_concurrent,
+            max_per_user=int(env.get("ADMISSION_MAX_PER_USER", "2")),
+            max_per_team=int(env.get("ADMISSION_MAX_PER_TEAM") or max_concurrent),
+            max_queue=int(env.get("ADMISSION_MAX_QUEUE", "8")),
+            queue_timeout=float(env.get("ADMISSION_QUEUE_TIMEOUT", "1.0")),
+            max_members=int(env.get("MAX_MEMBERS", "1000")),
+        )
+
+    def _has_slot(self, user_id: str, team_id: str) -> bool:
+        return (
+            self._running < self.max_concurrent
+            and self._per_team[team_id] < self.max_per_team
+            and self._per_user[(team_id, user_id)] < self.max_per_user
+        )
+
+    def acquire(self, user_id: str, team_id: str = "") -> Optional[str]:
+        """Take a slot; returns None on success or the rejection reason."""
+        with self._cond:
+            if not self._has_slot(user_id, team_id):
+                if (
+                    self._waiting >= self.max_queue
+                    or self._waiting_per_team[team_id] >= self.max_per_team
+                ):
+                    return "queue_full"
+                started = self._clock()
+                until = started + self.queue_timeout
+                self._waiting += 1
+                self._waiting_per_team[team_id] += 1
+                try:
+                    while not self._has_slot(user_id, team_id):
+                        remaining = until - self._clock()
+                        if remaining <= 0:
+                            return "timeout"
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                    _decrement(self._waiting_per_team, team_id)
+                    self.queue_wait.observe(self._clock() - started)
+            self._running += 1
+            self._per_team[team_id] += 1
+            self._per_user[(team_id, user_id)] += 1
+            return None
+
+    def release(self, user_id: str, team_id: str = "") -> None:
+        with self._cond:
+            self._running -= 1
+            _decrement(self._per_team, team_id)
+            _decrement(self._per_user, (team_id, user_id))
+            self._cond.notify_all()
+
+    def wrap(self, name: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(handler)
+        def wrapper(**kwargs: Any) -> Any:
+            body = kwargs.get("body") or {}
+            if body.get("type") == "view_submission" and self._too_many_members(kwargs):
+                return None
+            user_id = (body.get("user") or {}).get("id", "")
+            team_id = (
+                team_key(
+                    (body.get("team") or {}).get("id"), (body.get("enterprise") or {}).get("id")
+                )
+                or ""
+            )
+            reason = self.acquire(user_id, team_id)
+            if reason is not None:
+                self._reject(name, reason, kwargs)
+                return None
+            try:
+                return handler(**kwargs)
+            finally:
+                self.release(user_id, team_id)
+
+        return wrapper
+
+    def _too_many_members(self, kwargs: Dict[str, Any]) -> bool:
+        view = kwargs.get("view") or (kwargs.get("body") or {}).get("view") or {}
+        try:
+            text = view["state"]["values"]["member_emails_input"]["member_emails"]["value"]
+        except (KeyError, TypeError):
+            return False
+        count = len(parse_email_addresses(text or ""))
+        if count <= self.max_members:
+            return False
+        self.rejected.inc("too_many_members")
+        kwargs["ack"](
+            response_action="errors",
+            errors={
+                "member_emails_input": (
+                    f"一度に招待できるのは {self.max_members} 件までです（入力: {count} 件）。"
+                )
+            },
+        )
+        return True
+
+    def _reject(self, name: str, reason: str, kwargs: Dict[str, Any]) -> None:
+        self.rejected.inc(reason)
+        logger.warning(
+            "admission rejected: %s (%s)",
+            name,
+            reason,
+            extra={"event": "admission_rejected", "listener": name, "reason": reason},
+        )
+        body = kwargs.get("body") or {}
+        ack = kwargs["ack"]
+        if body.get("type") == "view_submission":
+            ack(response_action="update", view=build_error_modal(BUSY_MESSAGE))
+            return
+        ack()
+        view_id = (body.get("view") or {}).get("id")
+        slack_client = slack_client_for(kwargs)
+        if not view_id or slack_client is None:
+            return
+        # already acked: a failed update must not surface as a listener error
+        try:
+            slack_client.update_view(view_id=view_id, view=build_error_modal(BUSY_MESSAGE))
+        except Exception as e:
+            logger.warning(
+                "admission rejection not shown: %s",
+                e,
+                extra={"event": "view_update_failed", "listener": name},
+            )
+
+
+def _decrement(counts: Dict[Any, int], key: Hashable) -> None:
+    counts[key] -= 1
+    if not counts[key]:
+        del counts[key]
@@ -9,4 +9,8 @@ MODAL_TITLES = {
 ACTION_IDS = {
     "CONFIRM": "confirm_creation",
     "CANCEL": "cancel_creation",
+    "MEMBER_EMAILS": "member_emails",
+    "MEMBER_USERS": "member_users",
+    "MEMBER_CHANNELS": "member_channels",
+    "APPLY_SUGGESTION": "apply_suggestion",
 }
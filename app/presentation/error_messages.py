@@ -1,5 +1,16 @@
 from typing import Tuple
 
+from app.infrastructure.slack_client import is_transient_error
+
+# Shown when an interaction is rejected or interrupted by a shutdown / deploy
+SHUTDOWN_MESSAGE = (
+    "アプリを再起動中のため処理を完了できませんでした。"
+    "しばらく待ってから再度お試しください（作成済みのチャンネルがないかご確認ください）。"
+)
+
+# Shown when admission control rejects a request (too many concurrent requests)
+BUSY_MESSAGE = "現在リクエストが集中しています。しばらく待ってから再度お試しください。"
+
 
 def get_error_message_and_dm(exc: Exception) -> Tuple[str, bool]:
     """Map exception to user-facing message and whether to send a DM as well.
@@ -7,6 +18,7 @@ def get_error_message_and_dm(exc: Exception) -> Tuple[str, bool]:
     Policy (compatible with current behavior):
     - name_taken: show error modal only
     - permission* errors: show error modal and send DM
+    - transient errors (rate limit / 5xx / timeout / circuit open): retry-later modal only
     - others: show error modal only
     """
 
@@ -19,6 +31,10 @@ def get_error_message_and_dm(exc: Exception) -> Tuple[str, bool]:
             msg = "このチャンネル名は既に使用されています。"
             return msg, False
 
+    if is_transient_error(exc):
+        msg = "Slack が混み合っています。しばらく待ってから再度お試しください。"
+        return msg, False
+
     # Fallback string inspection
     if "permission" in str(exc).lower():
         msg = "チャンネル作成の権限がありません。管理者にお問い合わせください。"
@@ -0,0 +1,83 @@
+import contextlib
+import functools
+import time
+from typing import Any, Callable, Optional
+
+from app.infrastructure.metrics import REGISTRY, MetricsRegistry
+from app.infrastructure.tracing import TRACER, Tracer
+
+RECEIVED_AT_KEY = "received_at"
+
+
+class HandlerMetrics:
+    """Ack latency / handler duration / outcome histograms per listener.
+
+    Each handler run is also the root span of the interaction's trace, so the
+    Slack API spans recorded by SlackClient form one tree per request.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, tracer: Tracer = TRACER):
+        self.tracer = tracer
+        self.ack_latency = registry.histogram(
+            "slack_ack_latency_seconds",
+            "Time from request receipt to ack() (Slack deadline: 3s)",
+            ["listener"],
+        )
+        self.duration = registry.histogram(
+            "slack_handler_duration_seconds", "Handler wall time", ["listener", "outcome"]
+        )
+        self.total = registry.counter(
+            "slack_handler_total", "Handled interactions", ["listener", "outcome"]
+        )
+        self.first_ack_at: Optional[float] = None
+        # called once with first_ack_at (e.g. StartupReport.first_ack)
+        self.on_first_ack: Optional[Callable[[float], None]] = None
+
+    def middleware(self) -> Callable[..., Any]:
+        """Bolt global middleware: stamps the receipt time used for ack latency."""
+
+        def stamp_received_at(context, next):
+            context[RECEIVED_AT_KEY] = time.perf_counter()
+            next()
+
+        return stamp_received_at
+
+    def instrument(self, name: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a Bolt listener. Bolt resolves arguments via `inspect.unwrap`,
+        so the wrapped function's signature keeps working."""
+
+        @functools.wraps(handler)
+        def wrapper(**kwargs: Any) -> Any:
+            started = time.perf_counter()
+            context = kwargs.get("context") or {}
+            received_at = context.get(RECEIVED_AT_KEY, started)
+            original_ack = kwargs.get("ack")
+            if original_ack is not None:
+
+                def timed_ack(*args: Any, **ack_kwargs: Any) -> Any:
+                    now = time.perf_counter()
+                    self.ack_latency.observe(now - received_at, name)
+                    if self.first_ack_at is None:
+                        self.first_ack_at = time.time()
+                        if self.on_first_ack is not None:
+                            self.on_first_ack(self.first_ack_at)
+                    return original_ack(*args, **ack_kwargs)
+
+                kwargs["ack"] = timed_ack
+            outcome = "ok"
+            root = (
+                self.tracer.span(f"handler.{name}", kind="handler", listener=name)
+                if self.tracer.sinks
+                else contextlib.nullcontext()
+            )
+            try:
+                with root:
+                    return handler(**kwargs)
+            except Exception:
+                outcome = "error"
+                raise
+            finally:
+                self.duration.observe(time.perf_counter() - started, name, outcome)
+                self.total.inc(name, outcome)
+
+        return wrapper
@@ -0,0 +1,116 @@
+import functools
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.infrastructure.slack_client import SlackClient
+from app.presentation.error_messages import SHUTDOWN_MESSAGE
+from app.presentation.modal_builder import build_error_modal
+
+logger = logging.getLogger(__name__)
+
+
+class Lifecycle:
+    """Tracks in-flight handler runs so a shutdown can drain them.
+
+    `shutdown()` stops admitting new interactions, waits until the running
+    handlers finish or the deadline passes, and then replaces the views
+    of block actions that are still running (e.g. stuck on 作成中...) with a
+    retryable error.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._ids = itertools.count()
+        self._inflight: Dict[int, Tuple[str, Optional[str], Any]] = {}
+        self.accepting = True
+
+    def inflight(self) -> int:
+        with self._cond:
+            return len(self._inflight)
+
+    def track(self, name: str, handler: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(handler)
+        def wrapper(**kwargs: Any) -> Any:
+            key = self._begin(name, kwargs)
+            try:
+                return handler(**kwargs)
+            finally:
+                self._end(key)
+
+        return wrapper
+
+    def _begin(self, name: str, kwargs: Dict[str, Any]) -> int:
+        body = kwargs.get("body") or {}
+        view_id = None
+        # Only block actions own a still-open view; a submitted view is already closed.
+        if body.get("type") == "block_actions":
+            view_id = (body.get("view") or {}).get("id")
+        with self._cond:
+            key = next(self._ids)
+            self._inflight[key] = (name, view_id, slack_client_for(kwargs))
+            return key
+
+    def _end(self, key: int) -> None:
+        with self._cond:
+            self._inflight.pop(key, None)
+            self._cond.notify_all()
+
+    def middleware(self) -> Callable[..., Any]:
+        """Bolt global middleware: refuses new interactions once draining."""
+
+        def reject_when_draining(body, ack, next):
+            if self.accepting:
+                next()
+                return
+            logger.info("interaction rejected: shutting down", extra={"event": "shutdown_reject"})
+            if body.get("type") == "view_submission":
+                ack(response_action="update", view=build_error_modal(SHUTDOWN_MESSAGE))
+            else:
+                ack()
+
+        return reject_when_draining
+
+    def shutdown(self, deadline: float) -> int:
+        """Drain for up to `deadline` seconds; returns the number of interrupted runs."""
+        self.accepting = False
+        until = self._clock() + deadline
+        with self._cond:
+            while self._inflight:
+                remaining = until - self._clock()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            pending = list(self._inflight.values())
+
+        for name, view_id, slack_client in pending:
+            logger.warning(
+                "in-flight interaction interrupted by shutdown: %s",
+                name,
+                extra={"event": "shutdown_interrupted", "listener": name},
+            )
+            if view_id and slack_client is not None:
+                try:
+                    slack_client.update_view(
+                        view_id=view_id, view=build_error_modal(SHUTDOWN_MESSAGE)
+                    )
+                except Exception:
+                    logger.exception("failed to update pending view on shutdown")
+        logger.info(
+            "shutdown drained (interrupted=%d)",
+            len(pending),
+            extra={"event": "shutdown_drained", "interrupted": len(pending)},
+        )
+        return len(pending)
+
+
+def slack_client_for(kwargs: Dict[str, Any]) -> Optional[SlackClient]:
+    """SlackClient for a wrapped handler's kwargs (shared one if injected)."""
+    ws = (kwargs.get("context") or {}).get("workspace_clients")
+    if ws is not None:
+        return ws.slack_client
+    client = kwargs.get("client")
+    return SlackClient(client) if client is not None else None
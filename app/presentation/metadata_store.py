@@ -1,35 +1,144 @@
+import json
+import os
+import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, Tuple
+
+if TYPE_CHECKING:  # only loaded when the SQLite backend is configured
+    import sqlite3
 
-_STORE: Dict[str, Dict[str, Any]] = {}
-_TS: Dict[str, float] = {}
 _TTL_SECONDS = 900  # 15 minutes
 
 
-def store(metadata: Dict[str, Any]) -> str:
-    token = uuid.uuid4().hex
-    _STORE[token] = metadata
-    _TS[token] = time.time()
-    _gc()
+class MetadataBackend(Protocol):
+    def put(self, team: str, token: str, metadata: Dict[str, Any], now: float) -> None: ...
+
+    def get(self, team: str, token: str, now: float) -> Optional[Dict[str, Any]]: ...
+
+
+class MemoryBackend:
+    """Process-local store (Socket Mode / single worker), namespaced per team.
+
+    Tokens are kept in insertion order, which is also expiry order, so
+    expired entries are dropped from the front instead of scanning all.
+    Each team has its own bound (`max_per_team`); a busy team only evicts
+    its own oldest entries.
+    """
+
+    def __init__(self, ttl: float = _TTL_SECONDS, max_per_team: int = 10_000):
+        self.ttl = ttl
+        self.max_per_team = max_per_team
+        self._lock = threading.Lock()
+        self._teams: "Dict[str, OrderedDict[str, Tuple[float, Dict[str, Any]]]]" = {}
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._teams.values())
+
+    def put(self, team: str, token: str, metadata: Dict[str, Any], now: float) -> None:
+        with self._lock:
+            items = self._teams.setdefault(team, OrderedDict())
+            items[token] = (now, metadata)
+            items.move_to_end(token)  # an overwritten token expires last again
+            while items:
+                ts, _ = next(iter(items.values()))
+                if now - ts <= self.ttl and len(items) <= self.max_per_team:
+                    break
+                items.popitem(last=False)
+
+    def get(self, team: str, token: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            items = self._teams.get(team)
+            item = items.get(token) if items is not None else None
+            if item is None:
+                return None
+            if now - item[0] > self.ttl:
+                # expired
+                items.pop(token, None)
+                return None
+            return item[1]
+
+
+class SqliteBackend:
+    """SQLite (WAL) store shared by all worker processes on one host.
+
+    One connection per thread; values are stored as JSON, keyed by (team, token).
+    """
+
+    def __init__(self, path: str, ttl: float = _TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS interaction_metadata"
+            " (team TEXT, token TEXT, ts REAL, data TEXT, PRIMARY KEY (team, token))"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS interaction_metadata_ts ON interaction_metadata (ts)"
+        )
+        conn.commit()
+
+    def _conn(self) -> "sqlite3.Connection":
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            self._local.conn = conn
+        return conn
+
+    def put(self, team: str, token: str, metadata: Dict[str, Any], now: float) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO interaction_metadata (team, token, ts, data)"
+                " VALUES (?, ?, ?, ?)",
+                (team, token, now, json.dumps(metadata)),
+            )
+            conn.execute("DELETE FROM interaction_metadata WHERE ts < ?", (now - self.ttl,))
+
+    def get(self, team: str, token: str, now: float) -> Optional[Dict[str, Any]]:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT data FROM interaction_metadata WHERE team = ? AND token = ? AND ts >= ?",
+                (team, token, now - self.ttl),
+            )
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+
+_backend: MetadataBackend = MemoryBackend()
+
+
+def configure(backend: MetadataBackend) -> MetadataBackend:
+    """Swap the backend; returns the previous one."""
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+
+def configure_from_env() -> MetadataBackend:
+    """`METADATA_STORE=sqlite:<path>` selects the shared SQLite backend."""
+    spec = os.environ.get("METADATA_STORE", "")
+    if spec.startswith("sqlite:"):
+        configure(SqliteBackend(spec[len("sqlite:") :]))
+    return _backend
+
+
+def store(
+    metadata: Dict[str, Any], team_id: Optional[str] = None, token: Optional[str] = None
+) -> str:
+    """Save under a new token, or overwrite `token` (refreshing its TTL); returns the token."""
+    token = token or uuid.uuid4().hex
+    _backend.put(team_id or "", token, metadata, time.time())
     return token
 
 
-def retrieve(token: str) -> Optional[Dict[str, Any]]:
-    md = _STORE.get(token)
-    if md is None:
-        return None
-    if time.time() - _TS.get(token, 0) > _TTL_SECONDS:
-        # expired
-        _STORE.pop(token, None)
-        _TS.pop(token, None)
-        return None
-    return md
-
-
-def _gc() -> None:
-    now = time.time()
-    expired = [k for k, ts in _TS.items() if now - ts > _TTL_SECONDS]
-    for k in expired:
-        _STORE.pop(k, None)
-        _TS.pop(k, None)
+def retrieve(token: str, team_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Tokens only resolve within the team that stored them."""
+    return _backend.get(team_id or "", token, time.time())
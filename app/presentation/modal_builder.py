@@ -1,10 +1,25 @@
-from typing import Any, Dict, List
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from app.presentation.constants import ACTION_IDS, MODAL_TITLES
 
 
-def build_initial_modal() -> Dict[str, Any]:
-    return {
+def build_initial_modal(
+    channel_name: Optional[str] = None,
+    emails_text: Optional[str] = None,
+    private_metadata: Optional[str] = None,
+    found_count: Optional[int] = None,
+    not_found_emails: Optional[List[str]] = None,
+    picked_users: Optional[Sequence[Tuple[str, str]]] = None,
+    channel_ids: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """入力モーダル。「戻る」で再表示する際は前回の入力値と解決結果のキーを引き継ぐ
+
+    `found_count` を渡すと、入力中の検証結果（見つかった/見つからない件数）を表示する。
+    `picked_users`（user_id, 表示名）はメンバー選択欄、`channel_ids` は
+    既存チャンネル選択欄の初期選択になる。
+    """
+    view = {
         "type": "modal",
         "callback_id": "channel_creation_modal",
         "title": {"type": "plain_text", "text": MODAL_TITLES["CREATE"]},
@@ -25,27 +40,129 @@ def build_initial_modal() -> Dict[str, Any]:
             {
                 "type": "input",
                 "block_id": "member_emails_input",
-                "label": {"type": "plain_text", "text": "招待するメンバーのメールアドレス"},
+                # メンバー選択欄だけでも作成できるよう任意入力
+                "optional": True,
+                # 入力の区切りごとに block_actions を送り、送信前に解決を進めておく
+                "dispatch_action": True,
+                "label": {
+                    "type": "plain_text",
+                    "text": "招待するメンバーのメールアドレス / @ユーザーグループ",
+                },
                 "element": {
                     "type": "plain_text_input",
-                    "action_id": "member_emails",
+                    "action_id": ACTION_IDS["MEMBER_EMAILS"],
                     "multiline": True,
+                    "dispatch_action_config": {"trigger_actions_on": ["on_character_entered"]},
                     "placeholder": {
                         "type": "plain_text",
                         "text": (
-                            "user1@example.com, user2@example.com\n"
-                            "（カンマまたは改行区切りで複数入力可能）"
+                            "user1@example.com, @dev-team\n（カンマまたは改行区切りで複数入力可能）"
                         ),
                     },
                 },
             },
         ],
     }
+    if channel_name:
+        view["blocks"][0]["element"]["initial_value"] = channel_name
+    if emails_text:
+        view["blocks"][1]["element"]["initial_value"] = emails_text
+    if private_metadata:
+        view["private_metadata"] = private_metadata
+    if found_count is not None:
+        view["blocks"].append(
+            {
+                "type": "context",
+                "block_id": "member_emails_status",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": _member_status_text(found_count, not_found_emails or []),
+                    }
+                ],
+            }
+        )
+    picker: Dict[str, Any] = {
+        "type": "multi_external_select",
+        "action_id": ACTION_IDS["MEMBER_USERS"],
+        "placeholder": {"type": "plain_text", "text": "名前・表示名・メールアドレスで検索"},
+        "min_query_length": 1,
+    }
+    if picked_users:
+        picker["initial_options"] = [build_user_option(uid, name) for uid, name in picked_users]
+    view["blocks"].append(
+        {
+            "type": "input",
+            "block_id": "member_users_input",
+            "optional": True,
+            "label": {"type": "plain_text", "text": "招待するメンバー（検索して選択）"},
+            "element": picker,
+        }
+    )
+    view["blocks"].append(_member_channels_block(channel_ids))
+    return view
+
+
+def _member_channels_block(channel_ids: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """既存チャンネルのメンバーをまとめて招待するための選択欄"""
+    element: Dict[str, Any] = {
+        "type": "multi_conversations_select",
+        "action_id": ACTION_IDS["MEMBER_CHANNELS"],
+        "placeholder": {"type": "plain_text", "text": "チャンネルを選択"},
+        "filter": {"include": ["public", "private"], "exclude_bot_users": True},
+    }
+    if channel_ids:
+        element["initial_conversations"] = list(channel_ids)
+    return {
+        "type": "input",
+        "block_id": "member_channels_input",
+        "optional": True,
+        "label": {"type": "plain_text", "text": "既存チャンネルのメンバーを招待"},
+        "element": element,
+    }
+
+
+def build_user_option(user_id: str, label: str) -> Dict[str, Any]:
+    """メンバー選択欄の選択肢（value はユーザーID。表示テキストは Slack 上限 75 文字）"""
+    return {"text": {"type": "plain_text", "text": _truncate(label)}, "value": user_id}
 
 
-def _users_text(users: List[Dict[str, Any]]) -> str:
-    names = [u["display_name"] for u in users]
-    return f"*招待するユーザー:*\n• {', '.join(names)}"
+def _truncate(text: str, limit: int = 75) -> str:
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _member_status_text(found_count: int, not_found_emails: List[str], shown: int = 5) -> str:
+    text = f"✅ 見つかったユーザー: {found_count} 件"
+    if not_found_emails:
+        listed = ", ".join(not_found_emails[:shown])
+        if len(not_found_emails) > shown:
+            listed += f" ほか {len(not_found_emails) - shown} 件"
+        text += f"　⚠️ 見つからないメール: {len(not_found_emails)} 件（{listed}）"
+    return text
+
+
+def _users_text(users: List[Dict[str, Any]], limit: int = 2900) -> str:
+    """招待するユーザーの一覧（section の 3000 文字上限に収まらない分は人数だけ示す）"""
+    names = [user["display_name"] for user in users]
+    return _listed_text("*招待するユーザー:*\n• ", names, "ほか {} 名", limit)
+
+
+def _not_found_text(not_found_emails: List[str], limit: int = 2900) -> str:
+    """見つからなかったメールの一覧（上限を超える分は件数だけ示す）"""
+    return _listed_text("*見つからなかったメール:*\n• ", not_found_emails, "…他{}件", limit)
+
+
+def _listed_text(header: str, items: List[str], more: str, limit: int) -> str:
+    """`header` に続けて項目をカンマ区切りで並べ、`limit` 文字を超える分は `more` で省略"""
+    shown: List[str] = []
+    length = len(header)
+    for item in items:
+        if length + len(item) + 2 > limit - 20:
+            shown.append(more.format(len(items) - len(shown)))
+            break
+        shown.append(item)
+        length += len(item) + 2
+    return header + ", ".join(shown)
 
 
 def build_confirmation_modal(
@@ -53,21 +170,30 @@ def build_confirmation_modal(
     users: List[Dict[str, Any]],
     not_found_emails: List[str],
     private_metadata_json: str,
+    suggestions: Optional[Dict[str, List[Tuple[str, str, str]]]] = None,
+    notices: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
+    """確認モーダル。`suggestions`（見つからないメール → [(候補メール, user_id, 表示名)]）は
+    ワンクリックで置き換えられる「もしかして」ボタンとして表示する。
+    `notices` は招待人数の上限で打ち切った場合などの注意書き。
+    """
     blocks = [
         {"type": "section", "text": {"type": "mrkdwn", "text": f"*チャンネル名:* {channel_name}"}},
         {"type": "section", "text": {"type": "mrkdwn", "text": _users_text(users)}},
     ]
+    for notice in notices or []:
+        blocks.append({"type": "context", "elements": [{"type": "mrkdwn", "text": notice}]})
     if not_found_emails:
         blocks.append(
             {
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*見つからなかったメール:*\n• {', '.join(not_found_emails)}",
+                    "text": _not_found_text(not_found_emails),
                 },
             }
         )
+    blocks.extend(_suggestion_blocks(suggestions or {}))
 
     blocks.append(
         {
@@ -98,6 +224,35 @@ def build_confirmation_modal(
     }
 
 
+def _suggestion_blocks(
+    suggestions: Dict[str, List[Tuple[str, str, str]]], max_misses: int = 10
+) -> List[Dict[str, Any]]:
+    blocks: List[Dict[str, Any]] = []
+    for miss, candidates in list(suggestions.items())[:max_misses]:
+        if not candidates:
+            continue
+        blocks.append(
+            {
+                "type": "context",
+                "elements": [{"type": "mrkdwn", "text": f"❓ `{miss}` はもしかして:"}],
+            }
+        )
+        buttons = []
+        for i, (email, user_id, display_name) in enumerate(candidates):
+            label = f"{display_name} <{email}>"
+            buttons.append(
+                {
+                    "type": "button",
+                    "text": {"type": "plain_text", "text": _truncate(label)},
+                    # action_id はブロック内で一意（ハンドラーは前方一致で受ける）
+                    "action_id": f"{ACTION_IDS['APPLY_SUGGESTION']}_{i}",
+                    "value": json.dumps([miss, email, user_id, display_name]),
+                }
+            )
+        blocks.append({"type": "actions", "elements": buttons})
+    return blocks
+
+
 def build_processing_modal() -> Dict[str, Any]:
     return {
         "type": "modal",
@@ -1,36 +1,256 @@
+import json
 import logging
 import os
+import re
+import signal
+import threading
+import time
 
 from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from app.application.channel_creation_service import ChannelCreationService
+from app.application.member_source_expander import (
+    MemberSourceExpander,
+    split_usergroup_handles,
+)
 from app.channel_name_normalizer import normalize_channel_name
+from app.domain.email_address_list import EmailAddressList
+from app.domain.resolved_user import ResolvedUser
 from app.email_address_parser import parse_email_addresses
+from app.infrastructure import audit_log, directory_snapshot
+from app.infrastructure.client_registry import SlackClientRegistry
+from app.infrastructure.installation import app_settings, bot_token_for, team_key
+from app.infrastructure.logging_setup import parse_sample_rates, setup_logging
+from app.infrastructure.metrics import start_metrics_server
+from app.infrastructure.outbound_scheduler import INLINE, VIEWS
+from app.infrastructure.profiling import Profiler
 from app.infrastructure.slack_client import SlackClient
+from app.infrastructure.startup import StartupReport
+from app.infrastructure.tracing import configure_tracing
+from app.presentation import metadata_store
+from app.presentation.admission import AdmissionController
 from app.presentation.constants import ACTION_IDS
 from app.presentation.error_messages import get_error_message_and_dm
+from app.presentation.instrumentation import HandlerMetrics
+from app.presentation.lifecycle import Lifecycle
 from app.presentation.modal_builder import (
     build_confirmation_modal,
     build_error_modal,
     build_initial_modal,
     build_processing_modal,
     build_success_modal,
+    build_user_option,
+)
+from app.user_resolver import (
+    AllUsersNotFoundError,
+    build_user_resolver_service,
+    resolve_users,
 )
-from app.user_resolver import resolve_users
 
+logger = logging.getLogger(__name__)
+
+# メンバー選択欄の候補数（Slack の上限は 100）
+MAX_MEMBER_OPTIONS = 50
+
+NO_MEMBERS_MESSAGE = "メールアドレスを入力するか、メンバーまたはチャンネルを選択してください。"
+
+
+def _workspace(context):
+    """create_app のミドルウェアが注入したチーム共有クライアント（未注入なら None）"""
+    return (context or {}).get("workspace_clients")
+
+
+def _slack_client(client, context=None) -> SlackClient:
+    """注入済みの共有 SlackClient を優先し、なければ従来どおり都度生成"""
+    ws = _workspace(context)
+    return ws.slack_client if ws is not None else SlackClient(client)
+
+
+def _outbound(context=None):
+    """チーム共有の書き込みスケジューラー（未注入なら呼び出し元スレッドで即時実行）"""
+    ws = _workspace(context)
+    outbound = ws.outbound if ws is not None else None
+    return outbound if outbound is not None else INLINE
+
+
+def _team_id(context):
+    """インストール単位の分離キー（Enterprise Grid の組織単位インストールは enterprise_id）"""
+    context = context or {}
+    return team_key(context.get("team_id"), context.get("enterprise_id"))
+
+
+def _resolve(client, emails, context=None, memo=None):
+    ws = _workspace(context)
+    if ws is None:
+        return resolve_users(client, emails)
+    return resolve_users(
+        client, emails, service=ws.user_resolver, memo=memo, directory=ws.directory
+    )
+
+
+def _load_metadata(view, context=None):
+    """private_metadata を読み込む（トークン参照ならストアから取得）"""
+    metadata = json.loads(view.get("private_metadata") or "{}")
+    if "token" in metadata:
+        metadata = metadata_store.retrieve(metadata["token"], team_id=_team_id(context)) or {}
+    return metadata
+
+
+def _load_memo(view, context=None):
+    """「戻る」で引き継いだ前回の解決結果（メール → ユーザー / 不在は None）を復元"""
+    return _load_draft(json.loads(view.get("private_metadata") or "{}").get("draft"), context)
 
-def handle_shortcut(ack, shortcut, client):
+
+def _load_draft(draft, context=None):
+    return _memo_from(_retrieve_draft(draft, context))
+
+
+def _retrieve_draft(draft, context=None):
+    return (metadata_store.retrieve(draft, team_id=_team_id(context)) if draft else None) or {}
+
+
+def _memo_from(saved):
+    resolved = saved.get("resolved", {})
+    return {email: ResolvedUser(*user) if user else None for email, user in resolved.items()}
+
+
+def _save_memo(memo, context=None, draft=None, entries=None):
+    """解決結果をストアに退避し、参照キー（draft）を返す（複数ワーカー間でも共有）
+
+    既存の draft があれば同じキーに上書きする（入力のたびにトークンを増やさない）。
+    entries は表示中のモーダルに反映済みの入力（入力中の検証で変化の有無を判定する）。
+    """
+    resolved = {
+        email: [user["id"], user["display_name"]] if user is not None else None
+        for email, user in memo.items()
+    }
+    saved = {"resolved": resolved}
+    if entries is not None:
+        saved["entries"] = list(entries)
+    return metadata_store.store(saved, team_id=_team_id(context), token=draft)
+
+
+def _draft_key(view):
+    """入力モーダルの private_metadata に保存した draft のキー（なければ None）"""
+    return json.loads(view.get("private_metadata") or "{}").get("draft")
+
+
+def _completed_entries(text):
+    """区切り（カンマ・改行）まで入力済みの項目だけを返す（入力途中の末尾は除く）
+
+    `taro@example.co` のように途中でも形式上は有効なアドレスを問い合わせないため。
+    """
+    text = text or ""
+    if re.search(r"[,\n]\s*$", text):
+        return text
+    completed = re.match(r"(?s)(.*)[,\n]", text)
+    return completed.group(1) if completed else ""
+
+
+def handle_shortcut(ack, shortcut, client, context=None):
     """ショートカットハンドラー"""
     ack()
 
     # 初期チャンネル作成モーダルを表示（ビルダー経由）
-    sc = SlackClient(client)
-    sc.open_view(trigger_id=shortcut["trigger_id"], view=build_initial_modal())
+    sc = _slack_client(client, context)
+    _outbound(context).call(
+        VIEWS, sc.open_view, trigger_id=shortcut["trigger_id"], view=build_initial_modal()
+    )
+
+    # メンバー検索用の名簿を先読み（未読込・期限切れならバックグラウンドで取得）
+    directory = _directory(context)
+    if directory is not None:
+        directory.ensure_fresh()
+
+
+def _directory(context):
+    ws = _workspace(context)
+    return ws.directory if ws is not None else None
+
 
+def _picked_users(values, context=None):
+    """メンバー選択欄で選ばれたユーザー（メールアドレスの解決なしで招待対象にする）"""
+    field = (values.get("member_users_input") or {}).get(ACTION_IDS["MEMBER_USERS"]) or {}
+    directory = _directory(context)
+    users = []
+    for option in field.get("selected_options") or []:
+        user = directory.index.get(option["value"]) if directory is not None else None
+        users.append(user or ResolvedUser(option["value"], option["text"]["text"]))
+    return users
 
-def handle_modal_submission(ack, view, client, body):
+
+def _selected_channels(values):
+    """既存チャンネル選択欄で選ばれたチャンネルID"""
+    field = (values.get("member_channels_input") or {}).get(ACTION_IDS["MEMBER_CHANNELS"]) or {}
+    return list(field.get("selected_conversations") or [])
+
+
+def _expand_sources(client, handles, channel_ids, context=None):
+    """@ユーザーグループ・既存チャンネルをメンバーに展開する（上限 MAX_MEMBERS 名で打ち切り）
+
+    名簿を読み込み済みなら、ボットや無効化済みのアカウントは除き表示名を付ける。
+    名簿がなければ表示名の代わりにメンション（<@U…>）を使う。
+    """
+    if not handles and not channel_ids:
+        return [], [], False
+    directory = _directory(context)
+    index = directory.index if directory is not None and directory.ready else None
+    expander = MemberSourceExpander(
+        _slack_client(client, context),
+        max_members=_max_members(),
+        is_member=(lambda user_id: index.get(user_id) is not None) if index else None,
+    )
+    expansion = expander.expand(handles, channel_ids)
+    users = [
+        (index.get(user_id) if index else None) or ResolvedUser(user_id, f"<@{user_id}>")
+        for user_id in expansion.user_ids
+    ]
+    return users, expansion.unresolved, expansion.truncated
+
+
+def handle_member_options(ack, options, context=None):
+    """メンバー選択欄の候補: 名簿のローカル索引から即答する（Slack API は呼ばない）"""
+    directory = _directory(context)
+    if directory is None:
+        ack(options=[])
+        return
+    directory.ensure_fresh()
+    hits = directory.index.search(options.get("value") or "", limit=MAX_MEMBER_OPTIONS)
+    ack(options=[build_user_option(user_id, label) for user_id, label in hits])
+
+
+def _resolve_members(client, emails, picked, context=None, memo=None):
+    """メールアドレスを解決し、選択・展開済みのメンバーを重複なく加える"""
+    user_info_list, not_found_emails = [], []
+    if emails:
+        try:
+            user_info_list, not_found_emails = _resolve(client, emails, context, memo)
+        except AllUsersNotFoundError:
+            # 選択したメンバーがいれば、見つからないメールの一覧付きで確認へ進む
+            if not picked:
+                raise
+            not_found_emails = list(emails)
+    members = {user_info["id"]: user_info for user_info in user_info_list}
+    for user in picked:
+        members.setdefault(user.id, user)
+    return list(members.values()), not_found_emails
+
+
+def handle_modal_submission(ack, view, client, body, context=None):
     """モーダル送信ハンドラー：ユーザー解決から確認モーダル表示まで統合"""
+    # メールアドレスとメンバー選択はどちらも任意だが、両方空なら入力欄にエラー表示
+    values = (view.get("state") or {}).get("values") or {}
+    emails_text = ((values.get("member_emails_input") or {}).get("member_emails") or {}).get(
+        "value"
+    )
+    picked = _picked_users(values, context)
+    channel_ids = _selected_channels(values)
+    if not (emails_text or "").strip() and not picked and not channel_ids:
+        ack(
+            response_action="errors",
+            errors={"member_emails_input": NO_MEMBERS_MESSAGE},
+        )
+        return
     ack()
 
     try:
@@ -38,16 +258,19 @@ def handle_modal_submission(ack, view, client, body):
         channel_name = view["state"]["values"]["channel_name_input"]["channel_name"]["value"]
         # Phase 2: VO 仕様に基づく正規化（既存ラッパー経由 / 挙動不変）
         channel_name = normalize_channel_name(channel_name)
-        emails_text = view["state"]["values"]["member_emails_input"]["member_emails"]["value"]
 
-        # メールアドレスを解析
-        emails = parse_email_addresses(emails_text)
+        # メールアドレスと @ユーザーグループを解析
+        emails, handles = split_usergroup_handles(parse_email_addresses(emails_text or ""))
+        expanded, unresolved, truncated = _expand_sources(client, handles, channel_ids, context)
 
-        # ユーザー解決処理を実行
-        user_info_list, not_found_emails = resolve_users(client, emails)
+        # ユーザー解決処理を実行（「戻る」からの再送信では追加・変更分のみ問い合わせ）
+        memo = _load_memo(view, context) if _workspace(context) is not None else None
+        user_info_list, not_found_emails = _resolve_members(
+            client, emails, picked + expanded, context, memo
+        )
+        not_found_emails = list(not_found_emails) + unresolved
+        user_info_list, truncated = _cap_members(user_info_list, truncated)
     except Exception as e:
-        from app.user_resolver import AllUsersNotFoundError
-
         # エラーメッセージを設定
         if isinstance(e, AllUsersNotFoundError):
             error_message = (
@@ -57,68 +280,198 @@ def handle_modal_submission(ack, view, client, body):
         else:
             error_message = f"ユーザー解決でエラーが発生しました: {str(e)}"
 
-        # エラーモーダルに差し替え（view_submissionは update の方がクライアント間で安定）
-        sc = SlackClient(client)
-        curr_view = body.get("view", {}) or view
-        view_id = curr_view.get("id")
-        if view_id:
-            sc.update_view(view_id=view_id, view=build_error_modal(error_message))
-        else:
-            # フォールバック（通常は到達しない）
-            sc.open_view(trigger_id=body["trigger_id"], view=build_error_modal(error_message))
+        _show_submission_error(client, view, body, error_message, context)
         return
 
     # UIブロックの構築は modal_builder 側へ集約済み（重複を避けるためここでは組み立てない）
 
     # チャンネル情報をprivate_metadataに保存
-    import json
-
     # UserIDのリストを抽出
     user_ids = [user_info["id"] for user_info in user_info_list]
-    metadata = {"channel_name": channel_name, "user_ids": user_ids}
-
-    # private_metadata が長すぎる場合はトークン参照に切り替え
-    pm = json.dumps(metadata)
-    if len(pm) > 2800:  # Slack 制限 3000 の手前でガード
-        from app.presentation.metadata_store import store as store_meta
-
-        token = store_meta(metadata)
-        pm = json.dumps({"token": token})
+    # 入力値と解決結果のキーも保存（「戻る」で入力モーダルに復元する）
+    metadata = {"channel_name": channel_name, "user_ids": user_ids, "emails_text": emails_text}
+    if picked:
+        metadata["picked"] = [[u.id, u.display_name] for u in picked]
+    if channel_ids:
+        metadata["channels"] = channel_ids
+    if memo is not None:
+        metadata["draft"] = _save_memo(memo, context, draft=_draft_key(view))
+    # 見つからなかったメールは監査ログと「もしかして」の置き換えで使う
+    if not_found_emails:
+        metadata["not_found"] = not_found_emails
+    # 「もしかして」候補があれば、置き換え時に確認画面を再表示できるよう表示名も保存
+    suggestions = _suggestions(not_found_emails, user_ids, context)
+    if suggestions:
+        metadata["display_names"] = [user_info["display_name"] for user_info in user_info_list]
 
     # 確認モーダルを表示（ビルダー）
-    sc = SlackClient(client)
-    sc.open_view(
+    sc = _slack_client(client, context)
+    _outbound(context).call(
+        VIEWS,
+        sc.open_view,
         trigger_id=body["trigger_id"],
         view=build_confirmation_modal(
             channel_name=channel_name,
             users=user_info_list,
             not_found_emails=not_found_emails,
-            private_metadata_json=pm,
+            private_metadata_json=_dump_metadata(metadata, context),
+            suggestions=suggestions,
+            notices=[_truncated_notice()] if truncated else None,
         ),
     )
 
 
-def handle_confirmation_button(ack, action, body, client):
+def _show_submission_error(client, view, body, error_message, context=None):
+    """エラーモーダルに差し替え（view_submissionは update の方がクライアント間で安定）
+
+    Slack 側の障害で表示できなくても例外は投げず、ログに残すだけにする。
+    """
+    sc = _slack_client(client, context)
+    outbound = _outbound(context)
+    curr_view = body.get("view", {}) or view
+    view_id = curr_view.get("id")
+    try:
+        if view_id:
+            outbound.call(
+                VIEWS, sc.update_view, view_id=view_id, view=build_error_modal(error_message)
+            )
+        else:
+            # フォールバック（通常は到達しない）
+            outbound.call(
+                VIEWS,
+                sc.open_view,
+                trigger_id=body["trigger_id"],
+                view=build_error_modal(error_message),
+            )
+    except Exception as e:
+        logger.warning(
+            "エラーモーダルを表示できません: %s", e, extra={"event": "view_update_failed"}
+        )
+
+
+def _max_members():
+    return int(os.environ.get("MAX_MEMBERS", "1000"))
+
+
+def _cap_members(users, truncated):
+    """メール・選択・展開を合わせた招待対象を MAX_MEMBERS 名までにする（メール分を優先）"""
+    limit = _max_members()
+    if len(users) <= limit:
+        return users, truncated
+    return users[:limit], True
+
+
+def _truncated_notice():
+    return f"⚠️ 一度に招待できるのは {_max_members()} 名までのため、超えた分は含めていません。"
+
+
+def _dump_metadata(metadata, context=None):
+    """private_metadata 用 JSON（長すぎる場合はトークン参照に切り替え）"""
+    pm = json.dumps(metadata)
+    if len(pm) > 2800:  # Slack 制限 3000 の手前でガード
+        token = metadata_store.store(metadata, team_id=_team_id(context))
+        pm = json.dumps({"token": token})
+    return pm
+
+
+def _suggestions(not_found_emails, user_ids, context=None, limit=3):
+    """見つからないメールごとの「もしかして」候補（招待済みのユーザーは除く）"""
+    directory = _directory(context)
+    if directory is None or not not_found_emails:
+        return {}
+    if not directory.ready:
+        directory.ensure_fresh()  # 次回以降に備えて読み込みだけ開始
+        return {}
+    invited = set(user_ids)
+    suggestions = {}
+    for miss in not_found_emails:
+        candidates = [
+            (email, user.id, user.display_name)
+            for email, user in directory.suggester.suggest(miss, limit=limit)
+            if user.id not in invited
+        ]
+        if candidates:
+            suggestions[miss] = candidates
+    return suggestions
+
+
+def _replace_address(text, old, new):
+    """入力テキスト中のメールアドレスを 1 件置き換える（他のアドレスの一部には一致させない）"""
+    pattern = r"(?<![\w.+-])" + re.escape(old) + r"(?![\w.-])"
+    return re.sub(pattern, new, text or "", count=1, flags=re.IGNORECASE)
+
+
+def handle_apply_suggestion(ack, action, body, client, context=None):
+    """「もしかして」ボタン: 見つからなかったメールを候補に置き換え、確認画面を更新する"""
+    ack()
+    view = body.get("view") or {}
+    view_id = view.get("id")
+    if not view_id:
+        return
+    miss, email, user_id, display_name = json.loads(action["value"])
+    metadata = _load_metadata(view, context)
+    user_ids = list(metadata.get("user_ids", []))
+    names = list(metadata.get("display_names") or user_ids)
+    if user_id not in user_ids:
+        user_ids.append(user_id)
+        names.append(display_name)
+    not_found_emails = [e for e in metadata.get("not_found", []) if e != miss]
+    metadata.update(
+        user_ids=user_ids,
+        display_names=names,
+        not_found=not_found_emails,
+        emails_text=_replace_address(metadata.get("emails_text"), miss, email),
+    )
+    # 置き換えたアドレスは解決済みとして draft に追加（「戻る」→ 再送信でも問い合わせない）
+    if metadata.get("draft"):
+        memo = _load_draft(metadata["draft"], context)
+        memo[email] = ResolvedUser(user_id, display_name)
+        metadata["draft"] = _save_memo(memo, context, draft=metadata["draft"])
+
+    updated = build_confirmation_modal(
+        channel_name=metadata.get("channel_name", ""),
+        users=[ResolvedUser(uid, name) for uid, name in zip(user_ids, names)],
+        not_found_emails=not_found_emails,
+        private_metadata_json=_dump_metadata(metadata, context),
+        suggestions=_suggestions(not_found_emails, user_ids, context),
+    )
+    _update_unless_changed(_slack_client(client, context), view, updated, context)
+
+
+def _update_unless_changed(sc, view, new_view, context=None):
+    """hash 付きで views.update（後続の操作で更新済みなら上書きしない）"""
+    try:
+        _outbound(context).call(
+            VIEWS, sc.update_view, view_id=view["id"], view=new_view, hash=view.get("hash")
+        )
+    except Exception as e:
+        response = getattr(e, "response", None)
+        error = response.get("error") if hasattr(response, "get") else None
+        if error != "hash_conflict":
+            logger.warning(
+                "モーダルを更新できません: %s",
+                error or e,
+                extra={"event": "view_update_failed"},
+            )
+
+
+def handle_confirmation_button(ack, action, body, client, context=None):
     """確認ボタンアクションハンドラー：チャンネル作成から成功・失敗処理まで統合"""
     ack()
 
-    logging.info("確認ボタンが押されました")
+    logger.debug("確認ボタンが押されました", extra={"event": "confirm_clicked"})
+    started = time.perf_counter()
 
     # 「作成中...」モーダルに更新
     view = body["view"]
-    logging.info(f"モーダル更新: view_id={view['id']}")
-    sc = SlackClient(client)
-    sc.update_view(view_id=view["id"], view=build_processing_modal())
+    logger.debug("モーダル更新: view_id=%s", view["id"], extra={"event": "view_processing"})
+    sc = _slack_client(client, context)
+    # モーダル更新 > 招待 > DM の優先度で送信（DM は後回しにしてまとめて送る）
+    outbound = _outbound(context)
+    _update_view_quietly(outbound, sc, view["id"], build_processing_modal())
 
     # private_metadataからチャンネル情報を取得
-    import json
-
-    metadata = json.loads(view.get("private_metadata", "{}"))
-    if "token" in metadata:
-        from app.presentation.metadata_store import retrieve as load_meta
-
-        loaded = load_meta(metadata["token"]) or {}
-        metadata = loaded
+    metadata = _load_metadata(view, context)
     channel_name = metadata.get("channel_name")
     user_ids = metadata.get("user_ids", [])
     user_id = body["user"]["id"]
@@ -127,87 +480,403 @@ def handle_confirmation_button(ack, action, body, client):
     if user_id not in user_ids:
         user_ids.append(user_id)
 
-    logging.info(f"チャンネル作成開始: name={channel_name}, user_ids={user_ids}")
+    # user_ids 全件は extra（構造化ログ側で切り詰め）に渡し、本文には件数のみ
+    logger.info(
+        "チャンネル作成開始: name=%s, members=%d",
+        channel_name,
+        len(user_ids),
+        extra={"event": "channel_create_start", "channel_name": channel_name, "user_ids": user_ids},
+    )
 
+    # 作成・招待の進み具合（途中で失敗しても監査ログに作成済みチャンネルと招待済みを残す）
+    progress = {"channel_id": None, "invited": [], "create_ms": None}
     try:
-        # チャンネル作成処理（サービスへ委譲）
-        logging.info(f"conversations_create実行: name={channel_name}, is_private=True")
-        service = ChannelCreationService(sc)
-        channel_id = service.create_private_channel(channel_name, user_ids)
-        logging.info(f"チャンネル作成成功: channel_id={channel_id}")
-
-        # 成功モーダルを表示
-        sc.update_view(view_id=view["id"], view=build_success_modal(channel_name))
-
-        # 完了通知DMを送信
-        sc.post_message(
-            channel=user_id, text=f"チャンネル「#{channel_name}」の作成が完了しました。"
-        )
+        _create_and_invite(sc, outbound, channel_name, user_ids, progress)
+    except Exception as e:
+        _report_creation_failure(e, outbound, sc, view, user_id, channel_name)
+        _audit(context, user_id, metadata, user_ids, started, progress, error=e)
+        return
+
+    # 作成と招待が済んだ時点で記録（この後の表示や DM の失敗で結果を取り違えない）
+    _audit(context, user_id, metadata, user_ids, started, progress)
 
+    # 成功モーダルを表示
+    _update_view_quietly(outbound, sc, view["id"], build_success_modal(channel_name))
+
+    # 完了通知DMを送信（失敗してもチャンネルは作成済みのため、ログに残すだけ）
+    try:
+        outbound.notify(
+            user_id, f"チャンネル「#{channel_name}」の作成が完了しました。", sc.post_message
+        )
     except Exception as e:
-        # エラーログを出力
-        logging.error(f"チャンネル作成エラー: {type(e).__name__}: {str(e)}")
-        if hasattr(e, "response"):
-            logging.error(f"Slack APIレスポンス: {e.response}")
+        logger.warning("完了通知DMを送信できません: %s", e, extra={"event": "notify_failed"})
+
+
+def _create_and_invite(sc, outbound, channel_name, user_ids, progress):
+    """チャンネル作成と招待（サービスへ委譲）。作成した ID と招待済みを progress に記録"""
+    logger.debug("conversations_create実行: name=%s, is_private=True", channel_name)
+    service = ChannelCreationService(sc, outbound=outbound)
+    create_started = time.perf_counter()
+    channel_id = service.create_channel(channel_name)
+    progress["channel_id"] = channel_id
+    logger.info(
+        "チャンネル作成成功: channel_id=%s",
+        channel_id,
+        extra={"event": "channel_created", "channel_id": channel_id},
+    )
+    service.invite(channel_id, user_ids, invited=progress["invited"])
+    progress["create_ms"] = (time.perf_counter() - create_started) * 1000
+
+
+def _report_creation_failure(e, outbound, sc, view, user_id, channel_name):
+    """作成・招待の失敗をログに残し、エラーモーダル（方針によっては DM も）で通知"""
+    # レスポンス全体ではなくエラーコードのみ記録
+    response = getattr(e, "response", None)
+    logger.error(
+        "チャンネル作成エラー: %s: %s",
+        type(e).__name__,
+        e,
+        extra={
+            "event": "channel_create_failed",
+            "channel_name": channel_name,
+            "slack_error": response.get("error") if hasattr(response, "get") else None,
+        },
+    )
+
+    # エラーメッセージとDM方針を取得
+    error_message, send_dm = get_error_message_and_dm(e)
+
+    # エラーモーダルを表示（ビルダー）
+    _update_view_quietly(outbound, sc, view["id"], build_error_modal(error_message))
 
-        # エラーメッセージとDM方針を取得
-        error_message, send_dm = get_error_message_and_dm(e)
+    # 方針に応じてDMでも通知
+    if send_dm:
+        try:
+            outbound.notify(user_id, error_message, sc.post_message)
+        except Exception as dm_error:
+            logger.warning(
+                "エラー通知DMを送信できません: %s", dm_error, extra={"event": "notify_failed"}
+            )
 
-        # エラーモーダルを表示（ビルダー）
-        sc.update_view(view_id=view["id"], view=build_error_modal(error_message))
 
-        # 方針に応じてDMでも通知
-        if send_dm:
-            sc.post_message(channel=user_id, text=error_message)
+def _update_view_quietly(outbound, sc, view_id, new_view):
+    """モーダル更新（失敗してもログに残すだけで、作成処理やエラー処理は止めない）"""
+    try:
+        outbound.call(VIEWS, sc.update_view, view_id=view_id, view=new_view)
+    except Exception as e:
+        logger.warning("モーダルを更新できません: %s", e, extra={"event": "view_update_failed"})
+
+
+def _audit(context, requester, metadata, user_ids, started, progress, error=None):
+    """作成結果を監査ログへ（キューに積むだけで、書き込みは専用スレッド）
+
+    event は channel_created / channel_invite_failed（作成済み・招待の途中で失敗）/
+    channel_create_failed（未作成）。招待済みのユーザーは成功したバッチの分だけ記録する。
+    """
+    error_code = None
+    if error is not None:
+        response = getattr(error, "response", None)
+        error_code = response.get("error") if hasattr(response, "get") else None
+        error_code = error_code or type(error).__name__
+    timings = {"total_ms": round((time.perf_counter() - started) * 1000, 1)}
+    if progress["create_ms"] is not None:
+        timings["create_invite_ms"] = round(progress["create_ms"], 1)
+    if error is None:
+        event = "channel_created"
+    else:
+        event = "channel_invite_failed" if progress["channel_id"] else "channel_create_failed"
+    audit_log.record(
+        {
+            "event": event,
+            "team_id": _team_id(context),
+            "requester": requester,
+            "channel_id": progress["channel_id"],
+            "channel_name": metadata.get("channel_name"),
+            "invited_user_ids": list(progress["invited"]),
+            "requested_user_ids": list(user_ids),
+            "not_found_emails": metadata.get("not_found", []),
+            "error": error_code,
+            "timings": timings,
+        }
+    )
 
 
-def handle_cancel_button(ack, action, body, client):
+def handle_cancel_button(ack, action, body, client, context=None):
     """キャンセルボタン: 確認画面 → 入力画面に戻す（views.update を使用）。"""
     # まず3秒以内にack
     ack()
-    # その後、現在の view を初期モーダルに差し替え
+    # その後、現在の view を入力値を復元した初期モーダルに差し替え
     view = body.get("view", {})
     view_id = view.get("id")
     if view_id:
-        SlackClient(client).update_view(view_id=view_id, view=build_initial_modal())
+        metadata = _load_metadata(view, context)
+        draft = metadata.get("draft")
+        initial = build_initial_modal(
+            channel_name=metadata.get("channel_name"),
+            emails_text=metadata.get("emails_text"),
+            private_metadata=json.dumps({"draft": draft}) if draft else None,
+            picked_users=[tuple(user) for user in metadata.get("picked", [])],
+            channel_ids=metadata.get("channels"),
+        )
+        sc = _slack_client(client, context)
+        _outbound(context).call(VIEWS, sc.update_view, view_id=view_id, view=initial)
+
+
+def handle_member_emails_input(ack, action, body, client, context=None):
+    """メール入力中の検証（dispatch_action）: 追加・変更分だけを解決し、件数を表示する
+
+    解決結果は draft として引き継ぐため、「確認する」の時点では問い合わせが済んでいる。
+    """
+    ack()
+    view = body.get("view") or {}
+    view_id = view.get("id")
+    if not view_id:
+        return
+
+    # @ユーザーグループは送信時に展開するため、ここではメールアドレスだけを検証
+    # 入力途中の末尾は区切りが入力されてから（または送信時に）解決する
+    text = _completed_entries(action.get("value"))
+    emails, _ = split_usergroup_handles(parse_email_addresses(text))
+    draft = _draft_key(view)
+    saved = _retrieve_draft(draft, context)
+    # 区切りまでの内容が表示中の結果と同じ（入力途中の文字だけ変化）なら保存も更新もしない
+    # （views.update のレート制限枠は「確認する」と共有のため、同じ内容を送らない）
+    if (saved.get("entries") if draft else []) == emails:
+        return
 
+    ws = _workspace(context)
+    service = (
+        ws.user_resolver if ws is not None else build_user_resolver_service(SlackClient(client))
+    )
+    memo = _memo_from(saved)
+    try:
+        users, not_found_emails = service.resolve(
+            EmailAddressList(emails), memo=memo, directory=_directory(context)
+        )
+    except Exception as e:
+        # 送信時に改めて解決されるため、ここでは表示を更新しないだけ
+        logger.warning(
+            "入力中のユーザー解決に失敗: %s", e, extra={"event": "live_validation_failed"}
+        )
+        return
 
-def create_app():
-    """Slack Boltアプリケーションを作成"""
-    app = App()
+    draft = _save_memo(memo, context, draft=draft, entries=emails)
+    updated = build_initial_modal(
+        private_metadata=json.dumps({"draft": draft}),
+        found_count=len(users),
+        not_found_emails=not_found_emails,
+    )
+    # 後続の入力で view が更新済みなら古い結果で上書きしない
+    _update_unless_changed(_slack_client(client, context), view, updated, context)
+
+
+def create_app(
+    registry: SlackClientRegistry | None = None,
+    metrics: HandlerMetrics | None = None,
+    profiler: Profiler | None = None,
+    lifecycle: Lifecycle | None = None,
+    admission: AdmissionController | None = None,
+):
+    """Slack Boltアプリケーションを作成
+
+    SLACK_CLIENT_ID が設定されていれば OAuth（複数ワークスペース・インストールストア）、
+    なければ従来どおり SLACK_BOT_TOKEN の単一ワークスペース。
+    """
+    app = App(**app_settings())
+    if registry is None:
+        # setup_runtime で名簿の更新を始めたレジストリがあれば引き継ぐ
+        registry = _runtime_registry if _runtime_registry is not None else SlackClientRegistry()
+    if metrics is None:
+        metrics = HandlerMetrics()
+    if profiler is None:
+        profiler = Profiler.from_env()
+    if lifecycle is None:
+        lifecycle = Lifecycle()
+    if admission is None:
+        admission = AdmissionController.from_env()
+
+    def wrap(name, handler, admit=False):
+        # 計測（外側）→ 実行中の追跡（停止時のドレイン用）→ [流量制御] → プロファイル → 本体
+        inner = profiler.wrap(name, handler)
+        if admit:
+            inner = admission.wrap(name, inner)
+        return metrics.instrument(name, lifecycle.track(name, inner))
+
+    # 受信時刻の記録（ack 遅延の計測起点）
+    app.middleware(metrics.middleware())
+
+    # 停止処理中は新しい操作を受け付けない
+    app.middleware(lifecycle.middleware())
+
+    # チーム単位の共有クライアントを context に注入（リクエスト毎の再生成を避ける）
+    @app.middleware
+    def inject_workspace_clients(context, next):
+        context["workspace_clients"] = registry.get(
+            team_key(context.team_id, context.enterprise_id), context.bot_token, context.client
+        )
+        next()
 
     # ショートカットハンドラー
-    app.shortcut("create_channel_shortcut")(handle_shortcut)
+    app.shortcut("create_channel_shortcut")(wrap("create_channel_shortcut", handle_shortcut))
+
+    # モーダル送信ハンドラー（ユーザー解決: 同時実行数・件数を制限）
+    app.view("channel_creation_modal")(
+        wrap("channel_creation_modal", handle_modal_submission, admit=True)
+    )
+
+    # 確認/キャンセル ボタンアクションハンドラー（作成・招待: 同時実行数を制限）
+    app.action(ACTION_IDS["CONFIRM"])(
+        wrap(ACTION_IDS["CONFIRM"], handle_confirmation_button, admit=True)
+    )
+    app.action(ACTION_IDS["CANCEL"])(wrap(ACTION_IDS["CANCEL"], handle_cancel_button))
 
-    # モーダル送信ハンドラー
-    app.view("channel_creation_modal")(handle_modal_submission)
+    # メンバー選択欄の候補（名簿のローカル索引から応答）
+    app.options(ACTION_IDS["MEMBER_USERS"])(wrap(ACTION_IDS["MEMBER_USERS"], handle_member_options))
 
-    # 確認/キャンセル ボタンアクションハンドラー
-    app.action(ACTION_IDS["CONFIRM"])(handle_confirmation_button)
-    app.action(ACTION_IDS["CANCEL"])(handle_cancel_button)
+    # 「もしかして」候補への置き換え（ボタンごとに action_id の末尾が異なる）
+    app.action(re.compile(f"^{ACTION_IDS['APPLY_SUGGESTION']}_\\d+$"))(
+        wrap(ACTION_IDS["APPLY_SUGGESTION"], handle_apply_suggestion)
+    )
+
+    # メール入力中の検証（送信前に解決を済ませておく）
+    app.action(ACTION_IDS["MEMBER_EMAILS"])(
+        wrap(ACTION_IDS["MEMBER_EMAILS"], handle_member_emails_input)
+    )
+
+    # 管理者用プロファイル切り替えコマンド（PROFILE_ADMIN_USER_IDS 設定時のみ）
+    admin_ids = {u.strip() for u in os.environ.get("PROFILE_ADMIN_USER_IDS", "").split(",")}
+    admin_ids.discard("")
+    if admin_ids:
+        # 利用時のみ読み込む（起動時間の短縮）
+        from app.presentation.admin_commands import build_profile_command_handler
+
+        # HTTP_WORKERS は http_server が fork 前に設定（切り替えは 1 プロセスにしか届かない）
+        app.command(os.environ.get("PROFILE_COMMAND", "/channel-gen-profile"))(
+            build_profile_command_handler(
+                profiler, admin_ids, workers=int(os.environ.get("HTTP_WORKERS", "1"))
+            )
+        )
 
     return app
 
 
-if __name__ == "__main__":
-    # ログ設定
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# setup_runtime が作成したチーム共有クライアント（create_app が引き継ぐ）
+_runtime_registry: SlackClientRegistry | None = None
+
+
+def warm_directories(registry, snapshots, token_for=bot_token_for):
+    """スナップショットを読み込んだチームごとに、名簿の更新（users.list）を起動時に始める
+
+    更新されるまでは古いスナップショット（退職・無効化済みのユーザーを含みうる）で
+    解決するため、最初の操作を待たずに反映する。トークンが見つからないチームは飛ばす。
+    """
+    started = 0
+    for team in snapshots.teams():
+        if snapshots.load(team) is None:
+            continue
+        token = token_for(team)
+        if not token:
+            logger.warning(
+                "名簿を更新できません（トークンなし）: team=%s",
+                team,
+                extra={"event": "directory_warm_skipped", "team_id": team},
+            )
+            continue
+        directory = registry.get(team, token).directory
+        if directory is not None:
+            directory.ensure_fresh()
+            started += 1
+    return started
+
+
+def setup_runtime(metrics_port_offset: int = 0):
+    """ログ・トレース・メトリクス・メタデータストアの初期化（Socket Mode / HTTP 共通）
+
+    起動したログ用 QueueListener を返す（終了時に stop() でフラッシュ）。
+    """
+    global _runtime_registry
+    # ログ設定（キュー経由で専用スレッドが整形・出力。LOG_FORMAT=text で従来形式）
+    log_listener = setup_logging(
+        level=getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO),
+        fmt=os.environ.get("LOG_FORMAT", "json"),
+        sample_rates=parse_sample_rates(os.environ.get("LOG_SAMPLE_RATES")),
     )
 
+    # Slack API 呼び出しのトレース出力先（例: TRACE_SINKS=log,metrics,ring:500）
+    configure_tracing(os.environ.get("TRACE_SINKS"))
+
+    # private_metadata 退避先（複数ワーカー時は METADATA_STORE=sqlite:<path> で共有）
+    metadata_store.configure_from_env()
+
+    # 名簿のスナップショット（DIRECTORY_SNAPSHOT_DIR）をメモリマップ。再起動直後から
+    # メール解決に使い、users.list による更新はバックグラウンドで反映・保存し直す
+    snapshots = directory_snapshot.configure_from_env()
+    if snapshots is not None:
+        _runtime_registry = SlackClientRegistry()
+        warm_directories(_runtime_registry, snapshots)
+
+    # 監査ログ（AUDIT_LOG=<path>。専用スレッドがまとめて追記・fsync・ローテーション）
+    audit_log.configure_from_env(worker=metrics_port_offset)
+
+    # メトリクス（Prometheus テキスト形式 /metrics）を別スレッドで公開
+    metrics_port = os.environ.get("METRICS_PORT")
+    if metrics_port:
+        port = int(metrics_port) + metrics_port_offset
+        start_metrics_server(port)
+        print(f"📈 Metrics endpoint: http://0.0.0.0:{port}/metrics")
+
+    return log_listener
+
+
+def run_until_signalled(
+    connect, disconnect, lifecycle: Lifecycle, startup: StartupReport | None = None
+) -> None:
+    """SIGTERM/SIGINT まで待機し、受付停止 → 実行中の処理をドレインしてから戻る"""
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, lambda signum, frame: stop.set())
+
+    connect()
+    if startup is not None:
+        startup.mark("connected")
+    stop.wait()
+    print("🛑 Shutting down: draining in-flight interactions...")
+    lifecycle.accepting = False
+    disconnect()
+    lifecycle.shutdown(float(os.environ.get("SHUTDOWN_DRAIN_SECONDS", "20")))
+
+
+if __name__ == "__main__":
     # 環境変数の確認
     slack_bot_token = os.environ.get("SLACK_BOT_TOKEN")
     slack_app_token = os.environ.get("SLACK_APP_TOKEN")
 
-    if not slack_bot_token:
-        raise ValueError("SLACK_BOT_TOKEN environment variable is required")
+    # 複数ワークスペース（SLACK_CLIENT_ID）ではトークンをインストールストアから取得
+    if not slack_bot_token and not os.environ.get("SLACK_CLIENT_ID"):
+        raise ValueError("SLACK_BOT_TOKEN (or SLACK_CLIENT_ID) environment variable is required")
     if not slack_app_token:
         raise ValueError("SLACK_APP_TOKEN environment variable is required")
 
+    log_listener = setup_runtime()
+    # 起動時間の内訳（プロセス開始からの秒数。初回 ack まで計測）
+    startup = StartupReport()
+    startup.mark("runtime_ready")
+
     # アプリケーションを作成
-    app = create_app()
+    lifecycle = Lifecycle()
+    metrics = HandlerMetrics()
+    metrics.on_first_ack = startup.first_ack
+    app = create_app(metrics=metrics, lifecycle=lifecycle)
+    startup.mark("app_created")
+
+    # ソケットモードで起動（SIGTERM で切断し、作成中の処理を待ってから終了）
+    # アダプターはソケットモード起動時のみ読み込む
+    from slack_bolt.adapter.socket_mode import SocketModeHandler
 
-    # ソケットモードで起動
     handler = SocketModeHandler(app, slack_app_token)
     print("⚡️ Slack app is running in socket mode!")
-    handler.start()
+    try:
+        run_until_signalled(handler.connect, handler.close, lifecycle, startup)
+    finally:
+        audit_log.close()
+        log_listener.stop()
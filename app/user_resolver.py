@@ -1,3 +1,9 @@
+import os
+
+from app.application.user_lookup_cache import UserLookupCache
+from app.application.user_resolver_service import UserResolverService
+from app.domain.email_address_list import EmailAddressList
+from app.domain.email_address_validator import EmailAddressValidator
 from app.infrastructure.slack_client import SlackClient
 
 
@@ -7,14 +13,37 @@ class AllUsersNotFoundError(Exception):
     pass
 
 
-def resolve_users(slack_client, email_list):
-    """互換APIを維持したラッパー: 内部でサービスを呼び出す"""
-    from app.application.user_resolver_service import UserResolverService
-    from app.domain.email_address_list import EmailAddressList
-
-    api = SlackClient(slack_client)
-    service = UserResolverService(slack_api=api)
-    user_info_list, not_found_emails = service.resolve(EmailAddressList(email_list))
+def build_user_lookup_cache():
+    """チーム単位のユーザー解決キャッシュ（USER_CACHE_SIZE / USER_CACHE_TTL）"""
+    return UserLookupCache(
+        max_size=int(os.environ.get("USER_CACHE_SIZE", "5000")),
+        ttl=float(os.environ.get("USER_CACHE_TTL", "600")),
+    )
+
+
+def build_user_resolver_service(slack_api, cache=None):
+    """環境設定（ALLOWED_EMAIL_DOMAINS）を反映した UserResolverService を生成"""
+    # 社外ドメイン等は Slack API を呼ばずに不在扱い（未設定なら構文チェックのみ）
+    validator = EmailAddressValidator.from_csv(os.environ.get("ALLOWED_EMAIL_DOMAINS"))
+    return UserResolverService(slack_api=slack_api, validator=validator, cache=cache)
+
+
+def resolve_users(slack_client, email_list, service=None, memo=None, directory=None):
+    """互換APIを維持したラッパー: 内部でサービスを呼び出す
+
+    `service` を渡すと（レジストリ共有のインスタンス等）それを使い、都度生成しない。
+    `memo`（メール → 解決結果）を渡すと前回の結果を再利用し、新しい結果を書き足す。
+    `directory`（名簿。起動時のスナップショットを含む）にいるユーザーは API を呼ばずに解決する。
+    """
+    if service is None:
+        service = build_user_resolver_service(SlackClient(slack_client))
+    emails = EmailAddressList(email_list)
+    options = {}
+    if memo is not None:
+        options["memo"] = memo
+    if directory is not None:
+        options["directory"] = directory
+    user_info_list, not_found_emails = service.resolve(emails, **options)
 
     # 全員が見つからなかった場合は例外を発生（従来仕様）
     if not user_info_list and not_found_emails:
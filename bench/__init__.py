@@ -0,0 +1 @@
+# Offline benchmarking / load-testing tools (not imported by the app)
@@ -0,0 +1,44 @@
+"""Compare two benchmark JSON files (pytest-benchmark format) by median time.
+
+Usage:
+    python -m bench.compare OLD.json NEW.json [--threshold 0.1]
+
+Exits 1 when any benchmark's median got slower by more than `threshold`.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+
+def _medians(path: str) -> Dict[str, float]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {b["fullname"]: b["stats"]["median"] for b in data.get("benchmarks", [])}
+
+
+def compare(old: Dict[str, float], new: Dict[str, float], threshold: float) -> List[str]:
+    regressions = []
+    for name in sorted(set(old) & set(new)):
+        ratio = new[name] / old[name] if old[name] else 1.0
+        flag = " REGRESSION" if ratio > 1 + threshold else ""
+        before, after = old[name] * 1e6, new[name] * 1e6
+        print(f"{name:<90} {before:>11.1f}us -> {after:>11.1f}us  x{ratio:.2f}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    regressions: List[Any] = compare(_medians(args.old), _medians(args.new), args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Minimal offline stand-in for pytest-benchmark's `benchmark` fixture.
+
+When pytest-benchmark is installed it is used as-is (`--benchmark-json` etc.).
+Otherwise this fallback times each benchmark with perf_counter (auto-calibrated
+rounds) and `--benchmark-json PATH` writes a compatible subset of its JSON so
+results can be compared across commits with `python -m bench.compare`.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+
+    HAVE_PLUGIN = True
+except ImportError:
+    HAVE_PLUGIN = False
+
+_RESULTS: List[Dict[str, Any]] = []
+_MIN_TIME = 0.2  # seconds of sampling per benchmark
+_MAX_ROUNDS = 10_000
+
+
+class _Benchmark:
+    def __init__(self, name: str, fullname: str):
+        self.name = name
+        self.fullname = fullname
+        self.extra_info: Dict[str, Any] = {}
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = fn(*args, **kwargs)  # warm-up
+        samples: List[float] = []
+        deadline = time.perf_counter() + _MIN_TIME
+        while len(samples) < 5 or (time.perf_counter() < deadline and len(samples) < _MAX_ROUNDS):
+            t0 = time.perf_counter()
+            fn(*args, **kwargs)
+            samples.append(time.perf_counter() - t0)
+        _RESULTS.append(
+            {
+                "name": self.name,
+                "fullname": self.fullname,
+                "extra_info": self.extra_info,
+                "stats": {
+                    "min": min(samples),
+                    "max": max(samples),
+                    "mean": statistics.fmean(samples),
+                    "median": statistics.median(samples),
+                    "stddev": statistics.pstdev(samples),
+                    "rounds": len(samples),
+                },
+            }
+        )
+        return result
+
+
+if not HAVE_PLUGIN:
+
+    def pytest_addoption(parser: pytest.Parser) -> None:
+        parser.addoption("--benchmark-json", default=None, help="write results as JSON")
+
+    @pytest.fixture
+    def benchmark(request: pytest.FixtureRequest) -> _Benchmark:
+        return _Benchmark(request.node.name, request.node.nodeid)
+
+    def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+        if not _RESULTS:
+            return
+        terminalreporter.write_sep("-", "benchmark (fallback timer)")
+        for r in _RESULTS:
+            s = r["stats"]
+            terminalreporter.write_line(
+                f"{r['name']:<60} median {s['median'] * 1e6:>12.1f} us  "
+                f"mean {s['mean'] * 1e6:>12.1f} us  rounds {s['rounds']}"
+            )
+        path = config.getoption("--benchmark-json")
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(_report(), f, indent=2, ensure_ascii=False)
+
+
+def _report() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=False
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "machine_info": {"python_version": platform.python_version(), "node": platform.node()},
+        "commit_info": {"id": commit},
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "benchmarks": _RESULTS,
+    }
@@ -0,0 +1,373 @@
+"""Local stand-in for the Slack Web API (load / latency testing only).
+
+Implements the methods this app calls so that the real
+`slack_sdk.WebClient` -> `SlackClient` path can be exercised offline:
+
+    users.lookupByEmail, users.list, usergroups.list, usergroups.users.list,
+    conversations.create, conversations.invite, conversations.members,
+    views.open, views.update, chat.postMessage
+
+Features:
+- seeded user directory (`user{i}@example.com`, deterministic per seed)
+- per-method latency distributions (`constant:MS`, `uniform:LO:HI`, `lognormal:MEDIAN_MS:SIGMA`)
+- 429 injection with Retry-After (per-method probability)
+- per-method call counters
+
+Usage:
+    python -m bench.fake_slack_api --port 8765 --users 5000 \\
+        --latency users.lookupByEmail=lognormal:40:0.6 --ratelimit users.lookupByEmail=0.05
+
+    WebClient(token="xoxb-fake", base_url="http://127.0.0.1:8765/api/")
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+LatencySampler = Callable[[random.Random], float]
+
+# SDK method name (FakeSlackState attribute) -> Web API method name
+API_METHODS: Dict[str, str] = {
+    "users_lookupByEmail": "users.lookupByEmail",
+    "users_list": "users.list",
+    "usergroups_list": "usergroups.list",
+    "usergroups_users_list": "usergroups.users.list",
+    "conversations_create": "conversations.create",
+    "conversations_invite": "conversations.invite",
+    "conversations_members": "conversations.members",
+    "views_open": "views.open",
+    "views_update": "views.update",
+    "chat_postMessage": "chat.postMessage",
+}
+_SDK_NAMES = {api: sdk for sdk, api in API_METHODS.items()}
+
+
+def parse_latency(spec: str) -> LatencySampler:
+    """`constant:MS` | `uniform:LO:HI` | `lognormal:MEDIAN_MS:SIGMA` -> seconds sampler."""
+    kind, *args = spec.split(":")
+    nums = [float(a) for a in args]
+    if kind == "constant":
+        return lambda rng: nums[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(nums[0], nums[1]) / 1000
+    if kind == "lognormal":
+        mu = math.log(nums[0])
+        return lambda rng: rng.lognormvariate(mu, nums[1]) / 1000
+    raise ValueError(f"unknown latency spec: {spec}")
+
+
+def seed_directory(count: int, seed: int = 0, domain: str = "example.com") -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    family = ["sato", "suzuki", "takahashi", "tanaka", "ito", "watanabe", "yamamoto", "nakamura"]
+    given = ["taro", "hanako", "ken", "yui", "sho", "mei", "ren", "aoi"]
+    users = []
+    for i in range(count):
+        name = f"{rng.choice(given)}.{rng.choice(family)}"
+        users.append(
+            {
+                "id": f"U{i:08d}",
+                "name": name,
+                "deleted": rng.random() < 0.01,
+                "profile": {
+                    "email": f"user{i}@{domain}",
+                    "display_name": f"{name}{i}",
+                    "real_name": name.replace(".", " ").title(),
+                },
+            }
+        )
+    return users
+
+
+class FakeSlackState:
+    """Mutable fake workspace shared by all request threads."""
+
+    def __init__(
+        self,
+        users: List[Dict[str, Any]],
+        latency: Optional[Dict[str, LatencySampler]] = None,
+        ratelimit: Optional[Dict[str, float]] = None,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        self.users = users
+        self.by_email = {u["profile"]["email"]: u for u in users}
+        self.latency = latency or {}
+        self.ratelimit = ratelimit or {}
+        self.retry_after = retry_after
+        self.channels: Dict[str, Dict[str, Any]] = {}
+        self.members: Dict[str, set] = {}
+        self.usergroups: Dict[str, Dict[str, Any]] = {}
+        self.views: Dict[str, Dict[str, Any]] = {}
+        self.messages: List[Dict[str, Any]] = []
+        self.calls: Counter = Counter()
+        self.throttled: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def _next_id(self, prefix: str) -> str:
+        self._seq += 1
+        return f"{prefix}{self._seq:09d}"
+
+    def add_usergroup(self, handle: str, user_ids: List[str]) -> str:
+        with self._lock:
+            group_id = self._next_id("S")
+            self.usergroups[group_id] = {"id": group_id, "handle": handle, "users": list(user_ids)}
+        return group_id
+
+    def add_channel(self, name: str, user_ids: List[str]) -> str:
+        """Existing channel whose members can be listed (e.g. to clone a 2,000-member channel)."""
+        with self._lock:
+            channel = {"id": self._next_id("C"), "name": name, "is_private": False}
+            self.channels[name] = channel
+            self.members[channel["id"]] = set(user_ids)
+        return channel["id"]
+
+    def record_call(self, method: str) -> None:
+        with self._lock:
+            self.calls[method] += 1
+
+    def delay_for(self, method: str) -> float:
+        sampler = self.latency.get(method) or self.latency.get("*")
+        if sampler is None:
+            return 0.0
+        with self._lock:
+            return max(0.0, sampler(self._rng))
+
+    def should_throttle(self, method: str) -> bool:
+        p = self.ratelimit.get(method, self.ratelimit.get("*", 0.0))
+        with self._lock:
+            hit = p > 0 and self._rng.random() < p
+            if hit:
+                self.throttled[method] += 1
+            return hit
+
+    # --- API methods: params -> response body ---
+    def users_lookupByEmail(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        user = self.by_email.get(str(p.get("email", "")).lower())
+        if user is None:
+            return {"ok": False, "error": "users_not_found"}
+        return {"ok": True, "user": user}
+
+    def users_list(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        limit = int(p.get("limit") or 200)
+        start = int(p.get("cursor") or 0)
+        page = self.users[start : start + limit]
+        nxt = start + limit if start + limit < len(self.users) else ""
+        return {"ok": True, "members": page, "response_metadata": {"next_cursor": str(nxt)}}
+
+    def usergroups_list(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        groups = [{"id": g["id"], "handle": g["handle"]} for g in self.usergroups.values()]
+        return {"ok": True, "usergroups": groups}
+
+    def usergroups_users_list(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        group = self.usergroups.get(str(p.get("usergroup", "")))
+        if group is None:
+            return {"ok": False, "error": "no_such_subteam"}
+        return {"ok": True, "users": group["users"]}
+
+    def conversations_members(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        members = self.members.get(str(p.get("channel", "")))
+        if members is None:
+            return {"ok": False, "error": "channel_not_found"}
+        limit = int(p.get("limit") or 100)
+        start = int(p.get("cursor") or 0)
+        ordered = sorted(members)
+        nxt = start + limit if start + limit < len(ordered) else ""
+        return {
+            "ok": True,
+            "members": ordered[start : start + limit],
+            "response_metadata": {"next_cursor": str(nxt)},
+        }
+
+    def conversations_create(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        name = p.get("name", "")
+        with self._lock:
+            if name in self.channels:
+                return {"ok": False, "error": "name_taken"}
+            channel = {"id": self._next_id("C"), "name": name, "is_private": True}
+            self.channels[name] = channel
+            self.members[channel["id"]] = set()
+        return {"ok": True, "channel": channel}
+
+    def conversations_invite(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        channel_id = p.get("channel", "")
+        users = [u for u in str(p.get("users", "")).split(",") if u]
+        with self._lock:
+            if channel_id not in self.members:
+                return {"ok": False, "error": "channel_not_found"}
+            self.members[channel_id].update(users)
+        return {"ok": True, "channel": {"id": channel_id}}
+
+    def views_open(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        view = _as_dict(p.get("view"))
+        with self._lock:
+            view_id = self._next_id("V")
+            self.views[view_id] = view
+        return {"ok": True, "view": {**view, "id": view_id}}
+
+    def views_update(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        view_id = p.get("view_id", "")
+        with self._lock:
+            if view_id not in self.views:
+                return {"ok": False, "error": "not_found"}
+            self.views[view_id] = _as_dict(p.get("view"))
+        return {"ok": True, "view": {**self.views[view_id], "id": view_id}}
+
+    def chat_postMessage(self, p: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.messages.append({"channel": p.get("channel"), "text": p.get("text")})
+        return {"ok": True, "channel": p.get("channel"), "ts": f"{time.time():.6f}"}
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return {}
+    return value if isinstance(value, dict) else {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # silence per-request logging
+        pass
+
+    def _params(self) -> Dict[str, Any]:
+        url = urlparse(self.path)
+        params: Dict[str, Any] = dict(parse_qsl(url.query))
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            raw = self.rfile.read(length).decode("utf-8")
+            if "json" in (self.headers.get("Content-Type") or ""):
+                params.update(json.loads(raw or "{}"))
+            else:
+                params.update(parse_qsl(raw))
+        return params
+
+    def _dispatch(self) -> None:
+        state = self.server.state
+        method = urlparse(self.path).path.rsplit("/", 1)[-1]
+        params = self._params()
+        fn = getattr(state, _SDK_NAMES.get(method, ""), None)
+        if fn is None:
+            self._send(404, {"ok": False, "error": "unknown_method"})
+            return
+        state.record_call(method)
+        delay = state.delay_for(method)
+        if delay:
+            time.sleep(delay)
+        if state.should_throttle(method):
+            self._send(
+                429,
+                {"ok": False, "error": "ratelimited"},
+                {"Retry-After": str(state.retry_after)},
+            )
+            return
+        self._send(200, fn(params))
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+
+    def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    state: FakeSlackState
+
+
+class FakeSlackServer:
+    """Runs a FakeSlackState behind a threaded HTTP server (context manager)."""
+
+    def __init__(self, state: FakeSlackState, host: str = "127.0.0.1", port: int = 0):
+        self.state = state
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.state = state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/api/"
+
+    def start(self) -> "FakeSlackServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeSlackServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def parse_pairs(items: List[str], convert: Callable[[str], Any]) -> Dict[str, Any]:
+    result = {}
+    for item in items:
+        method, _, value = item.partition("=")
+        result[method] = convert(value)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", action="append", default=[], help="METHOD|*=SPEC")
+    parser.add_argument("--ratelimit", action="append", default=[], help="METHOD|*=PROB")
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    state = FakeSlackState(
+        seed_directory(args.users, args.seed),
+        latency=parse_pairs(args.latency, parse_latency),
+        ratelimit=parse_pairs(args.ratelimit, float),
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = FakeSlackServer(state, args.host, args.port)
+    print(f"fake Slack Web API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps({"calls": state.calls, "throttled": state.throttled}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""End-to-end concurrent load test of the interaction flow.
+
+Drives `handle_shortcut` -> `handle_modal_submission` -> `handle_confirmation_button`
+for N simulated concurrent users against a latency-injecting client, and reports:
+
+- ack latency (handler entry -> ack()) per handler
+- time to confirmation modal (submission entry -> confirmation views.open returned)
+- time to channel created (confirm entry -> success views.update returned)
+- Slack API calls per interaction (total and per method)
+
+By default the client is in-process (FakeSlackState + sampled sleeps); with
+`--base-url` the real `WebClient` is used against `bench.fake_slack_api`.
+
+Usage:
+    python -m bench.load_interactions --users 50 --emails 20 \\
+        --latency '*=lognormal:30:0.5' --save bench_results/load.json
+    # regression gate (exit 1 when a p90 regresses by more than 20%)
+    python -m bench.load_interactions --users 50 --emails 20 \\
+        --baseline bench_results/load.json --tolerance 0.2
+"""
+
+import argparse
+import contextvars
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from slack_sdk.errors import SlackApiError
+
+from bench.fake_slack_api import (
+    API_METHODS,
+    FakeSlackState,
+    parse_latency,
+    parse_pairs,
+    seed_directory,
+)
+
+BENCH_TEAM_ID = "TBENCH"
+
+METRICS = (
+    "ack_shortcut",
+    "ack_submission",
+    "ack_confirmation",
+    "time_to_confirmation_modal",
+    "time_to_channel_created",
+)
+
+
+class _Response(dict):
+    """dict response carrying HTTP status / headers like SlackResponse."""
+
+    def __init__(self, body: Dict[str, Any], status_code: int = 200, headers=None):
+        super().__init__(body)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class LatencyClient:
+    """In-process WebClient stand-in backed by FakeSlackState (sleep + 429 injection)."""
+
+    def __init__(self, state: FakeSlackState):
+        self._state = state
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = API_METHODS.get(name)
+        if method is None:
+            raise AttributeError(name)
+        fn = getattr(self._state, name)
+
+        def call(**kwargs: Any) -> _Response:
+            self._state.record_call(method)
+            delay = self._state.delay_for(method)
+            if delay:
+                time.sleep(delay)
+            if self._state.should_throttle(method):
+                headers = {"Retry-After": str(self._state.retry_after)}
+                raise SlackApiError(
+                    "ratelimited", _Response({"ok": False, "error": "ratelimited"}, 429, headers)
+                )
+            body = fn(kwargs)
+            if not body.get("ok"):
+                raise SlackApiError(body.get("error", "error"), _Response(body))
+            return _Response(body)
+
+        return call
+
+
+class Recorder:
+    """API calls of one simulated interaction (found through a ContextVar, so calls made
+    on the outbound scheduler's worker threads are attributed to the right interaction)."""
+
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+        self.on_call: Optional[Callable[[str, Dict[str, Any], Any], None]] = None
+
+
+_recorder: contextvars.ContextVar[Optional[Recorder]] = contextvars.ContextVar(
+    "bench_recorder", default=None
+)
+
+
+class CountingClient:
+    """Proxy shared by all interactions of a team: counts calls per Slack method into the
+    current interaction's `Recorder` (calls outside one, e.g. the directory refresh thread,
+    go to `background`) and reports each call to the recorder's `on_call`."""
+
+    def __init__(self, target: Any):
+        self._target = target
+        self.background: Counter = Counter()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        fn = getattr(self._target, name)
+
+        def call(**kwargs: Any) -> Any:
+            recorder = _recorder.get()
+            (recorder.calls if recorder is not None else self.background)[name] += 1
+            resp = fn(**kwargs)
+            if recorder is not None and recorder.on_call is not None:
+                recorder.on_call(name, kwargs, resp)
+            return resp
+
+        return call
+
+
+def build_workspace(client: CountingClient) -> Any:
+    """Per-team clients as the Bolt middleware injects them in production: shared
+    SlackClient, lookup cache, member directory and outbound scheduler."""
+    from app.infrastructure.client_registry import SlackClientRegistry
+
+    registry = SlackClientRegistry(web_client_factory=lambda token, template: client)
+    return registry.get(BENCH_TEAM_ID, "xoxb-bench")
+
+
+def _timed_ack(t0: float, out: Dict[str, float], key: str) -> Callable[..., None]:
+    def ack(*args: Any, **kwargs: Any) -> None:
+        out[key] = time.perf_counter() - t0
+
+    return ack
+
+
+def run_interaction(
+    index: int, client: CountingClient, emails: List[str], workspace: Any = None
+) -> Dict[str, Any]:
+    """One user's shortcut -> submission -> confirmation, with `workspace` injected into
+    `context` like the production middleware (None measures the no-registry fallback)."""
+    result: Dict[str, Any] = {}
+    marks: Dict[str, Any] = {}
+
+    def on_call(method: str, kwargs: Dict[str, Any], resp: Any) -> None:
+        view = kwargs.get("view") or {}
+        if method == "views_open" and view.get("callback_id") == "channel_creation_confirmation":
+            marks["confirmation"] = time.perf_counter()
+            marks["confirmation_view"] = {
+                "id": resp["view"]["id"],
+                "private_metadata": view.get("private_metadata", "{}"),
+            }
+        if method == "views_update" and "✅" in json.dumps(view, ensure_ascii=False):
+            marks["created"] = time.perf_counter()
+
+    recorder = Recorder()
+    recorder.on_call = on_call
+    token = _recorder.set(recorder)
+    try:
+        _run_flow(index, client, emails, workspace, result, marks)
+    finally:
+        _recorder.reset(token)
+    result["api_calls"] = dict(recorder.calls)
+    return result
+
+
+def _run_flow(
+    index: int,
+    client: CountingClient,
+    emails: List[str],
+    workspace: Any,
+    result: Dict[str, Any],
+    marks: Dict[str, Any],
+) -> None:
+    from app.slack_app import (
+        handle_confirmation_button,
+        handle_modal_submission,
+        handle_shortcut,
+    )
+
+    context = {"workspace_clients": workspace, "team_id": BENCH_TEAM_ID} if workspace else None
+    user_id = f"U{index:08d}"
+
+    t0 = time.perf_counter()
+    handle_shortcut(
+        ack=_timed_ack(t0, result, "ack_shortcut"),
+        shortcut={"trigger_id": f"trigger-{index}", "user": {"id": user_id}},
+        client=client,
+        context=context,
+    )
+
+    view = {
+        "id": f"V-initial-{index}",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": f"load-{index}-{time.time_ns()}"}},
+                "member_emails_input": {"member_emails": {"value": ",".join(emails)}},
+            }
+        },
+    }
+    t0 = time.perf_counter()
+    handle_modal_submission(
+        ack=_timed_ack(t0, result, "ack_submission"),
+        view=view,
+        client=client,
+        body={"user": {"id": user_id}, "trigger_id": f"trigger-{index}", "view": view},
+        context=context,
+    )
+    if "confirmation" in marks:
+        result["time_to_confirmation_modal"] = marks["confirmation"] - t0
+
+        t0 = time.perf_counter()
+        handle_confirmation_button(
+            ack=_timed_ack(t0, result, "ack_confirmation"),
+            action={"action_id": "confirm_creation"},
+            body={"user": {"id": user_id}, "view": marks["confirmation_view"]},
+            client=client,
+            context=context,
+        )
+        if "created" in marks:
+            result["time_to_channel_created"] = marks["created"] - t0
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    s = sorted(values)
+
+    def pick(q: float) -> float:
+        return s[min(len(s) - 1, int(round(q * (len(s) - 1))))]
+
+    return {
+        "count": len(s),
+        "p50": pick(0.50),
+        "p90": pick(0.90),
+        "p99": pick(0.99),
+        "max": s[-1],
+    }
+
+
+def summarize(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "interactions": len(results),
+        "elapsed_seconds": elapsed,
+        "metrics": {m: percentiles([r[m] for r in results if m in r]) for m in METRICS},
+    }
+    per_method: Counter = Counter()
+    for r in results:
+        per_method.update(r["api_calls"])
+    n = max(1, len(results))
+    report["api_calls_per_interaction"] = {
+        "total": sum(per_method.values()) / n,
+        "by_method": {k: v / n for k, v in sorted(per_method.items())},
+    }
+    report["failed"] = sum(1 for r in results if "time_to_channel_created" not in r)
+    return report
+
+
+def run_load(
+    users: int,
+    emails_per_user: int,
+    make_client: Callable[[], Any],
+    directory_size: int,
+    not_found_ratio: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    rng = random.Random(seed)
+
+    def email_list() -> List[str]:
+        return [
+            f"missing{rng.randrange(10**6)}@example.com"
+            if rng.random() < not_found_ratio
+            else f"user{rng.randrange(directory_size)}@example.com"
+            for _ in range(emails_per_user)
+        ]
+
+    lists = [email_list() for _ in range(users)]
+    lock = threading.Lock()
+    results: List[Dict[str, Any]] = []
+
+    # all simulated users belong to one team, sharing its clients as in production
+    client = CountingClient(make_client())
+    workspace = build_workspace(client)
+
+    def one(i: int) -> None:
+        r = run_interaction(i, client, lists[i], workspace)
+        with lock:
+            results.append(r)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(one, range(users)))
+    workspace.outbound.close()  # deferred completion DMs
+    report = summarize(results, time.perf_counter() - started)
+    report["background_api_calls"] = dict(sorted(client.background.items()))
+    return report
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Return regressions: p90 latencies or API calls/interaction above baseline * (1 + tol)."""
+    regressions = []
+    for metric, stats in baseline.get("metrics", {}).items():
+        base = stats.get("p90")
+        curr = report["metrics"].get(metric, {}).get("p90")
+        if base and curr is not None and curr > base * (1 + tolerance):
+            regressions.append(f"{metric}.p90: {curr:.4f}s > {base:.4f}s (+{tolerance:.0%})")
+    base_calls = baseline.get("api_calls_per_interaction", {}).get("total")
+    curr_calls = report["api_calls_per_interaction"]["total"]
+    if base_calls and curr_calls > base_calls * (1 + tolerance):
+        regressions.append(f"api_calls_per_interaction: {curr_calls:.1f} > {base_calls:.1f}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20, help="concurrent simulated users")
+    parser.add_argument("--emails", type=int, default=10, help="emails per submission")
+    parser.add_argument("--directory-size", type=int, default=5000)
+    parser.add_argument("--not-found-ratio", type=float, default=0.1)
+    parser.add_argument("--latency", action="append", default=[], help="METHOD|*=SPEC")
+    parser.add_argument("--ratelimit", action="append", default=[], help="METHOD|*=PROB")
+    parser.add_argument("--base-url", help="use real WebClient against bench.fake_slack_api")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the JSON report to this path")
+    parser.add_argument("--baseline", help="compare against a saved report")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    if args.base_url:
+        from slack_sdk import WebClient
+
+        def make_client() -> Any:
+            return WebClient(token="xoxb-fake", base_url=args.base_url)
+
+    else:
+        state = FakeSlackState(
+            seed_directory(args.directory_size, args.seed),
+            latency=parse_pairs(args.latency, parse_latency),
+            ratelimit=parse_pairs(args.ratelimit, float),
+            seed=args.seed,
+        )
+
+        def make_client() -> Any:
+            return LatencyClient(state)
+
+    report = run_load(
+        args.users,
+        args.emails,
+        make_client,
+        args.directory_size,
+        not_found_ratio=args.not_found_ratio,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
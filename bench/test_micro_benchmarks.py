@@ -0,0 +1,84 @@
+"""Micro-benchmarks for domain value objects, modal builders and metadata_store.
+
+Run offline (pytest-benchmark if installed, otherwise the fallback in conftest):
+    pipenv run pytest bench -q --benchmark-json bench-$(git rev-parse --short HEAD).json
+    pipenv run python -m bench.compare bench-OLD.json bench-NEW.json
+"""
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from app.domain import channel_name as channel_name_module
+from app.domain.channel_name import ChannelName
+from app.domain.email_address_list import EmailAddressList
+from app.presentation import metadata_store
+from app.presentation.error_messages import get_error_message_and_dm
+from app.presentation.modal_builder import build_confirmation_modal
+
+RAW_CHANNEL_NAMES = {
+    "ascii_valid": "project-alpha_2025",
+    "ascii_mixed": "Project Alpha / Q3 Kickoff!!",
+    "fullwidth": "ｐｒｏｊｅｃｔ　ａｌｐｈａ　２０２５",
+}
+
+
+@pytest.mark.parametrize("kind", list(RAW_CHANNEL_NAMES))
+def test_channel_name_from_raw_string_cold(benchmark, kind):
+    raw = RAW_CHANNEL_NAMES[kind]
+
+    def run():
+        channel_name_module._normalize.cache_clear()
+        return ChannelName.from_raw_string(raw)
+
+    benchmark(run)
+
+
+def test_channel_name_from_raw_string_memoized(benchmark):
+    raw = RAW_CHANNEL_NAMES["fullwidth"]
+    benchmark(ChannelName.from_raw_string, raw)
+
+
+@pytest.mark.parametrize("count", [10, 500, 5000])
+def test_email_address_list_from_raw_string(benchmark, count):
+    text = "\n".join(f" User{i}@Example.com," for i in range(count))
+    result = benchmark(EmailAddressList.from_raw_string, text)
+    assert len(result.values) == count
+
+
+@pytest.mark.parametrize("count", [10, 500, 5000])
+def test_build_confirmation_modal(benchmark, count):
+    users = [{"id": f"U{i:08d}", "display_name": f"ユーザー{i}"} for i in range(count)]
+    not_found = [f"missing{i}@example.com" for i in range(count // 10)]
+    benchmark(build_confirmation_modal, "project-alpha", users, not_found, '{"token": "x"}')
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        SlackApiError("name_taken", {"error": "name_taken"}),
+        Exception("permission denied"),
+        Exception("something else"),
+    ],
+    ids=["name_taken", "permission", "other"],
+)
+def test_get_error_message_and_dm(benchmark, exc):
+    benchmark(get_error_message_and_dm, exc)
+
+
+@pytest.fixture
+def live_tokens():
+    saved = metadata_store.configure(metadata_store.MemoryBackend())
+    tokens = [
+        metadata_store.store({"channel_name": "c", "user_ids": ["U1"]}) for _ in range(10_000)
+    ]
+    yield tokens
+    metadata_store.configure(saved)
+
+
+def test_metadata_store_store_with_10k_live_tokens(benchmark, live_tokens):
+    benchmark(metadata_store.store, {"channel_name": "c", "user_ids": ["U1"]})
+
+
+def test_metadata_store_retrieve_with_10k_live_tokens(benchmark, live_tokens):
+    token = live_tokens[len(live_tokens) // 2]
+    assert benchmark(metadata_store.retrieve, token) is not None
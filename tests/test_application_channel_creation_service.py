@@ -28,3 +28,43 @@ def test_create_private_channel_and_invite_users_returns_id():
     assert ch_id == "C123"
     assert stub.created == [("team-x", True)]
     assert stub.invited == [("C123", ("U1", "U2"))]
+
+
+def test_invites_are_sent_in_batches_of_the_api_limit():
+    from app.application.channel_creation_service import (
+        INVITE_BATCH_SIZE,
+        ChannelCreationService,
+    )
+
+    stub = FacadeStub()
+    user_ids = [f"U{i}" for i in range(INVITE_BATCH_SIZE + 5)]
+    ChannelCreationService(slack_api=stub).create_private_channel("team-x", user_ids)
+
+    assert [len(users) for _, users in stub.invited] == [INVITE_BATCH_SIZE, 5]
+    assert [u for _, users in stub.invited for u in users] == user_ids
+
+
+def test_invite_reports_batches_sent_before_a_failure():
+    from app.application.channel_creation_service import (
+        INVITE_BATCH_SIZE,
+        ChannelCreationService,
+    )
+
+    class FailingSecondBatch(FacadeStub):
+        def invite_users(self, channel_id, user_ids):
+            if self.invited:
+                raise RuntimeError("ratelimited")
+            return super().invite_users(channel_id, user_ids)
+
+    stub = FailingSecondBatch()
+    user_ids = [f"U{i}" for i in range(INVITE_BATCH_SIZE + 5)]
+    svc = ChannelCreationService(slack_api=stub)
+    channel_id = svc.create_channel("team-x")
+    invited = []
+    try:
+        svc.invite(channel_id, user_ids, invited=invited)
+    except RuntimeError:
+        pass
+
+    assert channel_id == "C123"
+    assert invited == user_ids[:INVITE_BATCH_SIZE]
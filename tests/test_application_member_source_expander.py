@@ -0,0 +1,101 @@
+"""Application: MemberSourceExpander（@ユーザーグループ・既存チャンネルのメンバー展開）"""
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from app.application.member_source_expander import MemberSourceExpander, split_usergroup_handles
+
+
+class SourcesStub:
+    def __init__(self, groups=None, channels=None):
+        self.groups = groups or {}  # handle -> (id, [user_id])
+        self.channels = channels or {}  # channel_id -> [user_id]
+        self.member_calls = []
+
+    def list_usergroups(self):
+        return {
+            "ok": True,
+            "usergroups": [{"id": gid, "handle": h} for h, (gid, _) in self.groups.items()],
+        }
+
+    def list_usergroup_users(self, usergroup):
+        for gid, users in self.groups.values():
+            if gid == usergroup:
+                return {"ok": True, "users": users}
+        raise SlackApiError("no_such_subteam", {"ok": False, "error": "no_such_subteam"})
+
+    def list_conversation_members(self, channel, cursor=None, limit=200):
+        self.member_calls.append((channel, cursor))
+        if channel not in self.channels:
+            raise SlackApiError("channel_not_found", {"ok": False, "error": "channel_not_found"})
+        members = self.channels[channel]
+        start = int(cursor or 0)
+        end = start + limit
+        return {
+            "ok": True,
+            "members": members[start:end],
+            "response_metadata": {"next_cursor": str(end) if end < len(members) else ""},
+        }
+
+
+def test_split_usergroup_handles():
+    assert split_usergroup_handles(["a@example.com", "@dev", "@", "b@example.com"]) == (
+        ["a@example.com", "@", "b@example.com"],
+        ["dev"],
+    )
+
+
+def test_expand_streams_pages_and_deduplicates_across_sources():
+    api = SourcesStub(
+        groups={"dev": ("S1", ["U1", "U2"])},
+        channels={"C1": ["U2", "U3", "U4", "U5", "U6"]},
+    )
+    expander = MemberSourceExpander(api, page_size=2)
+
+    result = expander.expand(["Dev"], ["C1"])
+
+    assert result.user_ids == ["U1", "U2", "U3", "U4", "U5", "U6"]
+    assert result.unresolved == []
+    assert result.truncated is False
+    assert api.member_calls == [("C1", None), ("C1", "2"), ("C1", "4")]
+
+
+def test_expand_stops_fetching_at_the_cap():
+    api = SourcesStub(channels={"C1": [f"U{i}" for i in range(10)], "C2": ["U99"]})
+    expander = MemberSourceExpander(api, max_members=3, page_size=2)
+
+    result = expander.expand([], ["C1", "C2"])
+
+    assert result.user_ids == ["U0", "U1", "U2"]
+    assert result.truncated is True
+    assert api.member_calls == [("C1", None), ("C1", "2")]
+
+
+def test_exactly_max_members_is_not_truncated():
+    """上限ちょうど（以降は重複のみ）なら打ち切りではない"""
+    api = SourcesStub(channels={"C1": ["U0", "U1", "U2"], "C2": ["U2", "U0"]})
+    expander = MemberSourceExpander(api, max_members=3)
+
+    result = expander.expand([], ["C1", "C2"])
+
+    assert result.user_ids == ["U0", "U1", "U2"]
+    assert result.truncated is False
+
+
+def test_unknown_sources_are_reported_and_filtered_members_skipped():
+    api = SourcesStub(groups={"dev": ("S1", ["U1", "B1"])}, channels={})
+    expander = MemberSourceExpander(api, is_member=lambda uid: uid.startswith("U"))
+
+    result = expander.expand(["dev", "nobody"], ["C404"])
+
+    assert result.user_ids == ["U1"]
+    assert result.unresolved == ["@nobody", "<#C404>"]
+
+
+def test_transient_errors_propagate():
+    class Flaky(SourcesStub):
+        def list_conversation_members(self, channel, cursor=None, limit=200):
+            raise SlackApiError("ratelimited", {"ok": False, "error": "ratelimited"})
+
+    with pytest.raises(SlackApiError):
+        MemberSourceExpander(Flaky()).expand([], ["C1"])
@@ -0,0 +1,33 @@
+"""Application: UserLookupCache（チーム単位のユーザー解決キャッシュ）"""
+
+from app.application.user_lookup_cache import NOT_FOUND, UserLookupCache
+
+
+def test_hits_misses_and_ttls():
+    now = [0.0]
+    cache = UserLookupCache(ttl=100, negative_ttl=10, clock=lambda: now[0])
+    cache.put("a@example.com", {"id": "U1", "display_name": "A"})
+    cache.put("x@example.com", None)
+
+    assert cache.get("a@example.com") == {"id": "U1", "display_name": "A"}
+    assert cache.get("x@example.com") is NOT_FOUND
+    assert cache.get("unknown@example.com") is None
+
+    now[0] = 50  # 見つからなかった結果は短い TTL で失効
+    assert cache.get("x@example.com") is None
+    assert cache.get("a@example.com") is not None
+    now[0] = 101
+    assert cache.get("a@example.com") is None
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_lru_eviction_is_bounded():
+    cache = UserLookupCache(max_size=2)
+    cache.put("a", {"id": "A"})
+    cache.put("b", {"id": "B"})
+    cache.get("a")  # a を最近使用に
+    cache.put("c", {"id": "C"})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": "A"}
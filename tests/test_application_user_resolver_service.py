@@ -4,6 +4,7 @@ Application: UserResolverService
 
 from typing import Any, Dict
 
+import pytest
 from slack_sdk.errors import SlackApiError
 
 
@@ -63,3 +64,119 @@ def test_resolve_treats_api_errors_as_not_found():
 
     assert users == []
     assert not_found == ["err@example.com"]
+
+
+def test_resolve_rejects_invalid_entries_without_api_calls():
+    from unittest.mock import Mock
+
+    from app.application.user_resolver_service import UserResolverService
+    from app.domain.email_address_validator import EmailAddressValidator
+
+    facade = Mock()
+    facade.lookup_user_by_email.return_value = {
+        "ok": True,
+        "user": {"id": "U111", "profile": {"display_name": "太郎"}},
+    }
+
+    service = UserResolverService(
+        slack_api=facade, validator=EmailAddressValidator(["example.com"])
+    )
+    users, not_found = service.resolve(
+        ["太郎 <user1@example.com>", "broken@", "someone@other.co.jp"]
+    )
+
+    facade.lookup_user_by_email.assert_called_once_with(email="user1@example.com")
+    assert users == [{"id": "U111", "display_name": "太郎"}]
+    assert not_found == ["broken@", "someone@other.co.jp"]
+
+
+def test_resolve_raises_transient_errors_instead_of_not_found():
+    import pytest
+
+    from app.application.user_resolver_service import UserResolverService
+    from app.infrastructure.slack_client import CircuitOpenError
+
+    facade = FacadeStub(raises={"a@example.com": CircuitOpenError("open")})
+    service = UserResolverService(slack_api=facade)
+
+    with pytest.raises(CircuitOpenError):
+        service.resolve(["a@example.com"])
+
+
+def test_resolve_with_cache_reuses_hits_and_misses_across_calls():
+    from app.application.user_lookup_cache import UserLookupCache
+    from app.application.user_resolver_service import UserResolverService
+
+    class CountingStub(FacadeStub):
+        calls = 0
+
+        def lookup_user_by_email(self, email: str) -> Dict[str, Any]:
+            CountingStub.calls += 1
+            return super().lookup_user_by_email(email)
+
+    stub = CountingStub(user_db={"a@example.com": {"id": "U1", "display_name": "Alice"}})
+    service = UserResolverService(slack_api=stub, cache=UserLookupCache())
+
+    first = service.resolve(["a@example.com", "x@example.com"])
+    second = service.resolve(["a@example.com", "x@example.com"])
+
+    assert first == second == ([{"id": "U1", "display_name": "Alice"}], ["x@example.com"])
+    assert CountingStub.calls == 2  # 2 回目はキャッシュのみ
+    # 返り値は不変なので、キャッシュ済みの同じオブジェクトを共有できる
+    with pytest.raises(TypeError):
+        first[0][0]["display_name"] = "changed"
+    assert first[0][0] is second[0][0]
+
+
+def test_resolve_with_memo_only_looks_up_new_addresses():
+    from app.application.user_resolver_service import UserResolverService
+
+    class CountingStub(FacadeStub):
+        looked_up: list = []
+
+        def lookup_user_by_email(self, email: str) -> Dict[str, Any]:
+            CountingStub.looked_up.append(email)
+            return super().lookup_user_by_email(email)
+
+    stub = CountingStub(
+        user_db={
+            "a@example.com": {"id": "U1", "display_name": "Alice"},
+            "b@example.com": {"id": "U2", "display_name": "Bob"},
+        }
+    )
+    service = UserResolverService(slack_api=stub)
+    memo: Dict[str, Any] = {}
+
+    service.resolve(["a@example.com", "x@example.com"], memo=memo)
+    users, not_found = service.resolve(
+        ["a@example.com", "x@example.com", "b@example.com"], memo=memo
+    )
+
+    assert users == [{"id": "U1", "display_name": "Alice"}, {"id": "U2", "display_name": "Bob"}]
+    assert not_found == ["x@example.com"]
+    # 2 回目は追加された b のみ問い合わせ（不在の x もメモから再利用）
+    assert CountingStub.looked_up == ["a@example.com", "x@example.com", "b@example.com"]
+    assert memo["x@example.com"] is None
+
+
+def test_resolve_consults_the_directory_before_the_api():
+    from unittest.mock import Mock
+
+    from app.application.user_resolver_service import UserResolverService
+    from app.domain.resolved_user import ResolvedUser
+    from app.domain.user_directory import UserDirectory
+
+    facade = Mock(wraps=FacadeStub({"new@example.com": {"id": "U999", "display_name": "新人"}}))
+    directory = Mock()
+    directory.lookup.side_effect = UserDirectory.build([("known@example.com", "U111", "太郎")]).get
+    svc = UserResolverService(slack_api=facade)
+
+    users, not_found = svc.resolve(
+        ["known@example.com", "new@example.com", "gone@example.com"], directory=directory
+    )
+
+    assert users == [ResolvedUser("U111", "太郎"), ResolvedUser("U999", "新人")]
+    assert not_found == ["gone@example.com"]
+    # 名簿にいないアドレスだけ API で確認（入社直後など名簿が古い場合に備える）
+    looked_up = [c.kwargs["email"] for c in facade.lookup_user_by_email.call_args_list]
+    assert looked_up == ["new@example.com", "gone@example.com"]
@@ -0,0 +1,102 @@
+"""Application: WorkspaceDirectory（users.list 由来の名簿と検索索引の更新）"""
+
+from app.application.workspace_directory import WorkspaceDirectory, iter_members
+
+
+class PagedUsers:
+    def __init__(self, pages):
+        self.pages = pages
+        self.cursors = []
+
+    def list_users(self, cursor=None, limit=200):
+        self.cursors.append(cursor)
+        index = int(cursor or 0)
+        next_cursor = str(index + 1) if index + 1 < len(self.pages) else ""
+        return {
+            "ok": True,
+            "members": self.pages[index],
+            "response_metadata": {"next_cursor": next_cursor},
+        }
+
+
+def _member(uid, name, **extra):
+    return {"id": uid, "profile": {"display_name": name, "email": f"{name}@example.com"}, **extra}
+
+
+def test_iter_members_paginates_and_skips_deleted_and_bots():
+    api = PagedUsers(
+        [
+            [_member("U1", "taro"), _member("U2", "old", deleted=True)],
+            [_member("B1", "bot", is_bot=True), _member("USLACKBOT", "slackbot")],
+            [_member("U3", "hanako")],
+        ]
+    )
+
+    assert [m["id"] for m in iter_members(api)] == ["U1", "U3"]
+    assert api.cursors == [None, "1", "2"]
+
+
+def test_ensure_fresh_loads_in_background_once_and_refreshes_when_stale():
+    now = [0.0]
+    spawned = []
+    api = PagedUsers([[_member("U1", "taro")]])
+    directory = WorkspaceDirectory(
+        api, refresh_interval=100, clock=lambda: now[0], spawn=spawned.append
+    )
+
+    directory.ensure_fresh()
+    directory.ensure_fresh()  # 実行中は重ねて起動しない
+    assert len(spawned) == 1 and not directory.ready
+    assert directory.index.search("taro") == []
+
+    spawned.pop()()
+    assert directory.ready
+    assert [uid for uid, _ in directory.index.search("taro")] == ["U1"]
+
+    now[0] = 50
+    directory.ensure_fresh()
+    assert spawned == []
+    now[0] = 150
+    directory.ensure_fresh()
+    assert len(spawned) == 1
+
+
+def test_failed_refresh_keeps_previous_index():
+    api = PagedUsers([[_member("U1", "taro")]])
+    spawned = []
+    directory = WorkspaceDirectory(api, refresh_interval=0, spawn=spawned.append)
+    directory.refresh()
+
+    def failing(cursor=None, limit=200):
+        raise RuntimeError("ratelimited")
+
+    api.list_users = failing
+    directory.ensure_fresh()
+    spawned.pop()()  # 例外はログに出すだけ
+
+    assert [uid for uid, _ in directory.index.search("taro")] == ["U1"]
+    directory.ensure_fresh()
+    assert len(spawned) == 1  # 失敗後も再試行できる
+
+
+def test_snapshot_answers_lookups_until_refresh_reconciles_and_saves():
+    from app.domain.resolved_user import ResolvedUser
+    from app.domain.user_directory import UserDirectory
+
+    saved = []
+    snapshot = UserDirectory.build(
+        [("taro@example.com", "U1", "taro"), ("left@example.com", "U9", "left")]
+    )
+    api = PagedUsers([[_member("U1", "taro"), _member("U3", "hanako")]])
+    directory = WorkspaceDirectory(api, users=snapshot, on_refresh=saved.append)
+
+    # 起動直後（users.list 未取得）でもスナップショットから解決できる
+    assert not directory.ready
+    assert directory.lookup("left@example.com") == ResolvedUser("U9", "left")
+    assert api.cursors == []
+
+    directory.refresh()
+
+    assert directory.lookup("left@example.com") is None  # 退職者は反映で消える
+    assert directory.lookup("HANAKO@example.com") == ResolvedUser("U3", "hanako")
+    assert saved == [directory.users]
@@ -0,0 +1,92 @@
+"""
+ベンチ用フェイク Slack Web API: 実 WebClient → SlackClient 経路で動作する
+"""
+
+import pytest
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+
+from app.infrastructure.slack_client import SlackClient
+from bench.fake_slack_api import FakeSlackServer, FakeSlackState, parse_latency, seed_directory
+
+
+@pytest.fixture
+def fake():
+    state = FakeSlackState(seed_directory(10, seed=1))
+    with FakeSlackServer(state) as server:
+        yield server
+
+
+def _sc(server, **kwargs):
+    return SlackClient(WebClient(token="xoxb-fake", base_url=server.base_url), **kwargs)
+
+
+def test_real_web_client_roundtrip_through_facade(fake):
+    sc = _sc(fake)
+
+    user = sc.lookup_user_by_email(email="user3@example.com")
+    assert user["user"]["id"] == "U00000003"
+
+    channel_id = sc.create_channel(name="bench-1")["channel"]["id"]
+    sc.invite_users(channel_id=channel_id, user_ids=["U00000001", "U00000002"])
+    view_id = sc.open_view(trigger_id="t", view={"type": "modal", "blocks": []})["view"]["id"]
+    sc.update_view(view_id=view_id, view={"type": "modal", "blocks": []})
+    sc.post_message(channel="U00000001", text="done")
+
+    state = fake.state
+    assert state.members[channel_id] == {"U00000001", "U00000002"}
+    assert state.messages == [{"channel": "U00000001", "text": "done"}]
+    assert state.calls["conversations.create"] == 1
+
+    with pytest.raises(SlackApiError) as e:
+        sc.create_channel(name="bench-1")
+    assert e.value.response["error"] == "name_taken"
+
+
+def test_users_list_paginates_seeded_directory(fake):
+    web = WebClient(token="xoxb-fake", base_url=fake.base_url)
+    first = web.users_list(limit=4)
+    assert len(first["members"]) == 4
+    rest = web.users_list(limit=100, cursor=first["response_metadata"]["next_cursor"])
+    assert len(rest["members"]) == 6
+    assert rest["response_metadata"]["next_cursor"] == ""
+
+
+def test_injected_429_carries_retry_after():
+    state = FakeSlackState(seed_directory(1), ratelimit={"users.lookupByEmail": 1.0}, retry_after=7)
+    with FakeSlackServer(state) as server:
+        web = WebClient(token="xoxb-fake", base_url=server.base_url)
+        with pytest.raises(SlackApiError) as e:
+            web.users_lookupByEmail(email="user0@example.com")
+    assert e.value.response.status_code == 429
+    assert e.value.response.headers["Retry-After"] == "7"
+    assert state.throttled["users.lookupByEmail"] == 1
+
+
+def test_parse_latency_specs():
+    import random
+
+    rng = random.Random(0)
+    assert parse_latency("constant:20")(rng) == pytest.approx(0.02)
+    assert 0.01 <= parse_latency("uniform:10:30")(rng) <= 0.03
+    assert parse_latency("lognormal:40:0.5")(rng) > 0
+
+
+def test_usergroups_and_paginated_channel_members(fake):
+    web = WebClient(token="xoxb-fake", base_url=fake.base_url)
+    fake.state.add_usergroup("dev", ["U00000001", "U00000002"])
+    channel_id = fake.state.add_channel("general", [f"U{i:08d}" for i in range(5)])
+
+    groups = web.usergroups_list()["usergroups"]
+    assert [g["handle"] for g in groups] == ["dev"]
+    assert web.usergroups_users_list(usergroup=groups[0]["id"])["users"] == [
+        "U00000001",
+        "U00000002",
+    ]
+
+    first = web.conversations_members(channel=channel_id, limit=3)
+    rest = web.conversations_members(
+        channel=channel_id, limit=3, cursor=first["response_metadata"]["next_cursor"]
+    )
+    assert first["members"] + rest["members"] == [f"U{i:08d}" for i in range(5)]
+    assert rest["response_metadata"]["next_cursor"] == ""
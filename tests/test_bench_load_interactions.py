@@ -0,0 +1,59 @@
+"""
+負荷試験ハーネス: ショートカット→送信→作成の一連フローを並行実行して集計できる
+"""
+
+from bench.fake_slack_api import FakeSlackState, seed_directory
+from bench.load_interactions import LatencyClient, compare_to_baseline, run_load
+
+
+def test_run_load_reports_latency_percentiles_and_api_calls():
+    state = FakeSlackState(seed_directory(50, seed=2))
+
+    report = run_load(4, 3, lambda: LatencyClient(state), directory_size=50, seed=2)
+
+    assert report["interactions"] == 4
+    assert report["failed"] == 0
+    for metric in ("ack_submission", "time_to_confirmation_modal", "time_to_channel_created"):
+        assert report["metrics"][metric]["count"] == 4
+    calls = report["api_calls_per_interaction"]["by_method"]
+    assert calls["conversations_create"] == 1
+    # ディレクトリ読み込みが先に終われば照会は 0 回
+    assert calls.get("users_lookupByEmail", 0) <= 3
+    assert len(state.channels) == 4
+    # 本番と同じくチーム単位のクライアント（ディレクトリ・スケジューラ）経由で動く
+    assert "users_list" in report["background_api_calls"]
+
+
+def test_compare_to_baseline_flags_p90_and_call_count_regressions():
+    baseline = {
+        "metrics": {"time_to_channel_created": {"p90": 1.0}},
+        "api_calls_per_interaction": {"total": 10},
+    }
+    ok = {
+        "metrics": {"time_to_channel_created": {"p90": 1.1}},
+        "api_calls_per_interaction": {"total": 10},
+    }
+    slow = {
+        "metrics": {"time_to_channel_created": {"p90": 1.5}},
+        "api_calls_per_interaction": {"total": 20},
+    }
+
+    assert compare_to_baseline(ok, baseline, 0.2) == []
+    assert len(compare_to_baseline(slow, baseline, 0.2)) == 2
+
+
+def test_latency_client_counts_calls_under_web_api_method_names():
+    """プロセス内クライアントもフェイクサーバーと同じ API メソッド名で集計・遅延・429 を適用する"""
+    state = FakeSlackState(seed_directory(5, seed=1))
+    group_id = state.add_usergroup("eng", ["U00000001"])
+    client = LatencyClient(state)
+
+    client.usergroups_users_list(usergroup=group_id)
+    client.users_lookupByEmail(email="user1@example.com")
+    client.chat_postMessage(channel="U00000001", text="hi")
+
+    assert dict(state.calls) == {
+        "usergroups.users.list": 1,
+        "users.lookupByEmail": 1,
+        "chat.postMessage": 1,
+    }
@@ -53,3 +53,14 @@ def test_length_limit_80_characters_raises_error():
     long_name = "a" * 85  # 85文字
     with pytest.raises(ValueError, match="80文字"):
         normalize_channel_name(long_name)
+
+
+def test_normalize_channel_names_batch():
+    """一括: 複数のチャンネル名を同じ規則でまとめて正規化できる"""
+    from app.channel_name_normalizer import normalize_channel_names
+
+    assert normalize_channel_names(["My Channel", "ｔｅｓｔ", "ok-1"]) == [
+        "my-channel",
+        "test",
+        "ok-1",
+    ]
@@ -20,3 +20,17 @@ def test_from_raw_string_raises_on_length_over_80():
     long_name = "a" * 85
     with pytest.raises(ValueError, match="80"):
         ChannelName.from_raw_string(long_name)
+
+
+def test_from_raw_strings_matches_single_normalization():
+    names = ["my-channel_123", "Project Alpha", "ｃｈａｎｎｅｌ-０１", "a\tb  c", "dev/ops!"]
+    batch = [cn.value for cn in ChannelName.from_raw_strings(names)]
+    assert batch == [ChannelName.from_raw_string(n).value for n in names]
+    assert batch == ["my-channel_123", "project-alpha", "channel-01", "a-b-c", "devops"]
+
+
+def test_from_raw_string_length_check_applies_to_memoized_results():
+    long_name = "a" * 85
+    for _ in range(2):
+        with pytest.raises(ValueError, match="80"):
+            ChannelName.from_raw_string(long_name)
@@ -0,0 +1,27 @@
+"""Domain: EmailAddressValidator"""
+
+from app.domain.email_address_validator import EmailAddressValidator
+
+
+def test_extract_handles_mail_client_formats():
+    v = EmailAddressValidator()
+    assert v.extract("山田 太郎 <Taro@Example.com>") == "taro@example.com"
+    assert v.extract('"Yamada" <taro@example.com>') == "taro@example.com"
+    assert v.extract("taro@example.com>") == "taro@example.com"
+    assert v.extract("mailto:taro@example.com") == "taro@example.com"
+
+
+def test_check_rejects_invalid_syntax():
+    v = EmailAddressValidator()
+    assert v.check("a@example.com") == "a@example.com"
+    assert v.check("x <B@example.com>") == "b@example.com"
+    assert v.check("no-at-mark") is None
+    assert v.check("b@example") is None
+
+
+def test_check_filters_by_allowed_domains_including_subdomains():
+    v = EmailAddressValidator.from_csv("example.com, @corp.example.org")
+    assert v.check("a@example.com") == "a@example.com"
+    assert v.check("b@dev.example.com") == "b@dev.example.com"
+    assert v.check("c@corp.example.org") == "c@corp.example.org"
+    assert v.check("d@other.com") is None
@@ -0,0 +1,75 @@
+"""Domain: EmailSuggester（見つからないメールの「もしかして」候補）"""
+
+import random
+import time
+
+from app.domain.email_suggester import EmailSuggester, edit_distance, parse_domain_aliases
+
+
+def _suggester(**kwargs):
+    return EmailSuggester(
+        [
+            ("taro.tanaka@example.com", "U1", "田中太郎"),
+            ("hanako.sato@example.com", "U2", "佐藤花子"),
+            ("ken@example.com", "U3", "ken"),
+            ("taro.tanaka@sub.example.jp", "U4", "田中（子会社）"),
+        ],
+        **kwargs,
+    )
+
+
+def test_edit_distance_with_limit():
+    assert edit_distance("tanaka", "tanaka", 2) == 0
+    assert edit_distance("tanka", "tanaka", 2) == 1
+    assert edit_distance("taro.tanaka", "tarotanaka", 2) == 1
+    assert edit_distance("abcdef", "uvwxyz", 2) == 3  # 上限を超えたら limit + 1
+
+
+def test_typos_in_local_part_or_domain():
+    suggester = _suggester()
+
+    assert suggester.suggest("taro.tanka@example.com")[0][0] == "taro.tanaka@example.com"
+    assert suggester.suggest("Hanako.Satou@Example.com")[0][1] == {
+        "id": "U2",
+        "display_name": "佐藤花子",
+    }
+    assert suggester.suggest("taro.tanaka@exmaple.com")[0][0] == "taro.tanaka@example.com"
+    # 同じドメイン（または別名）以外の近いアドレスは候補にしない
+    assert [a for a, _ in suggester.suggest("hanako.sato@other.org")] == []
+
+
+def test_domain_aliases_and_short_local_parts():
+    suggester = _suggester(domain_aliases=parse_domain_aliases("old.example.com=example.com"))
+
+    assert [a for a, _ in suggester.suggest("taro.tanaka@old.example.com")] == [
+        "taro.tanaka@example.com"
+    ]
+    assert [a for a, _ in suggester.suggest("kem@example.com")] == ["ken@example.com"]
+    assert suggester.suggest("kxy@example.com") == []  # 短いローカル部は 1 文字違いまで
+    assert suggester.suggest("not-an-email") == []
+
+
+def test_parse_domain_aliases():
+    assert parse_domain_aliases(" A.com = b.com ,bad, x.jp=y.jp") == {
+        "a.com": "b.com",
+        "x.jp": "y.jp",
+    }
+    assert parse_domain_aliases(None) == {}
+
+
+def test_stays_fast_with_20k_members():
+    rng = random.Random(0)
+    family = ["sato", "suzuki", "takahashi", "tanaka", "ito", "watanabe", "yamamoto", "kato"]
+    given = ["taro", "hanako", "ken", "yui", "sho", "mei", "ren", "aoi"]
+    entries = [
+        (f"{rng.choice(given)}.{rng.choice(family)}{i}@example.com", f"U{i}", f"user{i}")
+        for i in range(20_000)
+    ]
+    suggester = EmailSuggester(entries + [("mei.watanabe@example.com", "UX", "渡辺")])
+
+    started = time.perf_counter()
+    result = suggester.suggest("mei.watanbe@example.com")
+    elapsed = time.perf_counter() - started
+
+    assert result[0][0] == "mei.watanabe@example.com"
+    assert elapsed < 0.2
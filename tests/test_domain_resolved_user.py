@@ -0,0 +1,37 @@
+"""Domain: ResolvedUser（解決済みユーザーのコンパクトな不変レコード）"""
+
+import sys
+
+import pytest
+
+from app.domain.resolved_user import ResolvedUser
+
+
+def test_from_api_falls_back_to_id_without_display_name():
+    assert ResolvedUser.from_api({"id": "U1", "profile": {"display_name": "太郎"}}) == ResolvedUser(
+        "U1", "太郎"
+    )
+    assert ResolvedUser.from_api({"id": "U2", "profile": {"display_name": ""}}).display_name == "U2"
+    assert ResolvedUser.from_api({"id": "U3"}).display_name == "U3"
+
+
+def test_behaves_like_the_former_dict():
+    user = ResolvedUser("U1", "太郎")
+
+    assert user["id"] == "U1" and user["display_name"] == "太郎"
+    assert user.get("email") is None and user.get("email", "-") == "-"
+    assert dict(user) == {"id": "U1", "display_name": "太郎"}
+    assert user == {"id": "U1", "display_name": "太郎"}
+    assert {"id": "U1", "display_name": "太郎"} == user
+    assert user != {"id": "U1"}
+    with pytest.raises(KeyError):
+        user["email"]
+
+
+def test_is_immutable_hashable_and_small():
+    user = ResolvedUser("U1", "太郎")
+    with pytest.raises(AttributeError):
+        user.id = "U2"
+    assert len({user, ResolvedUser("U1", "太郎")}) == 1
+    assert not hasattr(user, "__dict__")
+    assert sys.getsizeof(user) < sys.getsizeof({"id": "U1", "display_name": "太郎"})
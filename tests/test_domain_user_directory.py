@@ -0,0 +1,59 @@
+"""Domain: UserDirectory（大規模ワークスペース向けの列指向メールアドレス索引）"""
+
+import sys
+
+from app.domain.resolved_user import ResolvedUser
+from app.domain.user_directory import UserDirectory
+
+
+def _records(n):
+    return [(f"user{i}@example.com", f"U{i:06d}", f"ユーザー{i}") for i in range(n)]
+
+
+def test_lookup_is_case_insensitive_and_returns_resolved_users():
+    directory = UserDirectory.build(
+        [("Bob@Example.com", "U2", "Bob"), ("alice@example.com", "U1", "アリス")]
+    )
+
+    assert len(directory) == 2
+    assert directory.get("alice@example.com") == ResolvedUser("U1", "アリス")
+    assert directory.get(" BOB@example.COM ") == {"id": "U2", "display_name": "Bob"}
+    assert directory.get("carol@example.com") is None
+    assert "bob@example.com" in directory and "carol@example.com" not in directory
+    assert [email for email, _ in directory] == ["alice@example.com", "bob@example.com"]
+
+
+def test_duplicates_keep_the_last_record_and_empty_directory_works():
+    directory = UserDirectory.build(
+        [("a@example.com", "U1", "old"), ("A@example.com", "U1", "new")]
+    )
+    assert len(directory) == 1
+    assert directory.get("a@example.com").display_name == "new"
+
+    empty = UserDirectory.build([])
+    assert len(empty) == 0 and empty.get("a@example.com") is None
+
+
+def test_columns_can_be_memoryviews():
+    # スナップショットを mmap した場合と同じく、コピーせずにバッファ上で検索できる
+    source = UserDirectory.build(_records(100))
+    emails, eo, ids, io, names, no = source.columns()
+    mapped = UserDirectory(memoryview(emails), eo, memoryview(ids), io, memoryview(names), no)
+
+    for i in (0, 37, 99):
+        assert mapped.get(f"user{i}@example.com") == source.get(f"user{i}@example.com")
+    assert mapped.get("user100@example.com") is None
+
+
+def test_uses_far_less_memory_than_per_user_dicts():
+    n = 2000
+    records = _records(n)
+    directory = UserDirectory.build(records)
+    as_dicts = {e: {"id": u, "display_name": d} for e, u, d in records}
+    dict_bytes = sum(
+        sys.getsizeof(k) + sys.getsizeof(v) + sum(sys.getsizeof(x) for x in v.values())
+        for k, v in as_dicts.items()
+    )
+
+    assert directory.nbytes() / n < 64
+    assert directory.nbytes() * 5 < dict_bytes
@@ -0,0 +1,58 @@
+"""Domain: UserSearchIndex（メンバー選択欄の前方一致/部分一致索引）"""
+
+import time
+
+from app.domain.user_search_index import UserSearchIndex
+
+
+def _index():
+    return UserSearchIndex(
+        [
+            ("U1", "taro", "Taro Yamada", "taro.yamada@example.com"),
+            ("U2", "hanako", "Hanako Suzuki", "hanako@example.com"),
+            ("U3", "", "山田 花子", "hanako.yamada@example.jp"),
+            ("U1", "dup", "Dup", "dup@example.com"),  # 同じ ID は最初の 1 件のみ
+        ]
+    )
+
+
+def test_prefix_matches_any_word_of_names_and_email():
+    index = _index()
+
+    assert len(index) == 3
+    assert [uid for uid, _ in index.search("yama")] == ["U1", "U3"]
+    assert [uid for uid, _ in index.search("Hana")] == ["U2", "U3"]
+    assert [uid for uid, _ in index.search("山田")] == ["U3"]
+    assert index.search("hanako@ex") == [("U2", "hanako (hanako@example.com)")]
+    assert index.search("") == [] and index.search("zzz") == []
+
+
+def test_substring_matches_via_trigrams_after_prefix_hits():
+    index = _index()
+
+    # 「amad」は単語の先頭ではないが 3 文字以上なら部分一致で見つかる
+    assert [uid for uid, _ in index.search("amad")] == ["U1", "U3"]
+    assert [uid for uid, _ in index.search("example.jp")] == ["U3"]
+
+
+def test_limit_get_and_labels():
+    index = _index()
+
+    assert len(index.search("example", limit=2)) == 2
+    assert index.get("U3") == {"id": "U3", "display_name": "山田 花子"}
+    assert index.get("U9") is None
+
+
+def test_searches_20k_members_within_a_few_milliseconds():
+    names = ["sato", "suzuki", "takahashi", "tanaka", "ito", "watanabe", "yamamoto"]
+    index = UserSearchIndex(
+        (f"U{i:06d}", f"{names[i % 7]}{i}", f"{names[i % 7].title()} {i}", f"user{i}@example.com")
+        for i in range(20_000)
+    )
+
+    started = time.perf_counter()
+    for query in ("t", "ta", "tanaka1", "user1999", "aka12", "example.com"):
+        assert index.search(query, limit=50)
+    per_query = (time.perf_counter() - started) / 6
+
+    assert per_query < 0.05  # Slack の options 応答期限（3 秒）より十分短い
@@ -0,0 +1,109 @@
+"""HTTP モード: WSGI アダプター・署名検証・ヘルスチェック"""
+
+import io
+import json
+import time
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+import pytest
+from slack_bolt import App
+from slack_bolt.authorization import AuthorizeResult
+from slack_sdk.signature import SignatureVerifier
+
+from app.http_server import create_wsgi_app
+
+SECRET = "test-signing-secret"
+
+
+def _app():
+    def authorize(enterprise_id, team_id, logger):
+        return AuthorizeResult(
+            enterprise_id=None, team_id=team_id, bot_token="xoxb-test", bot_user_id="UB"
+        )
+
+    app = App(authorize=authorize, signing_secret=SECRET, process_before_response=True)
+    app.shortcut("create_channel_shortcut")(lambda ack: ack())
+    return app
+
+
+def _call(wsgi_app, path, body=b"", headers=None, method="POST"):
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "CONTENT_TYPE": "application/x-www-form-urlencoded",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    for key, value in (headers or {}).items():
+        environ["HTTP_" + key.upper().replace("-", "_")] = value
+    captured = {}
+
+    def start_response(status, response_headers):
+        captured["status"] = status
+
+    payload = b"".join(wsgi_app(environ, start_response))
+    return captured["status"], payload
+
+
+def _shortcut_body():
+    payload = {
+        "type": "shortcut",
+        "callback_id": "create_channel_shortcut",
+        "trigger_id": "T.1",
+        "team": {"id": "T1"},
+        "user": {"id": "U1"},
+    }
+    return urlencode({"payload": json.dumps(payload)}).encode()
+
+
+def test_signed_request_is_dispatched():
+    wsgi_app = create_wsgi_app(_app())
+    body = _shortcut_body()
+    ts = str(int(time.time()))
+    signature = SignatureVerifier(SECRET).generate_signature(timestamp=ts, body=body)
+
+    status, _ = _call(
+        wsgi_app,
+        "/slack/events",
+        body,
+        {"X-Slack-Request-Timestamp": ts, "X-Slack-Signature": signature},
+    )
+    assert status.startswith("200")
+
+
+def test_unsigned_request_is_rejected():
+    wsgi_app = create_wsgi_app(_app())
+    ts = str(int(time.time()))
+    status, _ = _call(
+        wsgi_app,
+        "/slack/events",
+        _shortcut_body(),
+        {"X-Slack-Request-Timestamp": ts, "X-Slack-Signature": "v0=bad"},
+    )
+    assert status.startswith("401")
+
+
+def test_healthz_and_unknown_path():
+    wsgi_app = create_wsgi_app(_app())
+    assert _call(wsgi_app, "/healthz", method="GET") == ("200 OK", b"ok")
+    assert _call(wsgi_app, "/other", method="GET")[0].startswith("404")
+
+
+def test_signing_secret_is_required(monkeypatch):
+    monkeypatch.delenv("SLACK_SIGNING_SECRET", raising=False)
+    with patch("app.http_server.create_app") as create_app:
+        with pytest.raises(ValueError, match="SLACK_SIGNING_SECRET"):
+            create_wsgi_app()
+        create_app.assert_not_called()
+
+
+def test_healthz_reports_draining_during_shutdown():
+    from app.presentation.lifecycle import Lifecycle
+
+    lifecycle = Lifecycle()
+    wsgi_app = create_wsgi_app(_app(), lifecycle=lifecycle)
+    lifecycle.accepting = False
+    assert _call(wsgi_app, "/healthz", method="GET")[0].startswith("503")
@@ -0,0 +1,79 @@
+"""Infrastructure: AuditLog（バックグラウンドでまとめて追記する JSONL 監査ログ）"""
+
+import json
+import os
+import threading
+
+from app.infrastructure import audit_log
+from app.infrastructure.audit_log import AuditLog, parse_fsync_policy
+from app.infrastructure.metrics import MetricsRegistry
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_written_as_jsonl_by_the_background_thread(tmp_path):
+    path = tmp_path / "audit" / "audit.jsonl"
+    log = AuditLog(str(path), registry=MetricsRegistry())
+
+    log.record({"requester": "U1", "channel_name": "チーム"})
+    log.record({"requester": "U2"})
+    log.close()
+
+    records = _read(path)
+    assert [r["requester"] for r in records] == ["U1", "U2"]
+    assert records[0]["channel_name"] == "チーム"
+    assert records[0]["ts"].endswith("+00:00")
+
+
+def test_record_never_blocks_and_counts_drops_when_the_queue_is_full(tmp_path):
+    registry = MetricsRegistry()
+    log = AuditLog(str(tmp_path / "a.jsonl"), max_queue=1, registry=registry)
+    gate = threading.Event()
+    original = log._write
+    log._write = lambda batch: (gate.wait(5), original(batch))
+
+    for i in range(5):
+        log.record({"i": i})
+    gate.set()
+    log.close()
+
+    assert "audit_records_dropped_total" in registry.render()
+    written = [r["i"] for r in _read(tmp_path / "a.jsonl")]
+    assert 1 <= len(written) < 5
+
+
+def test_rotates_before_exceeding_max_bytes(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    log = AuditLog(str(path), max_bytes=200, backups=2, registry=MetricsRegistry())
+
+    for i in range(12):
+        log.record({"i": i, "pad": "x" * 40})
+        log.close()  # 1 件ずつ書き出してローテーションを確認
+
+    assert os.path.getsize(path) <= 200
+    assert os.path.exists(f"{path}.1") and os.path.exists(f"{path}.2")
+    assert not os.path.exists(f"{path}.3")
+    newest = [r["i"] for r in _read(path)]
+    assert newest[-1] == 11
+
+
+def test_fsync_policy_and_env_configuration(tmp_path, monkeypatch):
+    assert parse_fsync_policy(None) == 0.0
+    assert parse_fsync_policy("off") is None
+    assert parse_fsync_policy("2.5") == 2.5
+
+    monkeypatch.delenv("AUDIT_LOG", raising=False)
+    assert AuditLog.from_env() is None
+    log = AuditLog.from_env({"AUDIT_LOG": str(tmp_path / "a-{worker}.jsonl")}, worker=3)
+    assert log.path.endswith("a-3.jsonl")
+
+    previous = audit_log.configure(log)
+    try:
+        audit_log.record({"requester": "U1"})
+        audit_log.close()
+    finally:
+        audit_log.configure(previous)
+    assert _read(tmp_path / "a-3.jsonl")[0]["requester"] == "U1"
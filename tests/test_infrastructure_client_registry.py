@@ -0,0 +1,95 @@
+"""Infrastructure: SlackClientRegistry（チーム単位の共有クライアント）"""
+
+from unittest.mock import Mock
+
+from app.infrastructure.client_registry import SlackClientRegistry
+from app.infrastructure.slack_client import SlackClient
+
+
+def _registry(created):
+    def web_factory(token, template):
+        web = Mock()
+        web.token = token
+        created.append(web)
+        return web
+
+    return SlackClientRegistry(
+        web_client_factory=web_factory, user_resolver_factory=lambda sc: Mock(api=sc)
+    )
+
+
+def test_same_team_reuses_clients_and_resolver():
+    created = []
+    registry = _registry(created)
+
+    a = registry.get("T1", "xoxb-1")
+    b = registry.get("T1", "xoxb-1")
+
+    assert a is b
+    assert isinstance(a.slack_client, SlackClient)
+    assert a.user_resolver.api is a.slack_client
+    assert a.outbound is b.outbound is not None
+    assert len(created) == 1
+
+
+def test_teams_are_isolated_and_token_rotation_is_applied():
+    created = []
+    registry = _registry(created)
+
+    t1 = registry.get("T1", "xoxb-1")
+    t2 = registry.get("T2", "xoxb-2")
+    assert t1 is not t2
+    assert len(registry) == 2
+
+    registry.get("T1", "xoxb-rotated")
+    assert t1.web_client.token == "xoxb-rotated"
+
+
+def test_default_resolver_factory_gives_each_team_its_own_cache():
+    registry = SlackClientRegistry(web_client_factory=lambda token, template: Mock(token=token))
+
+    t1 = registry.get("T1", "xoxb-1").user_resolver
+    t2 = registry.get("T2", "xoxb-2").user_resolver
+    assert t1._cache is not None and t2._cache is not None
+    assert t1._cache is not t2._cache
+
+
+def test_default_outbound_factory_labels_each_team_scheduler():
+    registry = SlackClientRegistry(web_client_factory=lambda token, template: Mock(token=token))
+
+    t1 = registry.get("T1", "xoxb-1").outbound
+    t2 = registry.get("T2", "xoxb-2").outbound
+    assert t1 is not t2
+    assert (t1.team, t2.team) == ("T1", "T2")  # メトリクスの team ラベル
+
+
+def test_default_directory_factory_gives_each_team_its_own_directory():
+    from app.application.workspace_directory import WorkspaceDirectory
+
+    registry = SlackClientRegistry(web_client_factory=lambda token, template: Mock(token=token))
+
+    t1 = registry.get("T1", "xoxb-1")
+    t2 = registry.get("T2", "xoxb-2")
+    assert isinstance(t1.directory, WorkspaceDirectory)
+    assert t1.directory is not t2.directory
+    assert not t1.directory.ready  # 読み込みは初回利用時（ここでは API を呼ばない）
+    t1.web_client.users_list.assert_not_called()
+
+
+def test_default_directory_factory_starts_from_the_team_snapshot(tmp_path):
+    from app.domain.user_directory import UserDirectory
+    from app.infrastructure import directory_snapshot
+
+    store = directory_snapshot.SnapshotStore(str(tmp_path))
+    store.save("T1", UserDirectory.build([("taro@example.com", "U1", "taro")]))
+    previous = directory_snapshot.configure(store)
+    try:
+        registry = SlackClientRegistry(web_client_factory=lambda token, template: Mock())
+        t1 = registry.get("T1", "xoxb-1")
+        t2 = registry.get("T2", "xoxb-2")
+    finally:
+        directory_snapshot.configure(previous)
+
+    assert t1.directory.lookup("taro@example.com").id == "U1"
+    assert t2.directory.lookup("taro@example.com") is None
+    t1.web_client.users_list.assert_not_called()
@@ -0,0 +1,95 @@
+"""Infrastructure: 名簿スナップショット（列配列＋オフセット索引。メモリマップで読み込み）"""
+
+import pytest
+
+from app.domain.resolved_user import ResolvedUser
+from app.domain.user_directory import UserDirectory
+from app.infrastructure.directory_snapshot import SnapshotStore, read_snapshot, write_snapshot
+
+
+def _directory():
+    return UserDirectory.build(
+        [
+            ("Tanaka@example.com", "U111", "田中"),
+            ("sato@example.com", "U222", "佐藤"),
+            ("suzuki@example.co.jp", "U333", ""),
+        ]
+    )
+
+
+def test_round_trip_is_memory_mapped_and_keeps_lookups(tmp_path):
+    path = str(tmp_path / "team.udir")
+    size = write_snapshot(_directory(), path)
+
+    loaded = read_snapshot(path)
+
+    assert size == (tmp_path / "team.udir").stat().st_size
+    assert isinstance(loaded.columns()[0], memoryview)  # コピーせずマップ上の列をそのまま使う
+    assert len(loaded) == 3
+    assert loaded.get("TANAKA@example.com") == ResolvedUser("U111", "田中")
+    assert loaded.get("nobody@example.com") is None
+    assert list(loaded) == list(_directory())
+
+
+def test_empty_directory_and_corrupt_files(tmp_path):
+    path = str(tmp_path / "empty.udir")
+    write_snapshot(UserDirectory.build([]), path)
+    assert len(read_snapshot(path)) == 0
+
+    bad = tmp_path / "bad.udir"
+    bad.write_bytes(b"not a snapshot" * 10)
+    with pytest.raises(ValueError):
+        read_snapshot(str(bad))
+
+    truncated = tmp_path / "truncated.udir"
+    write_snapshot(_directory(), str(truncated))
+    truncated.write_bytes(truncated.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        read_snapshot(str(truncated))
+
+
+def test_store_saves_per_team_and_preloads_at_startup(tmp_path):
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    assert store.preload() == 0
+    assert store.load("T1") is None
+
+    store.save("T1", _directory())
+    (tmp_path / "snapshots" / "T2.udir").write_bytes(b"garbage")
+
+    restarted = SnapshotStore(str(tmp_path / "snapshots"))
+    assert restarted.preload() == 1  # 壊れたファイルは無視
+    assert restarted.load("T1").get("sato@example.com") == ResolvedUser("U222", "佐藤")
+    assert restarted.load("T2") is None
+
+
+def test_startup_starts_the_reconcile_for_every_preloaded_team(tmp_path):
+    """起動時: スナップショットのあるチームは最初の操作を待たずに users.list で更新を始める"""
+    from unittest.mock import Mock
+
+    from app.infrastructure.client_registry import SlackClientRegistry
+    from app.slack_app import warm_directories
+
+    store = SnapshotStore(str(tmp_path))
+    store.save("T1", _directory())
+    store.save("T2", _directory())
+    (tmp_path / "T3.udir").write_bytes(b"garbage")
+    store.preload()
+
+    directories = {}
+
+    def directory_factory(sc, team):
+        directories[team] = Mock()
+        return directories[team]
+
+    registry = SlackClientRegistry(
+        web_client_factory=lambda token, template: Mock(token=token),
+        user_resolver_factory=lambda sc: Mock(),
+        directory_factory=directory_factory,
+        outbound_factory=lambda sc, team: None,
+    )
+    tokens = {"T1": "xoxb-1"}
+
+    assert warm_directories(registry, store, token_for=tokens.get) == 1
+    assert set(directories) == {"T1"}  # T2 はトークンなし、T3 は壊れたファイル
+    directories["T1"].ensure_fresh.assert_called_once()
+    assert registry.get("T1", "xoxb-1").web_client.token == "xoxb-1"
@@ -0,0 +1,80 @@
+"""Infrastructure: 複数ワークスペース（OAuth / インストールストア）設定"""
+
+import pytest
+from slack_sdk.oauth.installation_store import FileInstallationStore, Installation
+from slack_sdk.oauth.installation_store.sqlite3 import SQLite3InstallationStore
+
+from app.infrastructure.installation import (
+    app_settings,
+    bot_token_for,
+    build_stores,
+    team_key,
+)
+
+
+def test_single_workspace_without_client_id():
+    assert app_settings({"SLACK_BOT_TOKEN": "xoxb-1"}) == {}
+
+
+def test_oauth_settings_with_file_store(tmp_path):
+    settings = app_settings(
+        {
+            "SLACK_CLIENT_ID": "111.222",
+            "SLACK_CLIENT_SECRET": "secret",
+            "INSTALLATION_STORE": f"file:{tmp_path}",
+        }
+    )["oauth_settings"]
+
+    assert settings.client_id == "111.222"
+    assert "users:read.email" in settings.scopes
+    assert settings.installation_store_bot_only is True
+    assert isinstance(settings.installation_store, FileInstallationStore)
+
+
+def test_sqlite_store_round_trips_installations_per_team(tmp_path):
+    installation_store, _ = build_stores(f"sqlite:{tmp_path / 'inst.db'}", "111.222")
+    assert isinstance(installation_store, SQLite3InstallationStore)
+
+    for team, token in (("T1", "xoxb-1"), ("T2", "xoxb-2")):
+        installation_store.save(
+            Installation(
+                app_id="A1",
+                team_id=team,
+                user_id="U1",
+                bot_token=token,
+                bot_id="B1",
+                bot_user_id="UB",
+            )
+        )
+    assert installation_store.find_bot(enterprise_id=None, team_id="T2").bot_token == "xoxb-2"
+
+
+def test_unknown_store_spec_is_rejected():
+    with pytest.raises(ValueError):
+        build_stores("redis://x", "111.222")
+
+
+def test_team_key_falls_back_to_enterprise():
+    assert team_key("T1", "E1") == "T1"
+    assert team_key(None, "E1") == "E1"
+    assert team_key(None, None) is None
+
+
+def test_bot_token_for_startup_work(tmp_path):
+    """起動時の処理用トークン: 単一ワークスペースは環境変数、OAuth はインストールストアから"""
+    assert bot_token_for("T1", {"SLACK_BOT_TOKEN": "xoxb-env"}) == "xoxb-env"
+
+    env = {"SLACK_CLIENT_ID": "111.222", "INSTALLATION_STORE": f"sqlite:{tmp_path / 'i.db'}"}
+    installation_store, _ = build_stores(env["INSTALLATION_STORE"], env["SLACK_CLIENT_ID"])
+    installation_store.save(
+        Installation(
+            app_id="A1",
+            team_id="T1",
+            user_id="U1",
+            bot_token="xoxb-1",
+            bot_id="B1",
+            bot_user_id="UB",
+        )
+    )
+    assert bot_token_for("T1", env) == "xoxb-1"
+    assert bot_token_for("T9", env) is None
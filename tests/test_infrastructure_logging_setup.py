@@ -0,0 +1,68 @@
+"""Infrastructure: 構造化ログ（JSON・切り詰め・サンプリング・キュー出力）"""
+
+import io
+import json
+import logging
+import random
+
+from app.infrastructure.logging_setup import (
+    JsonFormatter,
+    SamplingFilter,
+    parse_sample_rates,
+    setup_logging,
+    truncate,
+)
+
+
+def test_truncate_limits_long_strings_and_collections():
+    assert truncate("x" * 10, max_string=4) == "xxxx...(+6 chars)"
+    assert truncate(list(range(5)), max_items=2) == [0, 1, "...(+3 items)"]
+
+
+def test_json_formatter_includes_extra_fields_truncated():
+    record = logging.makeLogRecord(
+        {
+            "name": "app",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "created %s",
+            "args": ("C1",),
+            "event": "channel_created",
+            "user_ids": [f"U{i}" for i in range(100)],
+        }
+    )
+    data = json.loads(JsonFormatter().format(record))
+    assert data["message"] == "created C1"
+    assert data["event"] == "channel_created"
+    assert len(data["user_ids"]) == 21
+
+
+def test_sampling_filter_drops_sampled_events_but_keeps_warnings():
+    f = SamplingFilter({"noisy": 0.0}, rng=random.Random(0))
+    noisy = logging.makeLogRecord({"levelno": logging.INFO, "event": "noisy"})
+    warn = logging.makeLogRecord({"levelno": logging.WARNING, "event": "noisy"})
+    other = logging.makeLogRecord({"levelno": logging.INFO})
+    assert not f.filter(noisy)
+    assert f.filter(warn)
+    assert f.filter(other)
+    assert parse_sample_rates("a=0.1, b=1") == {"a": 0.1, "b": 1.0}
+
+
+def test_setup_logging_writes_json_from_listener_thread():
+    stream = io.StringIO()
+    root = logging.getLogger()
+    saved = (list(root.handlers), root.level)
+    listener = setup_logging(handler=logging.StreamHandler(stream))
+    try:
+        logging.getLogger("app.test").info("hello %s", "world", extra={"event": "greet"})
+    finally:
+        listener.stop()
+        for h in list(root.handlers):
+            root.removeHandler(h)
+        for h in saved[0]:
+            root.addHandler(h)
+        root.setLevel(saved[1])
+
+    line = json.loads(stream.getvalue().strip())
+    assert line["message"] == "hello world"
+    assert line["event"] == "greet"
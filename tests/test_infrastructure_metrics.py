@@ -0,0 +1,38 @@
+"""Infrastructure: メトリクスレジストリ（Prometheus テキスト形式）"""
+
+import urllib.request
+
+from app.infrastructure.metrics import MetricsRegistry, start_metrics_server
+
+
+def test_histogram_and_counter_render_prometheus_text():
+    reg = MetricsRegistry()
+    h = reg.histogram("lat_seconds", "latency", ["listener"], buckets=(0.1, 1.0))
+    c = reg.counter("calls_total", "calls", ["listener"])
+    h.observe(0.05, "a")
+    h.observe(0.1, "a")
+    h.observe(2.0, "a")
+    c.inc("a")
+
+    text = reg.render()
+
+    assert 'lat_seconds_bucket{listener="a",le="0.1"} 2' in text
+    assert 'lat_seconds_bucket{listener="a",le="1.0"} 2' in text
+    assert 'lat_seconds_bucket{listener="a",le="+Inf"} 3' in text
+    assert 'lat_seconds_count{listener="a"} 3' in text
+    assert 'calls_total{listener="a"} 1.0' in text
+    assert reg.histogram("lat_seconds", "latency", ["listener"]) is h
+
+
+def test_metrics_endpoint_serves_registry():
+    reg = MetricsRegistry()
+    reg.counter("up", "up").inc()
+    server = start_metrics_server(0, reg, host="127.0.0.1")
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as resp:
+            body = resp.read().decode()
+        assert "up 1.0" in body
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,158 @@
+"""Infrastructure: OutboundScheduler（モーダル更新 > 招待 > DM の優先度付き書き込みキュー）"""
+
+import threading
+
+import pytest
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.outbound_scheduler import (
+    INVITES,
+    NOTIFICATIONS,
+    VIEWS,
+    OutboundScheduler,
+)
+
+
+def _scheduler(**kwargs):
+    kwargs.setdefault("registry", MetricsRegistry())
+    return OutboundScheduler(**kwargs)
+
+
+def _block_worker(scheduler):
+    """ワーカーを 1 件の招待で塞ぎ、解放用の Event を返す"""
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    thread = threading.Thread(target=scheduler.call, args=(INVITES, slow))
+    thread.start()
+    assert started.wait(5)
+    return release, thread
+
+
+def _wait_pending(scheduler, **expected):
+    for _ in range(500):
+        pending = scheduler.pending()
+        if all(pending[k] == v for k, v in expected.items()):
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError(scheduler.pending())
+
+
+def test_views_run_before_invites_and_dms_are_last():
+    scheduler = _scheduler(workers=1, notify_delay=0.0)
+    order = []
+    release, blocker = _block_worker(scheduler)
+
+    scheduler.notify("U1", "done", lambda channel, text: order.append(("dm", text)))
+    callers = [
+        threading.Thread(target=scheduler.call, args=(INVITES, order.append, "invite")),
+        threading.Thread(target=scheduler.call, args=(VIEWS, order.append, "view")),
+    ]
+    callers[0].start()
+    _wait_pending(scheduler, invites=1)
+    callers[1].start()
+    _wait_pending(scheduler, views=1, invites=1, notifications=1)
+    release.set()
+    for thread in [blocker, *callers]:
+        thread.join(5)
+    assert scheduler.close(5)
+
+    assert order == ["view", "invite", ("dm", "done")]
+
+
+def test_dms_to_the_same_channel_are_coalesced():
+    registry = MetricsRegistry()
+    scheduler = _scheduler(workers=1, notify_delay=0.0, registry=registry, team="T1")
+    sent = []
+    release, blocker = _block_worker(scheduler)
+
+    def send(channel, text):
+        sent.append((channel, text))
+
+    scheduler.notify("U1", "first", send)
+    scheduler.notify("U2", "other", send)
+    scheduler.notify("U1", "second", send)
+    release.set()
+    blocker.join(5)
+    assert scheduler.close(5)
+
+    assert sent == [("U1", "first\nsecond"), ("U2", "other")]
+    assert 'slack_outbound_coalesced_total{team="T1"} 1.0' in registry.render()
+
+
+def test_full_queue_runs_on_the_callers_thread_and_is_counted():
+    registry = MetricsRegistry()
+    scheduler = _scheduler(max_queue=0, registry=registry, team="T1")
+
+    assert scheduler.call(VIEWS, threading.current_thread) is threading.current_thread()
+    assert 'slack_outbound_backpressure_total{team="T1",priority="views"} 1.0' in registry.render()
+
+
+def test_metrics_of_each_team_scheduler_are_kept_apart():
+    """チームごとのスケジューラーが同じメトリクスを上書きしない"""
+    registry = MetricsRegistry()
+    busy = _scheduler(max_queue=0, registry=registry, team="T1")
+    _scheduler(max_queue=0, registry=registry, team="T2")
+
+    busy.call(VIEWS, lambda: None)
+    busy.call(VIEWS, lambda: None)
+
+    rendered = registry.render()
+    assert 'slack_outbound_backpressure_total{team="T1",priority="views"} 2.0' in rendered
+    assert 'team="T2"' not in rendered
+
+
+def test_call_returns_results_and_reraises_errors():
+    scheduler = _scheduler()
+
+    assert scheduler.call(VIEWS, lambda x: x * 2, 21) == 42
+    with pytest.raises(RuntimeError):
+        scheduler.call(INVITES, lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    with pytest.raises(ValueError):
+        scheduler.call(NOTIFICATIONS, print)
+    scheduler.close(5)
+
+
+def test_close_flushes_deferred_dms_and_failures_are_only_logged(caplog):
+    scheduler = _scheduler(notify_delay=60.0)
+    sent = []
+
+    def failing(channel, text):
+        raise RuntimeError("channel_not_found")
+
+    scheduler.notify("U1", "later", lambda channel, text: sent.append(text))
+    scheduler.notify("U2", "lost", failing)
+
+    assert scheduler.close(5)
+    assert sent == ["later"]
+    assert any(getattr(r, "event", None) == "outbound_notify_failed" for r in caplog.records)
+
+
+def test_writes_run_in_the_callers_context_and_workers_start_on_demand():
+    """呼び出し元の contextvars（現在のスパンなど）を引き継ぎ、ワーカーは必要な分だけ起動"""
+    import contextvars
+
+    var = contextvars.ContextVar("request", default=None)
+    scheduler = _scheduler(workers=4, notify_delay=0.0)
+    seen = []
+
+    var.set("req-1")
+    assert scheduler.call(VIEWS, var.get) == "req-1"
+    scheduler.notify("U1", "done", lambda channel, text: seen.append(var.get()))
+    assert scheduler.close(5)
+
+    assert seen == ["req-1"]
+    assert len(scheduler._threads) == 1
+
+
+def test_from_env_sizes_workers_from_the_admission_per_team_limit():
+    """ワーカー数の既定は 1 チームで同時に動くハンドラー数（流量制御の上限）"""
+    registry = MetricsRegistry()
+    assert OutboundScheduler.from_env({}, registry=registry).workers == 8
+    env = {"ADMISSION_MAX_CONCURRENT": "16", "ADMISSION_MAX_PER_TEAM": "6"}
+    assert OutboundScheduler.from_env(env, registry=registry).workers == 6
+    env["OUTBOUND_WORKERS"] = "3"
+    assert OutboundScheduler.from_env(env, registry=registry).workers == 3
@@ -0,0 +1,116 @@
+"""Infrastructure: オンデマンドプロファイリング（cProfile / tracemalloc）と管理コマンド"""
+
+import os
+from unittest.mock import Mock
+
+from app.infrastructure.profiling import Profiler
+from app.presentation.admin_commands import build_profile_command_handler
+
+
+def _handler(ack, body, context=None):
+    ack()
+    return sum(range(1000))
+
+
+def test_disabled_profiler_passes_through_without_reports(tmp_path):
+    profiler = Profiler(output_dir=str(tmp_path))
+    wrapped = profiler.wrap("my_action", _handler)
+
+    assert wrapped(ack=Mock(), body={}) == sum(range(1000))
+    assert profiler.reports == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_sampled_request_writes_prof_and_summary_with_correlation_id(tmp_path):
+    profiler = Profiler(output_dir=str(tmp_path), sample_rate=1.0, memory=True)
+    wrapped = profiler.wrap("my_action", _handler)
+    ack = Mock()
+
+    assert wrapped(ack=ack, body={}) == sum(range(1000))
+    ack.assert_called_once()
+    assert len(profiler.reports) == 1
+    base = profiler.reports[0]
+    assert os.path.basename(base).split("-")[1] == "my_action"
+    assert os.path.exists(base + ".prof")
+    with open(base + ".txt", encoding="utf-8") as f:
+        summary = f.read()
+    assert "correlation_id=" in summary
+    assert "_handler" in summary
+    assert "# allocations" in summary
+
+
+def test_wrap_preserves_signature_for_bolt_argument_injection():
+    import inspect
+
+    wrapped = Profiler().wrap("x", _handler)
+    assert inspect.getfullargspec(inspect.unwrap(wrapped)).args == ["ack", "body", "context"]
+
+
+def test_handler_exception_still_dumps_report(tmp_path):
+    profiler = Profiler(output_dir=str(tmp_path), sample_rate=1.0)
+
+    def failing(ack):
+        raise RuntimeError("boom")
+
+    wrapped = profiler.wrap("fail", failing)
+    try:
+        wrapped(ack=Mock())
+    except RuntimeError:
+        pass
+    assert len(profiler.reports) == 1
+
+
+def test_admin_command_toggles_profiler_for_admins_only():
+    profiler = Profiler()
+    handler = build_profile_command_handler(profiler, {"UADMIN"})
+
+    ack = Mock()
+    handler(ack=ack, command={"user_id": "UOTHER", "text": "on"})
+    assert not profiler.enabled
+    assert "管理者のみ" in ack.call_args[0][0]
+
+    handler(ack=ack, command={"user_id": "UADMIN", "text": "on 0.25 memory"})
+    assert profiler.sample_rate == 0.25
+    assert profiler.memory is True
+
+    handler(ack=ack, command={"user_id": "UADMIN", "text": "off"})
+    assert not profiler.enabled
+    assert "off" in ack.call_args[0][0]
+
+
+def test_admin_command_replies_with_usage_for_invalid_rate():
+    """率が数値でなければ例外にせず使い方を返す（ack されないと Slack 側でタイムアウト）"""
+    profiler = Profiler()
+    handler = build_profile_command_handler(profiler, {"UADMIN"})
+
+    ack = Mock()
+    handler(ack=ack, command={"user_id": "UADMIN", "text": "on abc"})
+    ack.assert_called_once()
+    assert "使い方" in ack.call_args[0][0]
+    assert not profiler.enabled
+
+
+def test_admin_command_echoes_the_rejected_rate_token():
+    """memory が先に来ても、不正だった語そのものを返す"""
+    profiler = Profiler()
+    handler = build_profile_command_handler(profiler, {"UADMIN"})
+
+    ack = Mock()
+    handler(ack=ack, command={"user_id": "UADMIN", "text": "on memory abc"})
+    assert "`abc`" in ack.call_args[0][0]
+    assert "`memory`" not in ack.call_args[0][0]
+    assert not profiler.enabled
+
+
+def test_admin_command_rejects_toggle_with_multiple_workers():
+    """複数ワーカーでは 1 プロセスにしか効かないため on / off を拒否（status は可）"""
+    profiler = Profiler()
+    handler = build_profile_command_handler(profiler, {"UADMIN"}, workers=4)
+
+    ack = Mock()
+    handler(ack=ack, command={"user_id": "UADMIN", "text": "on 0.5"})
+    assert not profiler.enabled
+    assert "複数ワーカー" in ack.call_args[0][0]
+
+    handler(ack=ack, command={"user_id": "UADMIN", "text": "status"})
+    assert "プロファイル: off" in ack.call_args[0][0]
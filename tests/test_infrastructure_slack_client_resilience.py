@@ -0,0 +1,165 @@
+"""
+振る舞いテスト: SlackClient のリトライ（ジッター付きバックオフ）とサーキットブレーカー
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from app.infrastructure.slack_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitedError,
+    RetryPolicy,
+    SlackClient,
+)
+
+
+class FakeResponse(dict):
+    def __init__(self, error, status_code, headers=None):
+        super().__init__(ok=False, error=error)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _ratelimited(retry_after="1"):
+    return SlackApiError(
+        "ratelimited", FakeResponse("ratelimited", 429, {"Retry-After": retry_after})
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _client(web, **kwargs):
+    clock = FakeClock()
+    kwargs.setdefault("breaker", CircuitBreaker(failure_threshold=5, clock=clock))
+    return SlackClient(web, sleep=clock.sleep, clock=clock, **kwargs), clock
+
+
+def test_lookup_retries_transient_errors_honoring_retry_after():
+    """読み取り: ratelimited は Retry-After 秒待って再試行し、成功を返す"""
+    web = Mock()
+    web.users_lookupByEmail.side_effect = [_ratelimited("2"), {"ok": True, "user": {"id": "U1"}}]
+    sc, clock = _client(web)
+
+    resp = sc.lookup_user_by_email(email="a@example.com")
+
+    assert resp["user"]["id"] == "U1"
+    assert web.users_lookupByEmail.call_count == 2
+    assert clock.now == 2.0
+    assert sc.counters()["retries"] == 1
+
+
+def test_writes_are_not_retried_by_default():
+    """書き込み: 重複作成を避けるため既定ではリトライしない"""
+    web = Mock()
+    web.conversations_create.side_effect = _ratelimited()
+    sc, _ = _client(web)
+
+    with pytest.raises(SlackApiError):
+        sc.create_channel(name="x")
+
+    assert web.conversations_create.call_count == 1
+
+
+def test_non_transient_errors_are_raised_immediately():
+    web = Mock()
+    web.users_lookupByEmail.side_effect = SlackApiError("nf", {"error": "users_not_found"})
+    sc, _ = _client(web)
+
+    with pytest.raises(SlackApiError):
+        sc.lookup_user_by_email(email="a@example.com")
+
+    assert web.users_lookupByEmail.call_count == 1
+    assert sc.counters()["retries"] == 0
+
+
+def test_overall_deadline_stops_retrying():
+    """期限: 待機が deadline を超えるならリトライしない"""
+    web = Mock()
+    web.users_lookupByEmail.side_effect = _ratelimited("30")
+    sc, clock = _client(web, retry_policies={"users_lookupByEmail": RetryPolicy(deadline=5)})
+
+    with pytest.raises(SlackApiError):
+        sc.lookup_user_by_email(email="a@example.com")
+
+    assert web.users_lookupByEmail.call_count == 1
+    assert clock.now == 0
+
+
+def test_breaker_opens_fails_fast_and_recovers_after_reset_timeout():
+    """ブレーカー: 連続失敗で open → 即時失敗、reset_timeout 後の成功で closed"""
+    web = Mock()
+    web.views_update.side_effect = TimeoutError("timed out")
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    sc = SlackClient(web, breaker=breaker, sleep=clock.sleep, clock=clock)
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            sc.update_view(view_id="V1", view={})
+    with pytest.raises(CircuitOpenError):
+        sc.update_view(view_id="V1", view={})
+
+    counters = sc.counters()
+    assert web.views_update.call_count == 2
+    assert counters["breaker_state"] == "open"
+    assert counters["short_circuited"] == 1
+
+    clock.now += 30
+    web.views_update.side_effect = None
+    sc.update_view(view_id="V1", view={})
+    assert sc.counters()["breaker_state"] == "closed"
+
+
+def test_rate_limited_lookup_does_not_open_breaker_for_views():
+    """レート制限はメソッド単位: lookup の 429 が続いても views.* は止めない"""
+    web = Mock()
+    web.users_lookupByEmail.side_effect = _ratelimited("1")
+    web.views_update.return_value = {"ok": True}
+    web.views_open.return_value = {"ok": True}
+    sc, _ = _client(web)
+
+    for _ in range(2):
+        with pytest.raises(SlackApiError):
+            sc.lookup_user_by_email(email="a@example.com")
+
+    sc.update_view(view_id="V1", view={})
+    sc.open_view(trigger_id="T1", view={})
+
+    counters = sc.counters()
+    assert counters["breaker_state"] == "closed"
+    assert counters["rate_limited"] == 6
+    assert web.views_update.call_count == 1
+    assert web.views_open.call_count == 1
+
+
+def test_rate_limited_method_waits_out_retry_after_before_next_call():
+    """Retry-After の間は同じメソッドを呼ばず、待ってから呼ぶ（待てない場合は即時失敗）"""
+    web = Mock()
+    web.conversations_create.side_effect = [_ratelimited("3"), {"ok": True}]
+    sc, clock = _client(web)
+
+    with pytest.raises(SlackApiError):
+        sc.create_channel(name="x")
+    sc.create_channel(name="x")
+
+    assert clock.now == 3.0
+    assert web.conversations_create.call_count == 2
+
+    web.conversations_create.side_effect = _ratelimited("60")
+    with pytest.raises(SlackApiError):
+        sc.create_channel(name="x")
+    with pytest.raises(RateLimitedError):
+        sc.create_channel(name="x")
+    assert web.conversations_create.call_count == 3
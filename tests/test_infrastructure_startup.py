@@ -0,0 +1,76 @@
+"""Infrastructure: 起動時間レポート（-X importtime 解析・フェーズ計測・初回 ack）"""
+
+import subprocess
+import sys
+import time
+from unittest.mock import Mock
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.startup import (
+    StartupReport,
+    format_breakdown,
+    package_breakdown,
+    parse_importtime,
+    process_start_time,
+)
+from app.presentation.instrumentation import HandlerMetrics
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     _io
+import time:      2000 |       2500 |   slack_sdk.web
+import time:       500 |       3000 | slack_sdk
+import time:      1000 |       1000 | app.slack_app
+"""
+
+
+def test_parse_importtime_and_package_breakdown():
+    entries = parse_importtime(SAMPLE)
+    assert [e.module for e in entries] == ["_io", "slack_sdk.web", "slack_sdk", "app.slack_app"]
+    assert entries[1].self_us == 2000 and entries[1].cumulative_us == 2500
+    assert entries[0].depth == 2
+
+    assert package_breakdown(entries) == {"slack_sdk": 2500, "app": 1000, "_io": 100}
+    text = format_breakdown(entries, top=2)
+    assert "total import time: 3.6 ms" in text
+    assert "slack_sdk" in text
+
+
+def test_startup_report_marks_phases_and_exports_gauge():
+    registry = MetricsRegistry()
+    report = StartupReport(registry=registry, started_at=100.0, clock=lambda: 101.5)
+
+    assert report.mark("app_created") == 1.5
+    report.first_ack(103.0)
+    assert report.phases == {"app_created": 1.5, "first_ack": 3.0}
+    assert 'app_startup_seconds{phase="first_ack"} 3.0' in registry.render()
+
+
+def test_process_start_time_is_not_in_the_future():
+    assert process_start_time() <= time.time()
+
+
+def test_first_ack_callback_fires_once():
+    metrics = HandlerMetrics(MetricsRegistry())
+    callback = Mock()
+    metrics.on_first_ack = callback
+
+    def handler(ack, context=None):
+        ack()
+
+    wrapped = metrics.instrument("x", handler)
+    wrapped(ack=Mock(), context={"received_at": time.perf_counter()})
+    wrapped(ack=Mock(), context={"received_at": time.perf_counter()})
+    callback.assert_called_once_with(metrics.first_ack_at)
+
+
+def test_rarely_used_modules_are_not_imported_eagerly():
+    code = (
+        "import sys, app.slack_app; "
+        "print([m for m in ('slack_bolt.adapter.socket_mode', 'cProfile', 'tracemalloc', "
+        "'app.presentation.admin_commands') if m in sys.modules])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "[]"
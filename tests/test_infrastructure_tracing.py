@@ -0,0 +1,75 @@
+"""Infrastructure: Slack API 呼び出しのトレース（スパンツリー・シンク）"""
+
+from unittest.mock import Mock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.slack_client import SlackClient
+from app.infrastructure.tracing import (
+    MetricsSink,
+    RingBufferSink,
+    Tracer,
+    configure_tracing,
+)
+from app.presentation.instrumentation import HandlerMetrics
+
+
+class Resp(dict):
+    def __init__(self, body, headers):
+        super().__init__(body)
+        self.headers = headers
+
+
+def test_handler_root_span_collects_slack_api_child_spans():
+    ring = RingBufferSink()
+    tracer = Tracer([ring])
+    web = Mock()
+    web.conversations_create.return_value = Resp(
+        {"ok": True, "channel": {"id": "C1"}}, {"Content-Length": "120"}
+    )
+    web.conversations_invite.side_effect = SlackApiError(
+        "ratelimited", Resp({"ok": False, "error": "ratelimited"}, {"Retry-After": "3"})
+    )
+    sc = SlackClient(web, tracer=tracer)
+
+    def handler(ack, context=None):
+        ack()
+        sc.create_channel(name="x")
+        sc.invite_users(channel_id="C1", user_ids=["U1"])
+
+    wrapped = HandlerMetrics(MetricsRegistry(), tracer).instrument("confirm_creation", handler)
+    with pytest.raises(SlackApiError):
+        wrapped(ack=Mock(), context={})
+
+    (trace,) = ring.traces()
+    assert trace["name"] == "handler.confirm_creation"
+    create, invite = trace["children"]
+    assert create["attributes"]["method"] == "conversations_create"
+    assert create["attributes"]["response_bytes"] == 120
+    assert invite["attributes"]["error"] == "ratelimited"
+    assert invite["attributes"]["retry-after"] == "3"
+
+
+def test_metrics_sink_records_per_method_timings():
+    reg = MetricsRegistry()
+    tracer = Tracer([MetricsSink(reg)])
+    sc = SlackClient(Mock(), tracer=tracer)
+
+    sc.post_message(channel="U1", text="hi")
+    sc.post_message(channel="U1", text="hi")
+
+    text = reg.render()
+    assert 'slack_api_call_duration_seconds_count{method="chat_postMessage",error=""} 2' in text
+
+
+def test_configure_tracing_replaces_sinks_instead_of_appending():
+    """再設定（テスト・ワーカー再初期化）でスパンが二重に出力されない"""
+    tracer = Tracer()
+    configure_tracing("log,ring:5", tracer)
+    configure_tracing("log,ring:5", tracer)
+    assert [type(s).__name__ for s in tracer.sinks] == ["LoggingSink", "RingBufferSink"]
+
+    configure_tracing(None, tracer)
+    assert tracer.sinks == []
@@ -0,0 +1,124 @@
+"""Presentation: 流量制御（ユーザー別・全体の同時実行数、待ち行列、件数上限）"""
+
+import threading
+from unittest.mock import Mock
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.presentation.admission import AdmissionController
+from app.presentation.error_messages import BUSY_MESSAGE
+
+
+def _controller(**kwargs):
+    return AdmissionController(registry=MetricsRegistry(), **kwargs)
+
+
+def _submission(user_id="U1", emails="a@example.com"):
+    view = {
+        "id": "V0",
+        "state": {"values": {"member_emails_input": {"member_emails": {"value": emails}}}},
+    }
+    return {"type": "view_submission", "user": {"id": user_id}, "view": view}, view
+
+
+def test_acquire_enforces_per_user_and_global_limits():
+    ctl = _controller(max_concurrent=2, max_per_user=1, max_queue=0)
+    assert ctl.acquire("U1") is None
+    assert ctl.acquire("U1") == "queue_full"  # 同一ユーザーの 2 件目
+    assert ctl.acquire("U2") is None
+    assert ctl.acquire("U3") == "queue_full"  # 全体上限
+
+    ctl.release("U1")
+    assert ctl.acquire("U3") is None
+
+
+def test_waiting_request_gets_slot_when_released_or_times_out():
+    ctl = _controller(max_concurrent=1, max_queue=1, queue_timeout=2.0)
+    assert ctl.acquire("U1") is None
+    threading.Timer(0.05, ctl.release, args=("U1",)).start()
+    assert ctl.acquire("U2") is None  # 解放を待って実行
+
+    ctl.queue_timeout = 0.05
+    assert ctl.acquire("U3") == "timeout"
+    assert ctl.queue_wait.count() == 2
+
+
+def test_rejected_submission_is_acked_with_error_modal():
+    ctl = _controller(max_concurrent=1, max_queue=0)
+    handler = Mock()
+    wrapped = ctl.wrap("channel_creation_modal", handler)
+    ctl.acquire("UOTHER")
+
+    body, view = _submission()
+    ack = Mock()
+    wrapped(ack=ack, body=body, view=view)
+
+    handler.assert_not_called()
+    assert ack.call_args.kwargs["response_action"] == "update"
+    assert BUSY_MESSAGE in str(ack.call_args.kwargs["view"])
+    assert ctl.rejected.value("queue_full") == 1
+
+
+def test_rejected_button_action_updates_view_with_error():
+    ctl = _controller(max_per_user=1, max_queue=0)
+    ctl.acquire("U1")
+    handler = Mock()
+    wrapped = ctl.wrap("confirm_creation", handler)
+
+    client, ack = Mock(), Mock()
+    body = {"type": "block_actions", "user": {"id": "U1"}, "view": {"id": "V1"}}
+    wrapped(ack=ack, body=body, client=client)
+
+    handler.assert_not_called()
+    ack.assert_called_once_with()
+    assert client.views_update.call_args.kwargs["view_id"] == "V1"
+
+
+def test_rejected_button_action_survives_view_update_failure():
+    """ack 済みのため、エラー表示の更新に失敗しても例外を上げない"""
+    ctl = _controller(max_per_user=1, max_queue=0)
+    ctl.acquire("U1")
+    wrapped = ctl.wrap("confirm_creation", Mock())
+
+    client, ack = Mock(), Mock()
+    client.views_update.side_effect = RuntimeError("network down")
+    body = {"type": "block_actions", "user": {"id": "U1"}, "view": {"id": "V1"}}
+    wrapped(ack=ack, body=body, client=client)
+
+    ack.assert_called_once_with()
+    client.views_update.assert_called()
+
+
+def test_submission_over_member_limit_gets_inline_error():
+    ctl = _controller(max_members=2)
+    handler = Mock()
+    wrapped = ctl.wrap("channel_creation_modal", handler)
+
+    body, view = _submission(emails="a@example.com\nb@example.com\nc@example.com")
+    ack = Mock()
+    wrapped(ack=ack, body=body, view=view)
+
+    handler.assert_not_called()
+    assert ack.call_args.kwargs["response_action"] == "errors"
+    assert "member_emails_input" in ack.call_args.kwargs["errors"]
+    assert ctl.rejected.value("too_many_members") == 1
+
+
+def test_admitted_handler_runs_and_releases_slot():
+    ctl = _controller(max_concurrent=1, max_per_user=1)
+    handler = Mock(return_value="ok")
+    wrapped = ctl.wrap("channel_creation_modal", handler)
+
+    body, view = _submission()
+    assert wrapped(ack=Mock(), body=body, view=view) == "ok"
+    assert ctl.acquire("U1") is None  # スロットは解放済み
+
+
+def test_per_team_limit_keeps_slots_for_other_teams():
+    ctl = _controller(max_concurrent=3, max_per_team=2, max_per_user=5, max_queue=0)
+    assert ctl.acquire("U1", "BUSY") is None
+    assert ctl.acquire("U2", "BUSY") is None
+    assert ctl.acquire("U3", "BUSY") == "queue_full"  # 混雑チームは自チーム分のみ
+    assert ctl.acquire("U1", "QUIET") is None  # 他チームは影響を受けない
+
+    ctl.release("U1", "BUSY")
+    assert ctl.acquire("U3", "BUSY") is None
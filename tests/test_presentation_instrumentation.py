@@ -0,0 +1,74 @@
+"""Presentation: ハンドラーの ack 遅延・処理時間・結果の計測"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from slack_bolt import App, BoltRequest
+from slack_bolt.authorization import AuthorizeResult
+
+from app.infrastructure.client_registry import SlackClientRegistry
+from app.infrastructure.metrics import MetricsRegistry
+from app.presentation.instrumentation import HandlerMetrics
+
+
+def test_instrument_records_ack_latency_duration_and_outcome():
+    metrics = HandlerMetrics(MetricsRegistry())
+
+    def handler(ack, body, context=None):
+        ack()
+        if body.get("fail"):
+            raise RuntimeError("boom")
+
+    wrapped = metrics.instrument("my_action", handler)
+    ack = Mock()
+    wrapped(ack=ack, body={}, context={"received_at": 0.0})
+    with pytest.raises(RuntimeError):
+        wrapped(ack=ack, body={"fail": True}, context={})
+
+    assert ack.call_count == 2
+    assert metrics.ack_latency.count("my_action") == 2
+    assert metrics.total.value("my_action", "ok") == 1
+    assert metrics.total.value("my_action", "error") == 1
+    assert metrics.duration.count("my_action", "error") == 1
+    assert metrics.first_ack_at is not None
+
+
+def test_create_app_wires_metrics_and_injects_workspace_clients():
+    """Bolt 経由: 計測ミドルウェア＋ DI 済み共有クライアントでショートカットが処理される"""
+    from app.slack_app import create_app
+
+    web = Mock()
+    registry = SlackClientRegistry(
+        web_client_factory=lambda token, template: web, user_resolver_factory=lambda sc: Mock()
+    )
+    metrics = HandlerMetrics(MetricsRegistry())
+
+    def test_app():
+        def authorize(enterprise_id, team_id, logger):
+            return AuthorizeResult(
+                enterprise_id=None, team_id=team_id, bot_token="xoxb-test", bot_user_id="UB"
+            )
+
+        return App(
+            authorize=authorize,
+            signing_secret="secret",
+            request_verification_enabled=False,
+            process_before_response=True,
+        )
+
+    with patch("app.slack_app.App", test_app):
+        app = create_app(registry=registry, metrics=metrics)
+
+    body = {
+        "type": "shortcut",
+        "callback_id": "create_channel_shortcut",
+        "trigger_id": "T123",
+        "team": {"id": "T1"},
+        "user": {"id": "U1"},
+    }
+    resp = app.dispatch(BoltRequest(body=body, mode="socket_mode"))
+
+    assert resp.status == 200
+    web.views_open.assert_called_once()
+    assert metrics.ack_latency.count("create_channel_shortcut") == 1
+    assert metrics.total.value("create_channel_shortcut", "ok") == 1
@@ -0,0 +1,76 @@
+"""Presentation: 停止時のドレイン（受付停止・実行中処理の待機・未完了ビューの更新）"""
+
+import threading
+from unittest.mock import Mock
+
+from app.presentation.error_messages import SHUTDOWN_MESSAGE
+from app.presentation.lifecycle import Lifecycle
+
+CONFIRM_BODY = {"type": "block_actions", "view": {"id": "V1"}, "user": {"id": "U1"}}
+
+
+def _blocking_handler(started, release):
+    def handler(ack, body, client, context=None):
+        ack()
+        started.set()
+        release.wait(5)
+
+    return handler
+
+
+def test_shutdown_waits_for_inflight_handlers_to_finish():
+    lifecycle = Lifecycle()
+    started, release = threading.Event(), threading.Event()
+    wrapped = lifecycle.track("confirm", _blocking_handler(started, release))
+    client = Mock()
+
+    thread = threading.Thread(target=lambda: wrapped(ack=Mock(), body=CONFIRM_BODY, client=client))
+    thread.start()
+    started.wait(5)
+    assert lifecycle.inflight() == 1
+
+    threading.Timer(0.05, release.set).start()
+    assert lifecycle.shutdown(deadline=5) == 0
+    assert not lifecycle.accepting
+    assert lifecycle.inflight() == 0
+    client.views_update.assert_not_called()
+    thread.join()
+
+
+def test_deadline_exceeded_updates_pending_view_with_retryable_error():
+    lifecycle = Lifecycle()
+    started, release = threading.Event(), threading.Event()
+    wrapped = lifecycle.track("confirm", _blocking_handler(started, release))
+    client = Mock()
+
+    thread = threading.Thread(target=lambda: wrapped(ack=Mock(), body=CONFIRM_BODY, client=client))
+    thread.start()
+    started.wait(5)
+
+    assert lifecycle.shutdown(deadline=0.05) == 1
+    client.views_update.assert_called_once()
+    kwargs = client.views_update.call_args.kwargs
+    assert kwargs["view_id"] == "V1"
+    assert SHUTDOWN_MESSAGE in str(kwargs["view"])
+    release.set()
+    thread.join()
+
+
+def test_middleware_rejects_new_interactions_while_draining():
+    lifecycle = Lifecycle()
+    middleware = lifecycle.middleware()
+    ack, next_ = Mock(), Mock()
+
+    middleware(body={"type": "view_submission"}, ack=ack, next=next_)
+    next_.assert_called_once()
+    ack.assert_not_called()
+
+    lifecycle.accepting = False
+    next_.reset_mock()
+    middleware(body={"type": "view_submission"}, ack=ack, next=next_)
+    next_.assert_not_called()
+    assert ack.call_args.kwargs["response_action"] == "update"
+
+    middleware(body={"type": "shortcut"}, ack=ack, next=next_)
+    next_.assert_not_called()
+    assert ack.call_count == 2
@@ -0,0 +1,109 @@
+"""Presentation: private_metadata 退避ストア（メモリ / SQLite バックエンド）"""
+
+import threading
+
+import pytest
+
+from app.presentation import metadata_store
+from app.presentation.metadata_store import MemoryBackend, SqliteBackend
+
+
+@pytest.fixture
+def backend_swap():
+    saved = metadata_store.configure(MemoryBackend())
+    yield
+    metadata_store.configure(saved)
+
+
+def test_store_and_retrieve_roundtrip(backend_swap):
+    token = metadata_store.store({"channel_name": "c", "user_ids": ["U1"]})
+    assert metadata_store.retrieve(token) == {"channel_name": "c", "user_ids": ["U1"]}
+    assert metadata_store.retrieve("unknown") is None
+
+
+def test_memory_backend_expires_and_drops_old_entries_on_put():
+    backend = MemoryBackend(ttl=10)
+    backend.put("T1", "old", {"a": 1}, now=0)
+    backend.put("T1", "mid", {"a": 2}, now=5)
+    assert backend.get("T1", "old", now=11) is None  # 期限切れ
+
+    backend.put("T1", "new", {"a": 3}, now=16)  # 先頭から期限切れを掃除
+    assert len(backend) == 1
+    assert backend.get("T1", "new", now=16) == {"a": 3}
+
+
+def test_memory_backend_is_thread_safe():
+    backend = MemoryBackend()
+
+    def worker(n):
+        for i in range(500):
+            backend.put("T1", f"{n}-{i}", {"i": i}, now=0)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(backend) == 8 * 500
+
+
+def test_sqlite_backend_shared_between_instances_and_threads(tmp_path):
+    path = str(tmp_path / "meta.sqlite3")
+    writer = SqliteBackend(path, ttl=10)
+    reader = SqliteBackend(path, ttl=10)  # 別プロセスのワーカーに相当
+
+    writer.put("T1", "t1", {"channel_name": "c", "user_ids": ["U1", "U2"]}, now=100)
+    assert reader.get("T1", "t1", now=105) == {"channel_name": "c", "user_ids": ["U1", "U2"]}
+    assert reader.get("T2", "t1", now=105) is None  # 他チームからは参照不可
+    assert reader.get("T1", "t1", now=111) is None
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(reader.get("T1", "t1", now=101)))
+    thread.start()
+    thread.join()
+    assert results == [{"channel_name": "c", "user_ids": ["U1", "U2"]}]
+
+
+def test_configure_from_env_selects_sqlite(tmp_path, monkeypatch, backend_swap):
+    monkeypatch.setenv("METADATA_STORE", f"sqlite:{tmp_path / 'm.sqlite3'}")
+    assert isinstance(metadata_store.configure_from_env(), SqliteBackend)
+    token = metadata_store.store({"x": 1})
+    assert metadata_store.retrieve(token) == {"x": 1}
+
+
+def test_tokens_are_isolated_per_team(backend_swap):
+    token = metadata_store.store({"channel_name": "c"}, team_id="T1")
+    assert metadata_store.retrieve(token, team_id="T1") == {"channel_name": "c"}
+    assert metadata_store.retrieve(token, team_id="T2") is None
+    assert metadata_store.retrieve(token) is None
+
+
+def test_busy_team_only_evicts_its_own_entries():
+    backend = MemoryBackend(max_per_team=2)
+    backend.put("QUIET", "q", {"team": "quiet"}, now=0)
+    for i in range(5):
+        backend.put("BUSY", f"b{i}", {"i": i}, now=0)
+
+    assert backend.get("QUIET", "q", now=0) == {"team": "quiet"}
+    assert backend.get("BUSY", "b0", now=0) is None
+    assert backend.get("BUSY", "b4", now=0) == {"i": 4}
+    assert len(backend) == 3
+
+
+def test_store_overwrites_an_existing_token_and_refreshes_its_expiry():
+    """同じトークンへの上書き: エントリは増えず、期限は上書き時点から数える"""
+    backend = MemoryBackend(ttl=10)
+    backend.put("T1", "draft", {"v": 1}, now=0)
+    backend.put("T1", "other", {"v": 0}, now=1)
+    backend.put("T1", "draft", {"v": 2}, now=8)
+
+    backend.put("T1", "new", {"v": 3}, now=12)  # other は期限切れ、上書きした draft は残る
+    assert backend.get("T1", "draft", now=12) == {"v": 2}
+    assert backend.get("T1", "other", now=12) is None
+    assert len(backend) == 2
+
+
+def test_store_with_token_reuses_it(backend_swap):
+    token = metadata_store.store({"v": 1}, team_id="T1")
+    assert metadata_store.store({"v": 2}, team_id="T1", token=token) == token
+    assert metadata_store.retrieve(token, team_id="T1") == {"v": 2}
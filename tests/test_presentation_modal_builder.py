@@ -50,3 +50,101 @@ def test_build_processing_modal_and_success_and_error():
     error = build_error_modal("oops")
     assert "エラー" in error["title"]["text"]
     assert "oops" in str(error["blocks"])
+
+
+def test_build_initial_modal_prefills_previous_input():
+    from app.presentation.modal_builder import build_initial_modal
+
+    view = build_initial_modal(
+        channel_name="test-channel",
+        emails_text="a@example.com\nb@example.com",
+        private_metadata='{"draft": "abc"}',
+    )
+    assert view["blocks"][0]["element"]["initial_value"] == "test-channel"
+    assert view["blocks"][1]["element"]["initial_value"] == "a@example.com\nb@example.com"
+    assert view["private_metadata"] == '{"draft": "abc"}'
+    # 引数なしでは従来どおり空のフォーム
+    assert "initial_value" not in str(build_initial_modal())
+    assert "private_metadata" not in build_initial_modal()
+
+
+def test_build_initial_modal_dispatches_email_input_and_shows_status():
+    from app.presentation.modal_builder import build_initial_modal
+
+    view = build_initial_modal()
+    emails_block = view["blocks"][1]
+    assert emails_block["dispatch_action"] is True
+    assert emails_block["element"]["action_id"] == "member_emails"
+    # 件数表示は検証後のみ
+    assert "member_emails_status" not in [b["block_id"] for b in view["blocks"]]
+
+    view = build_initial_modal(found_count=3, not_found_emails=[f"x{i}@ex.com" for i in range(7)])
+    status = view["blocks"][2]  # メール入力欄の直下
+    assert status["block_id"] == "member_emails_status"
+    assert status["type"] == "context"
+    text = status["elements"][0]["text"]
+    assert "3 件" in text and "7 件" in text
+    assert "x4@ex.com" in text and "x5@ex.com" not in text and "ほか 2 件" in text
+
+
+def test_build_confirmation_modal_shows_one_click_suggestions():
+    import json
+
+    from app.presentation.modal_builder import build_confirmation_modal
+
+    view = build_confirmation_modal(
+        channel_name="test-channel",
+        users=[{"id": "U111", "display_name": "太郎"}],
+        not_found_emails=["hanako.sato@exmaple.com", "nobody@example.com"],
+        private_metadata_json="{}",
+        suggestions={
+            "hanako.sato@exmaple.com": [
+                ("hanako.sato@example.com", "U2", "佐藤花子"),
+                ("hanako.saito@example.com", "U3", "斎藤花子"),
+            ]
+        },
+    )
+
+    actions = [b for b in view["blocks"] if b["type"] == "actions"]
+    assert len(actions) == 2  # 候補ボタン行 + 作成/戻る
+    buttons = actions[0]["elements"]
+    assert [b["action_id"] for b in buttons] == ["apply_suggestion_0", "apply_suggestion_1"]
+    assert json.loads(buttons[0]["value"]) == [
+        "hanako.sato@exmaple.com",
+        "hanako.sato@example.com",
+        "U2",
+        "佐藤花子",
+    ]
+    assert actions[-1]["elements"][0]["action_id"] == "confirm_creation"
+
+
+def test_initial_modal_channel_sources_and_long_user_list_is_truncated():
+    from app.presentation.modal_builder import build_confirmation_modal, build_initial_modal
+
+    view = build_initial_modal(channel_ids=["C1", "C2"])
+    channels = [b for b in view["blocks"] if b["block_id"] == "member_channels_input"][0]
+    assert channels["element"]["type"] == "multi_conversations_select"
+    assert channels["element"]["initial_conversations"] == ["C1", "C2"]
+    assert "initial_conversations" not in str(build_initial_modal())
+
+    users = [{"id": f"U{i}", "display_name": f"user-{i:04d}"} for i in range(1000)]
+    confirmation = build_confirmation_modal("team-x", users, [], "{}", notices=["⚠️ 上限で打ち切り"])
+    text = confirmation["blocks"][1]["text"]["text"]
+    assert len(text) < 3000
+    assert text.endswith("名")
+    assert "上限で打ち切り" in str(confirmation["blocks"][2])
+
+
+def test_confirmation_not_found_list_is_truncated_within_section_limit():
+    """見つからなかったメールが多くても section の 3000 文字上限に収める（…他N件）"""
+    from app.presentation.modal_builder import build_confirmation_modal
+
+    not_found = [f"missing-user-{i:04d}@example.com" for i in range(200)]
+    assert len(", ".join(not_found)) > 3000
+    confirmation = build_confirmation_modal("team-x", [], not_found, "{}")
+    section = [b for b in confirmation["blocks"] if "見つからなかったメール" in str(b)][0]
+    text = section["text"]["text"]
+    assert len(text) < 3000
+    assert "missing-user-0000@example.com" in text
+    shown = text.count("@example.com")
+    assert text.endswith(f"…他{200 - shown}件")
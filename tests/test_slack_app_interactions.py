@@ -570,3 +570,747 @@ def test_cancel_button_updates_modal_back_to_initial():
     assert kwargs["view"]["callback_id"] == "channel_creation_modal"
     client.conversations_create.assert_not_called()
     client.conversations_invite.assert_not_called()
+
+
+def test_handlers_use_injected_workspace_clients():
+    """DI: context に注入された共有 SlackClient を使い、都度生成しない"""
+    from unittest.mock import patch
+
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+    from app.slack_app import handle_modal_submission
+
+    shared_web = Mock()
+    resolver = Mock()
+    resolver.resolve.return_value = ([{"id": "U111", "display_name": "ユーザー1"}], [])
+    ws = WorkspaceClients(shared_web, SlackClient(shared_web), resolver)
+    request_client = Mock()
+    view = {
+        "id": "V1",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {"member_emails": {"value": "user1@example.com"}},
+            }
+        },
+    }
+    body = {"user": {"id": "U123456"}, "trigger_id": "T1"}
+
+    with patch("app.slack_app.SlackClient") as per_request_factory:
+        handle_modal_submission(
+            ack=Mock(),
+            view=view,
+            client=request_client,
+            body=body,
+            context={"workspace_clients": ws},
+        )
+
+    per_request_factory.assert_not_called()
+    resolver.resolve.assert_called_once()
+    shared_web.views_open.assert_called_once()
+    request_client.views_open.assert_not_called()
+
+
+def test_cancel_round_trip_prefills_input_and_resolves_only_changed_addresses():
+    """戻る: 入力値を復元し、再送信では追加・変更されたアドレスだけを問い合わせる"""
+    from app.application.user_resolver_service import UserResolverService
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+    from app.slack_app import handle_cancel_button, handle_modal_submission
+
+    looked_up = []
+
+    class Directory:
+        def lookup_user_by_email(self, email):
+            looked_up.append(email)
+            if email == "nobody@example.com":
+                return {"ok": False, "error": "users_not_found"}
+            return {"ok": True, "user": {"id": "U_" + email[0], "profile": {"display_name": email}}}
+
+    web = Mock()
+    ws = WorkspaceClients(web, SlackClient(web), UserResolverService(Directory()))
+    context = {"workspace_clients": ws}
+
+    def submit(emails_text, private_metadata=None):
+        view = {
+            "id": "V1",
+            "state": {
+                "values": {
+                    "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                    "member_emails_input": {"member_emails": {"value": emails_text}},
+                }
+            },
+        }
+        if private_metadata:
+            view["private_metadata"] = private_metadata
+        handle_modal_submission(
+            ack=Mock(), view=view, client=Mock(), body={"trigger_id": "T"}, context=context
+        )
+        return web.views_open.call_args[1]["view"]
+
+    confirmation = submit("a@example.com\nnobody@example.com")
+    handle_cancel_button(
+        ack=Mock(),
+        action={},
+        body={"view": {"id": "V2", "private_metadata": confirmation["private_metadata"]}},
+        client=Mock(),
+        context=context,
+    )
+    initial = web.views_update.call_args[1]["view"]
+
+    assert initial["callback_id"] == "channel_creation_modal"
+    assert initial["blocks"][0]["element"]["initial_value"] == "test-channel"
+    assert initial["blocks"][1]["element"]["initial_value"] == "a@example.com\nnobody@example.com"
+
+    edited = "a@example.com\nnobody@example.com\nb@example.com"
+    confirmation = submit(edited, initial["private_metadata"])
+
+    assert looked_up == ["a@example.com", "nobody@example.com", "b@example.com"]
+    assert json.loads(confirmation["private_metadata"])["user_ids"] == ["U_a", "U_b"]
+
+
+def test_live_validation_resolves_while_typing_so_submission_needs_no_lookups():
+    """入力中の検証: 追加分だけを解決して件数を表示し、送信時には問い合わせ不要"""
+    from app.application.user_resolver_service import UserResolverService
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+    from app.slack_app import handle_member_emails_input, handle_modal_submission
+
+    looked_up = []
+
+    class Directory:
+        def lookup_user_by_email(self, email):
+            looked_up.append(email)
+            if email == "nobody@example.com":
+                return {"ok": False, "error": "users_not_found"}
+            return {"ok": True, "user": {"id": "U_" + email[0], "profile": {"display_name": email}}}
+
+    web = Mock()
+    ws = WorkspaceClients(web, SlackClient(web), UserResolverService(Directory()))
+    context = {"workspace_clients": ws}
+
+    def type_text(text, private_metadata=None):
+        view = {"id": "V1", "hash": "h1"}
+        if private_metadata:
+            view["private_metadata"] = private_metadata
+        handle_member_emails_input(
+            ack=Mock(),
+            action={"action_id": "member_emails", "value": text},
+            body={"type": "block_actions", "view": view},
+            client=Mock(),
+            context=context,
+        )
+        return web.views_update.call_args[1]
+
+    first = type_text("a@example.com, nobody@example.com,")
+    assert first["hash"] == "h1"
+    assert "見つかったユーザー: 1 件" in str(first["view"]["blocks"][2])
+    second = type_text(
+        "a@example.com, nobody@example.com, b@example.com\n", first["view"]["private_metadata"]
+    )
+    assert "見つかったユーザー: 2 件" in str(second["view"]["blocks"][2])
+    assert looked_up == ["a@example.com", "nobody@example.com", "b@example.com"]
+
+    view = {
+        "id": "V1",
+        "private_metadata": second["view"]["private_metadata"],
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {
+                    "member_emails": {"value": "a@example.com, nobody@example.com, b@example.com"}
+                },
+            }
+        },
+    }
+    handle_modal_submission(
+        ack=Mock(), view=view, client=Mock(), body={"trigger_id": "T"}, context=context
+    )
+
+    assert len(looked_up) == 3  # 送信時の追加問い合わせなし
+    confirmation = web.views_open.call_args[1]["view"]
+    assert json.loads(confirmation["private_metadata"])["user_ids"] == ["U_a", "U_b"]
+
+
+def test_live_validation_ignores_hash_conflict_from_a_newer_update():
+    """入力中の検証: 後続の入力で view が更新済み（hash_conflict）なら何もしない"""
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+    from app.slack_app import handle_member_emails_input
+
+    resolver = Mock()
+    resolver.resolve.return_value = ([], ["x@example.com"])
+    web = Mock()
+    web.views_update.side_effect = SlackApiError(
+        "conflict", {"ok": False, "error": "hash_conflict"}
+    )
+    ws = WorkspaceClients(web, SlackClient(web), resolver)
+    ack = Mock()
+    handle_member_emails_input(
+        ack=ack,
+        action={"value": "x@example.com,"},
+        body={"view": {"id": "V1", "hash": "old"}},
+        client=Mock(),
+        context={"workspace_clients": ws},
+    )
+
+    ack.assert_called_once()
+    web.views_update.assert_called_once()
+
+
+def test_submission_caps_merged_members_at_max_members(monkeypatch):
+    """MAX_MEMBERS はメール・選択・展開を合わせた招待対象に適用し、超えた分があれば通知する"""
+    from unittest.mock import patch
+
+    from app.domain.resolved_user import ResolvedUser
+    from app.slack_app import handle_modal_submission
+
+    monkeypatch.setenv("MAX_MEMBERS", "2")
+    web, ws = _workspace_with_directory()
+    ws.directory.refresh()
+    web.conversations_members.return_value = {
+        "ok": True,
+        "members": ["U111", "U222"],
+        "response_metadata": {"next_cursor": ""},
+    }
+    view = {
+        "id": "V1",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {"member_emails": {"value": "a@example.com"}},
+                "member_channels_input": {"member_channels": {"selected_conversations": ["C1"]}},
+            }
+        },
+    }
+
+    with patch("app.slack_app.resolve_users", return_value=([ResolvedUser("U_a", "a")], [])):
+        handle_modal_submission(
+            ack=Mock(),
+            view=view,
+            client=Mock(),
+            body={"trigger_id": "T"},
+            context={"workspace_clients": ws},
+        )
+
+    confirmation = web.views_open.call_args[1]["view"]
+    assert json.loads(confirmation["private_metadata"])["user_ids"] == ["U_a", "U111"]
+    assert "2 名まで" in str(confirmation["blocks"])
+
+
+def _workspace_with_directory(resolver=None):
+    from app.application.workspace_directory import WorkspaceDirectory
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+
+    web = Mock()
+    web.users_list.return_value = {
+        "ok": True,
+        "members": [
+            {"id": "U111", "profile": {"display_name": "田中", "email": "tanaka@example.com"}},
+            {"id": "U222", "profile": {"display_name": "佐藤", "email": "sato@example.com"}},
+        ],
+        "response_metadata": {"next_cursor": ""},
+    }
+    sc = SlackClient(web)
+    directory = WorkspaceDirectory(sc, spawn=lambda refresh: refresh())
+    return web, WorkspaceClients(web, sc, resolver or Mock(), directory)
+
+
+def test_member_options_are_answered_from_the_local_directory():
+    """メンバー選択欄: 候補は名簿のローカル索引から返し、検索ごとの API 呼び出しはない"""
+    from app.slack_app import handle_member_options
+
+    web, ws = _workspace_with_directory()
+    context = {"workspace_clients": ws}
+
+    for query in ("田", "tana"):
+        ack = Mock()
+        handle_member_options(ack=ack, options={"value": query}, context=context)
+        options = ack.call_args[1]["options"]
+        assert options == [
+            {"text": {"type": "plain_text", "text": "田中 (tanaka@example.com)"}, "value": "U111"}
+        ]
+
+    web.users_list.assert_called_once()  # 名簿の読み込み 1 回のみ
+
+
+def test_picked_members_skip_email_resolution_and_survive_cancel():
+    """メンバー選択のみの送信: メール解決なしでユーザーIDを招待対象にし、「戻る」でも保持"""
+    from unittest.mock import patch
+
+    from app.slack_app import handle_cancel_button, handle_modal_submission
+
+    web, ws = _workspace_with_directory()
+    ws.directory.refresh()
+    view = {
+        "id": "V1",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {"member_emails": {"value": None}},
+                "member_users_input": {
+                    "member_users": {
+                        "selected_options": [
+                            {"text": {"type": "plain_text", "text": "田中 (t@ex)"}, "value": "U111"}
+                        ]
+                    }
+                },
+            }
+        },
+    }
+
+    with patch("app.slack_app.resolve_users") as mock_resolve_users:
+        handle_modal_submission(
+            ack=Mock(),
+            view=view,
+            client=Mock(),
+            body={"trigger_id": "T"},
+            context={"workspace_clients": ws},
+        )
+
+    mock_resolve_users.assert_not_called()
+    confirmation = web.views_open.call_args[1]["view"]
+    assert "田中" in str(confirmation["blocks"])
+    assert json.loads(confirmation["private_metadata"])["user_ids"] == ["U111"]
+
+    handle_cancel_button(
+        ack=Mock(),
+        action={},
+        body={"view": {"id": "V2", "private_metadata": confirmation["private_metadata"]}},
+        client=Mock(),
+        context={"workspace_clients": ws},
+    )
+    initial = web.views_update.call_args[1]["view"]
+    picker = [b for b in initial["blocks"] if b["block_id"] == "member_users_input"][0]
+    assert [o["value"] for o in picker["element"]["initial_options"]] == ["U111"]
+
+
+def test_modal_submission_without_emails_or_members_shows_input_error():
+    """メールアドレスもメンバー選択も空: 入力欄にエラーを返し、モーダルは閉じない"""
+    from app.slack_app import handle_modal_submission
+
+    ack = Mock()
+    client = Mock()
+    view = {
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {"member_emails": {"value": " "}},
+            }
+        }
+    }
+
+    handle_modal_submission(ack=ack, view=view, client=client, body={"trigger_id": "T"})
+
+    assert ack.call_args[1]["response_action"] == "errors"
+    assert "member_emails_input" in ack.call_args[1]["errors"]
+    client.views_open.assert_not_called()
+
+
+def test_suggestion_button_replaces_not_found_email_in_confirmation():
+    """もしかして: 候補ボタンで見つからないメールを置き換え、再送信なしで確認画面を更新"""
+    from app.application.user_resolver_service import UserResolverService
+    from app.slack_app import handle_apply_suggestion, handle_modal_submission
+
+    class Directory:
+        def lookup_user_by_email(self, email):
+            if email == "tanaka@example.com":
+                return {"ok": True, "user": {"id": "U111", "profile": {"display_name": "田中"}}}
+            return {"ok": False, "error": "users_not_found"}
+
+    web, ws = _workspace_with_directory(UserResolverService(Directory()))
+    ws.directory.refresh()
+    context = {"workspace_clients": ws}
+    view = {
+        "id": "V1",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {
+                    "member_emails": {"value": "tanaka@example.com\nsatou@example.com"}
+                },
+            }
+        },
+    }
+    handle_modal_submission(
+        ack=Mock(), view=view, client=Mock(), body={"trigger_id": "T"}, context=context
+    )
+    confirmation = web.views_open.call_args[1]["view"]
+    button = [b for b in confirmation["blocks"] if b["type"] == "actions"][0]["elements"][0]
+    assert "sato@example.com" in button["text"]["text"]
+
+    handle_apply_suggestion(
+        ack=Mock(),
+        action=button,
+        body={
+            "type": "block_actions",
+            "view": {"id": "V2", "hash": "h", "private_metadata": confirmation["private_metadata"]},
+        },
+        client=Mock(),
+        context=context,
+    )
+
+    updated = web.views_update.call_args[1]
+    assert updated["hash"] == "h"
+    metadata = json.loads(updated["view"]["private_metadata"])
+    assert metadata["user_ids"] == ["U111", "U222"]
+    assert metadata["not_found"] == []
+    assert metadata["emails_text"] == "tanaka@example.com\nsato@example.com"
+    blocks_text = str(updated["view"]["blocks"])
+    assert "佐藤" in blocks_text and "見つからなかったメール" not in blocks_text
+
+
+def test_usergroup_and_channel_sources_expand_into_members():
+    """@ユーザーグループと既存チャンネル: メンバーに展開して重複なく招待し、「戻る」で選択を復元"""
+    from unittest.mock import patch
+
+    from app.slack_app import handle_cancel_button, handle_modal_submission
+
+    web, ws = _workspace_with_directory()
+    ws.directory.refresh()
+    web.usergroups_list.return_value = {"ok": True, "usergroups": [{"id": "S1", "handle": "dev"}]}
+    web.usergroups_users_list.return_value = {"ok": True, "users": ["U111"]}
+    web.conversations_members.return_value = {
+        "ok": True,
+        "members": ["U111", "U222", "B999"],
+        "response_metadata": {"next_cursor": ""},
+    }
+    view = {
+        "id": "V1",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "test-channel"}},
+                "member_emails_input": {"member_emails": {"value": "@dev\n@unknown"}},
+                "member_channels_input": {"member_channels": {"selected_conversations": ["C1"]}},
+            }
+        },
+    }
+
+    with patch("app.slack_app.resolve_users") as mock_resolve_users:
+        handle_modal_submission(
+            ack=Mock(),
+            view=view,
+            client=Mock(),
+            body={"trigger_id": "T"},
+            context={"workspace_clients": ws},
+        )
+
+    mock_resolve_users.assert_not_called()  # メールアドレスがなければ解決しない
+    confirmation = web.views_open.call_args[1]["view"]
+    metadata = json.loads(confirmation["private_metadata"])
+    assert metadata["user_ids"] == ["U111", "U222"]  # 重複・名簿にないボットは除外
+    assert "佐藤" in str(confirmation["blocks"])
+    assert "@unknown" in str(confirmation["blocks"])
+
+    handle_cancel_button(
+        ack=Mock(),
+        action={},
+        body={"view": {"id": "V2", "private_metadata": confirmation["private_metadata"]}},
+        client=Mock(),
+        context={"workspace_clients": ws},
+    )
+    initial = web.views_update.call_args[1]["view"]
+    channels = [b for b in initial["blocks"] if b["block_id"] == "member_channels_input"][0]
+    assert channels["element"]["initial_conversations"] == ["C1"]
+
+
+def test_confirmation_with_outbound_scheduler_defers_the_dm_after_view_updates():
+    """書き込みスケジューラー注入時: 作成中→招待→完了表示を優先し、完了 DM は後から送る"""
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.metrics import MetricsRegistry
+    from app.infrastructure.outbound_scheduler import OutboundScheduler
+    from app.infrastructure.slack_client import SlackClient
+    from app.slack_app import handle_confirmation_button
+
+    calls = []
+    web = Mock()
+    web.views_update.side_effect = lambda **kw: calls.append("views_update")
+    web.conversations_create.side_effect = lambda **kw: (
+        calls.append("create") or {"channel": {"id": "C1"}}
+    )
+    web.conversations_invite.side_effect = lambda **kw: calls.append("invite")
+    web.chat_postMessage.side_effect = lambda **kw: calls.append("dm")
+    outbound = OutboundScheduler(notify_delay=60.0, registry=MetricsRegistry())
+    ws = WorkspaceClients(web, SlackClient(web), Mock(), outbound=outbound)
+
+    handle_confirmation_button(
+        ack=Mock(),
+        action={},
+        body={
+            "user": {"id": "U123"},
+            "view": {"id": "V1", "private_metadata": '{"channel_name": "c", "user_ids": ["U1"]}'},
+        },
+        client=Mock(),
+        context={"workspace_clients": ws},
+    )
+
+    assert calls == ["views_update", "create", "invite", "views_update"]  # DM は保留中
+    assert outbound.close(5)
+    assert calls[-1] == "dm"
+    assert web.chat_postMessage.call_args[1]["channel"] == "U123"
+
+
+def test_confirmation_span_tree_is_kept_with_outbound_scheduler():
+    """書き込みスケジューラー経由でも Slack API スパンは操作のトレースの子になる"""
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.metrics import MetricsRegistry
+    from app.infrastructure.outbound_scheduler import OutboundScheduler
+    from app.infrastructure.slack_client import SlackClient
+    from app.infrastructure.tracing import RingBufferSink, Tracer
+    from app.presentation.instrumentation import HandlerMetrics
+    from app.slack_app import handle_confirmation_button
+
+    ring = RingBufferSink()
+    tracer = Tracer([ring])
+    web = Mock()
+    web.conversations_create.return_value = {"channel": {"id": "C1"}}
+    outbound = OutboundScheduler(notify_delay=60.0, registry=MetricsRegistry())
+    ws = WorkspaceClients(web, SlackClient(web, tracer=tracer), Mock(), outbound=outbound)
+    handler = HandlerMetrics(MetricsRegistry(), tracer).instrument(
+        "confirm_creation", handle_confirmation_button
+    )
+
+    handler(
+        ack=Mock(),
+        action={},
+        body={
+            "user": {"id": "U123"},
+            "view": {"id": "V1", "private_metadata": '{"channel_name": "c", "user_ids": ["U1"]}'},
+        },
+        client=Mock(),
+        context={"workspace_clients": ws},
+    )
+    assert outbound.close(5)
+
+    (trace,) = ring.traces()  # 書き込みごとに別のルートトレースにならない
+    assert trace["name"] == "handler.confirm_creation"
+    assert [c["attributes"]["method"] for c in trace["children"]] == [
+        "views_update",
+        "conversations_create",
+        "conversations_invite",
+        "views_update",
+    ]
+
+
+def test_every_handler_view_write_goes_through_the_outbound_scheduler():
+    """モーダルの表示・更新はすべて VIEWS 優先度でスケジューラーを経由する"""
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.outbound_scheduler import VIEWS
+    from app.infrastructure.slack_client import SlackClient
+    from app.slack_app import (
+        handle_apply_suggestion,
+        handle_cancel_button,
+        handle_member_emails_input,
+        handle_shortcut,
+    )
+
+    web = Mock()
+    resolver = Mock()
+    resolver.resolve.return_value = ([], ["x@example.com"])
+    outbound = Mock()
+    outbound.call.side_effect = lambda priority, fn, *args, **kwargs: fn(*args, **kwargs)
+    ws = WorkspaceClients(web, SlackClient(web), resolver, outbound=outbound)
+    context = {"workspace_clients": ws}
+    metadata = json.dumps({"channel_name": "c", "user_ids": ["U1"], "not_found": ["x@ex.com"]})
+
+    handle_shortcut(ack=Mock(), shortcut={"trigger_id": "T"}, client=Mock(), context=context)
+    handle_cancel_button(
+        ack=Mock(),
+        action={},
+        body={"view": {"id": "V1", "private_metadata": metadata}},
+        client=Mock(),
+        context=context,
+    )
+    handle_apply_suggestion(
+        ack=Mock(),
+        action={"value": json.dumps(["x@ex.com", "x@example.com", "U2", "x"])},
+        body={"view": {"id": "V1", "private_metadata": metadata}},
+        client=Mock(),
+        context=context,
+    )
+    handle_member_emails_input(
+        ack=Mock(),
+        action={"value": "x@example.com,"},
+        body={"view": {"id": "V1"}},
+        client=Mock(),
+        context=context,
+    )
+
+    assert [c.args[0] for c in outbound.call.call_args_list] == [VIEWS] * 4
+    assert web.views_open.call_count == 1
+    assert web.views_update.call_count == 3
+
+
+def test_confirmation_records_an_audit_entry_for_success_and_failure():
+    """監査ログ: 作成者・チャンネル・招待したユーザー・見つからなかったメール・所要時間を記録"""
+    from unittest.mock import patch
+
+    from app.slack_app import handle_confirmation_button
+
+    client = Mock()
+    client.conversations_create.return_value = {"channel": {"id": "C1"}}
+    metadata = {"channel_name": "team-x", "user_ids": ["U1"], "not_found": ["x@example.com"]}
+    body = {"user": {"id": "U9"}, "view": {"id": "V1", "private_metadata": json.dumps(metadata)}}
+
+    with patch("app.slack_app.audit_log.record") as record:
+        handle_confirmation_button(ack=Mock(), action={}, body=body, client=client)
+        client.conversations_create.side_effect = SlackApiError(
+            "name_taken", {"ok": False, "error": "name_taken"}
+        )
+        handle_confirmation_button(ack=Mock(), action={}, body=body, client=client)
+
+    created, failed = [c.args[0] for c in record.call_args_list]
+    assert created["requester"] == "U9"
+    assert created["channel_id"] == "C1"
+    assert created["channel_name"] == "team-x"
+    assert created["invited_user_ids"] == ["U1", "U9"]
+    assert created["not_found_emails"] == ["x@example.com"]
+    assert set(created["timings"]) == {"total_ms", "create_invite_ms"}
+    assert failed["event"] == "channel_create_failed"
+    assert failed["error"] == "name_taken"
+    assert failed["invited_user_ids"] == []
+
+
+def test_view_update_failures_do_not_escape_the_handlers():
+    """モーダル更新の失敗（ブレーカー open など）でも例外を漏らさず、作成処理は続ける"""
+    from unittest.mock import patch
+
+    from app.infrastructure.slack_client import CircuitOpenError
+    from app.slack_app import handle_confirmation_button, handle_modal_submission
+    from app.user_resolver import AllUsersNotFoundError
+
+    client = Mock()
+    client.views_update.side_effect = CircuitOpenError("open")
+    view = {
+        "id": "V1",
+        "state": {
+            "values": {
+                "channel_name_input": {"channel_name": {"value": "c"}},
+                "member_emails_input": {"member_emails": {"value": "x@example.com"}},
+            }
+        },
+    }
+    with patch("app.slack_app.resolve_users", side_effect=AllUsersNotFoundError("none")):
+        handle_modal_submission(ack=Mock(), view=view, client=client, body={"trigger_id": "T"})
+    client.views_update.assert_called_once()
+
+    client.conversations_create.return_value = {"channel": {"id": "C1"}}
+    body = {"user": {"id": "U9"}, "view": {"id": "V1", "private_metadata": '{"channel_name": "c"}'}}
+    handle_confirmation_button(ack=Mock(), action={}, body=body, client=client)
+    client.conversations_create.assert_called_once()
+
+
+def test_live_validation_skips_the_entry_being_typed_and_reuses_the_draft_token():
+    """入力中の検証: 末尾の入力途中の項目は問い合わせず、draft は同じキーに上書きする"""
+    from app.application.user_resolver_service import UserResolverService
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+    from app.presentation import metadata_store
+    from app.slack_app import handle_member_emails_input
+
+    looked_up = []
+
+    class Directory:
+        def lookup_user_by_email(self, email):
+            looked_up.append(email)
+            return {"ok": True, "user": {"id": "U_" + email[0], "profile": {"display_name": email}}}
+
+    web = Mock()
+    ws = WorkspaceClients(web, SlackClient(web), UserResolverService(Directory()))
+    backend = metadata_store.MemoryBackend()
+    previous = metadata_store.configure(backend)
+    try:
+        private_metadata = None
+        for text in ["a@example.com, taro@example.co", "a@example.com, taro@example.com"]:
+            view = {"id": "V1", "hash": "h"}
+            if private_metadata:
+                view["private_metadata"] = private_metadata
+            handle_member_emails_input(
+                ack=Mock(),
+                action={"value": text},
+                body={"view": view},
+                client=Mock(),
+                context={"workspace_clients": ws},
+            )
+            private_metadata = web.views_update.call_args[1]["view"]["private_metadata"]
+    finally:
+        metadata_store.configure(previous)
+
+    assert looked_up == ["a@example.com"]
+    assert len(backend) == 1
+
+
+def test_live_validation_sends_no_update_while_typing_inside_one_entry():
+    """入力中の検証: 区切りまでの内容が変わらない打鍵では保存も views.update もしない
+    （views.update のレート制限枠を「確認する」と共有するため）"""
+    from app.application.user_resolver_service import UserResolverService
+    from app.infrastructure.client_registry import WorkspaceClients
+    from app.infrastructure.slack_client import SlackClient
+    from app.presentation import metadata_store
+    from app.slack_app import handle_member_emails_input
+
+    looked_up = []
+
+    class Directory:
+        def lookup_user_by_email(self, email):
+            looked_up.append(email)
+            return {"ok": True, "user": {"id": "U_" + email[0], "profile": {"display_name": email}}}
+
+    web = Mock()
+    ws = WorkspaceClients(web, SlackClient(web), UserResolverService(Directory()))
+    previous = metadata_store.configure(metadata_store.MemoryBackend())
+    try:
+        view = {"id": "V1", "hash": "h"}
+        for typed in ("t", "ta", "tar", "taro", "taro@"):
+            ack = Mock()
+            handle_member_emails_input(
+                ack=ack,
+                action={"value": "a@example.com, " + typed},
+                body={"view": view},
+                client=Mock(),
+                context={"workspace_clients": ws},
+            )
+            ack.assert_called_once()
+            if web.views_update.called:
+                view = dict(view, **web.views_update.call_args[1]["view"])
+    finally:
+        metadata_store.configure(previous)
+
+    assert looked_up == ["a@example.com"]
+    assert web.views_update.call_count == 1
+
+
+def test_audit_keeps_created_channel_when_a_later_step_fails():
+    """監査ログ: 作成・招待の後で表示更新が失敗しても channel_created を記録。
+    招待で失敗した場合は作成済みのチャンネル ID と招待済みのユーザーを残す"""
+    from unittest.mock import patch
+
+    from app.slack_app import handle_confirmation_button
+
+    metadata = {"channel_name": "team-x", "user_ids": ["U2"]}
+    body = {"user": {"id": "U1"}, "view": {"id": "V1", "private_metadata": json.dumps(metadata)}}
+
+    client = Mock()
+    client.conversations_create.return_value = {"channel": {"id": "C1"}}
+    client.views_update.side_effect = [None, TimeoutError("timed out")]  # 作成中 → 成功表示で失敗
+    with patch("app.slack_app.audit_log.record") as record:
+        handle_confirmation_button(ack=Mock(), action={}, body=body, client=client)
+    (entry,) = [c.args[0] for c in record.call_args_list]
+    assert client.conversations_invite.call_args[1]["users"] == "U2,U1"
+    assert entry["event"] == "channel_created"
+    assert entry["channel_id"] == "C1"
+    assert entry["invited_user_ids"] == ["U2", "U1"]
+
+    client = Mock()
+    client.conversations_create.return_value = {"channel": {"id": "C2"}}
+    client.conversations_invite.side_effect = SlackApiError(
+        "invite", {"ok": False, "error": "cant_invite"}
+    )
+    with patch("app.slack_app.audit_log.record") as record:
+        handle_confirmation_button(ack=Mock(), action={}, body=body, client=client)
+    (entry,) = [c.args[0] for c in record.call_args_list]
+    assert entry["event"] == "channel_invite_failed"
+    assert entry["channel_id"] == "C2"
+    assert entry["invited_user_ids"] == []
+    assert entry["error"] == "cant_invite"